@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Time spent collecting and translating a search page of datasets with 50
+resources each, with and without ``include_resources``.
+
+Run from the repository root::
+
+    python benchmarks/resource_translation.py
+"""
+
+import argparse
+import copy
+import json
+import timeit
+
+from ckanext.gdi_userportal.logic.action.translation_utils import (
+    collect_values_to_translate,
+    replace_package,
+)
+
+EU = "http://publications.europa.eu/resource/authority"
+IANA = "https://www.iana.org/assignments/media-types"
+
+
+def _resource(index):
+    return {
+        "id": f"resource-{index}",
+        "name": f"Resource {index}",
+        "name_translated": {"en": f"Resource {index}", "nl": f"Bron {index}"},
+        "format": f"{EU}/file-type/{('CSV', 'JSON', 'PDF', 'XML')[index % 4]}",
+        "mimetype": f"{IANA}/application/{('csv', 'json', 'pdf', 'xml')[index % 4]}",
+        "compress_format": f"{IANA}/application/gzip",
+        "license": f"{EU}/licence/CC_BY_4_0",
+        "access_rights": f"{EU}/access-right/RESTRICTED",
+        "language": [f"{EU}/language/ENG", f"{EU}/language/NLD"],
+        "conforms_to": [f"http://example.com/standard/{index % 5}"],
+        "status": f"{EU}/distribution-status/COMPLETED",
+        "rights": {"en": "Rights", "nl": "Rechten"},
+        "access_services": [
+            {
+                "title": f"Service {index}",
+                "access_rights": f"{EU}/access-right/RESTRICTED",
+                "conforms_to": ["http://example.com/standard/api"],
+                "format": [f"{EU}/file-type/JSON"],
+                "license": f"{EU}/licence/CC_BY_4_0",
+                "theme": [f"{EU}/data-theme/HEAL"],
+            }
+        ],
+    }
+
+
+def _dataset(index, resources):
+    return {
+        "name": f"dataset-{index}",
+        "title": f"Dataset {index}",
+        "title_translated": {"en": f"Dataset {index}", "nl": f"Dataset {index} (nl)"},
+        "notes_translated": {"en": "Notes", "nl": "Toelichting"},
+        "theme": [f"{EU}/data-theme/HEAL", f"{EU}/data-theme/TECH"],
+        "language": [f"{EU}/language/ENG"],
+        "access_rights": f"{EU}/access-right/RESTRICTED",
+        "frequency": f"{EU}/frequency/ANNUAL",
+        "publisher": [{"name": "Publisher", "type": "http://purl.org/adms/publishertype/Company"}],
+        "health_category": ["http://example.com/health-category/GENOMIC"],
+        "tags": ["genomics", "cancer"],
+        "resources": [_resource(resource) for resource in range(resources)],
+    }
+
+
+def _translate_page(page, include_resources):
+    values = collect_values_to_translate(page, include_resources=include_resources)
+    translations = {value: f"{value} (nl)" for value in values if isinstance(value, str)}
+    return [
+        replace_package(package, translations, lang="nl", include_resources=include_resources)
+        for package in page
+    ]
+
+
+def _search_page(page, include_resources):
+    # enhanced_package_search drops resources before translating.
+    copied = copy.deepcopy(page)
+    if not include_resources:
+        for package in copied:
+            package.pop("resources")
+    return copied
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--resources", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    page = [_dataset(index, args.resources) for index in range(args.rows)]
+
+    print(f"{args.rows} datasets x {args.resources} resources")
+    print(f"{'include_resources':<20}{'per page':>12}{'per dataset':>14}{'payload':>12}")
+    for include_resources in (True, False):
+        pages = [_search_page(page, include_resources) for _ in range(args.repeat)]
+        seconds = min(
+            timeit.repeat(
+                lambda: _translate_page(pages.pop(), include_resources),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        translated = _translate_page(_search_page(page, include_resources), include_resources)
+        payload = len(json.dumps(translated))
+        print(
+            f"{str(include_resources):<20}{seconds * 1000:>10.1f}ms"
+            f"{seconds / args.rows * 1e6:>12.0f}us{payload / 1024:>10.0f}KB"
+        )
+
+
+if __name__ == "__main__":
+    main()
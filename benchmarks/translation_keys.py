@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Memory and lookup latency of ``PrefixKeyStore`` against a plain dict, using the
+translation CSVs shipped with the term translation migrations.
+
+Two tables are measured: the resolved ``term -> translation`` mapping the
+snapshot serves ``get_translations`` from, and the full
+``term -> {lang_code: translation}`` snapshot table.
+
+Run from the repository root::
+
+    python benchmarks/translation_keys.py
+"""
+
+import argparse
+import csv
+import gc
+import glob
+import os
+import random
+import timeit
+import tracemalloc
+from types import MappingProxyType
+
+from ckanext.gdi_userportal.logic.action.translation_cache import PrefixKeyStore
+
+VERSIONS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "ckanext",
+    "gdi_userportal",
+    "migrations",
+    "versions",
+)
+
+
+def _load_rows():
+    rows = []
+    for path in sorted(glob.glob(os.path.join(VERSIONS_DIR, "*.csv"))):
+        with open(path, newline="", encoding="utf-8") as f:
+            rows.extend(csv.DictReader(f))
+    return rows
+
+
+def _tables(rows):
+    by_term = {}
+    for row in rows:
+        by_term.setdefault(row["term"], {})[row["lang_code"]] = row["term_translation"]
+    resolved = {
+        term: by_lang.get("en", next(iter(by_lang.values())))
+        for term, by_lang in by_term.items()
+    }
+    full = {term: MappingProxyType(by_lang) for term, by_lang in by_term.items()}
+    return resolved, full
+
+
+def _retained(build):
+    gc.collect()
+    tracemalloc.start()
+    structure = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return structure, size
+
+
+def _fresh(value):
+    return "".join(list(value))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--lookups", type=int, default=200000)
+    args = parser.parse_args()
+
+    rows = _load_rows()
+    resolved, full = _tables(rows)
+    terms = list(resolved)
+    # Probe with fresh string objects, as package dicts decoded from Solr are,
+    # so cached string hashes do not flatter either side. A tenth are misses.
+    rng = random.Random(0)
+    probes = [_fresh(rng.choice(terms)) for _ in range(args.lookups)]
+    probes[::10] = [f"{probe}-missing" for probe in probes[::10]]
+
+    print(f"{len(rows)} rows, {len(terms)} distinct terms")
+    print(
+        f"{'table':<10}{'store':<16}{'memory':>10}{'lookup':>12}"
+    )
+    for name, table in (("resolved", resolved), ("full", full)):
+        for label, factory in (("dict", dict), ("PrefixKeyStore", PrefixKeyStore)):
+            # Keys are copied inside the measurement, so each store is charged
+            # for the key strings it keeps, as when loading from the database.
+            store, size = _retained(
+                lambda: factory((_fresh(term), value) for term, value in table.items())
+            )
+            seconds = min(
+                timeit.repeat(
+                    lambda: [store.get(probe) for probe in probes], number=1, repeat=5
+                )
+            )
+            print(
+                f"{name:<10}{label:<16}{size / 1024:>8.0f}KB"
+                f"{seconds / len(probes) * 1e9:>10.0f}ns"
+            )
+            del store
+
+
+if __name__ == "__main__":
+    main()
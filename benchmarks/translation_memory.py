@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Memory held by the translation snapshot, the translation caches and the
+translated Solr search fields for a 10k-term vocabulary, with and without
+interning of vocabulary strings.
+
+Every database row and every package dict carries its own copy of a term, so
+a vocabulary translated into two languages arrives with two copies of each
+URI, and every refetch or indexed dataset brings new ones. The benchmark
+mimics that by building fresh string objects per row, request and dataset,
+then reports the memory still referenced once the inputs are gone. Indexed
+datasets draw their terms from the ``--popular`` most used ones, as real
+catalogues reuse a few hundred themes, formats and coding systems.
+
+Run from the repository root::
+
+    python benchmarks/translation_memory.py
+"""
+
+import argparse
+import gc
+import tracemalloc
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from ckanext.gdi_userportal import plugin
+from ckanext.gdi_userportal.logic.action import translation_cache
+from ckanext.gdi_userportal.logic.action.translation_cache import (
+    TTLCache,
+    TranslationCache,
+    TranslationSnapshot,
+)
+
+PREFIXES = (
+    "http://publications.europa.eu/resource/authority/data-theme/",
+    "http://publications.europa.eu/resource/authority/file-type/",
+    "http://publications.europa.eu/resource/authority/language/",
+    "https://www.iana.org/assignments/media-types/application/",
+)
+LANG_CODES = ("en", "nl")
+
+
+def _terms(count):
+    return [f"{PREFIXES[i % len(PREFIXES)]}TERM_{i:05d}" for i in range(count)]
+
+
+def _fresh(value):
+    # Equal to value but a distinct object, like a string decoded from a DB row.
+    return "".join(list(value))
+
+
+def _rows(terms):
+    return [
+        {
+            "term": _fresh(term),
+            "term_translation": _fresh(f"{term.rsplit('/', 1)[-1]} ({lang_code})"),
+            "lang_code": lang_code,
+        }
+        for term in terms
+        for lang_code in LANG_CODES
+    ]
+
+
+def _fetcher(terms, lang_codes):
+    return {
+        (row["term"], row["lang_code"]): row["term_translation"]
+        for row in _rows(terms)
+        if row["lang_code"] in lang_codes
+    }
+
+
+@contextmanager
+def _interning(enabled):
+    if enabled:
+        yield
+        return
+    with patch.object(translation_cache, "intern_term", lambda value: value), patch.object(
+        plugin, "intern_term", lambda value: value
+    ):
+        yield
+
+
+def _retained(build):
+    gc.collect()
+    tracemalloc.start()
+    structure = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return size
+
+
+def _snapshot(terms):
+    return TranslationSnapshot.from_rows(_rows(terms))
+
+
+def _cache(terms, requests):
+    cache = TranslationCache(
+        TTLCache(max_size=len(terms) * len(LANG_CODES), ttl=3600),
+        untranslated=TTLCache(max_size=len(terms) * len(LANG_CODES), ttl=600),
+    )
+    page = 100
+    for request in range(requests):
+        for start in range(0, len(terms), page):
+            # Every request sends its own copies of the terms, as package
+            # dicts decoded from Solr do.
+            batch = [_fresh(term) for term in terms[start:start + page]]
+            cache.lookup(batch, LANG_CODES, _fetcher)
+        if request == 0:
+            # Expire everything so the next request refetches.
+            cache.clear()
+    return cache
+
+
+def _search_fields(terms, datasets, popular):
+    translations = {term: [f"{term} (en)", f"{term} (nl)"] for term in terms}
+    portal = plugin.GdiUserPortalPlugin()
+    batch = []
+    with patch.object(
+        plugin,
+        "get_all_translations",
+        lambda values: {value: translations[value] for value in values},
+    ):
+        for index in range(datasets):
+            data_dict = {
+                "coding_system": [
+                    _fresh(terms[(index * 7 + offset) % popular]) for offset in range(5)
+                ]
+            }
+            data_dict = portal._add_translated_search_fields(data_dict)
+            # Only the generated fields are kept, like a reindex batch waiting
+            # to be sent to Solr.
+            batch.append(data_dict["vocab_coding_system_search"])
+    return batch
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--terms", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=2)
+    parser.add_argument("--datasets", type=int, default=5000)
+    parser.add_argument(
+        "--popular",
+        type=int,
+        default=500,
+        help="Number of distinct terms the indexed datasets draw from",
+    )
+    args = parser.parse_args()
+
+    terms = _terms(args.terms)
+    cases = (
+        ("TranslationSnapshot", lambda: _snapshot(terms)),
+        ("TranslationCache", lambda: _cache(terms, args.requests)),
+        ("Solr search fields", lambda: _search_fields(terms, args.datasets, args.popular)),
+    )
+
+    print(f"{args.terms} terms x {len(LANG_CODES)} languages")
+    print(f"{'structure':<22}{'plain':>12}{'interned':>12}{'saved':>9}")
+    for name, build in cases:
+        with _interning(False):
+            plain = _retained(build)
+        with _interning(True):
+            interned = _retained(build)
+        saved = 100 * (plain - interned) / plain if plain else 0
+        print(
+            f"{name:<22}{plain / 1024:>10.0f}KB{interned / 1024:>10.0f}KB{saved:>8.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
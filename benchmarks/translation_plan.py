@@ -0,0 +1,254 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Collection and replacement time for a 200-field HealthDCAT-AP package with
+the compiled translation plan and a single staged walk, copying nested values
+or writing them in place, against the generic two walks that looked fields
+up in NESTED_FIELD_TRANSLATIONS at every level.
+
+Run from the repository root::
+
+    python benchmarks/translation_plan.py
+"""
+
+import argparse
+import copy
+import timeit
+
+from ckanext.gdi_userportal.logic.action import translation_utils
+from ckanext.gdi_userportal.logic.action.translation_utils import (
+    ACCESS_SERVICES_REPLACE_FIELDS,
+    NESTED_FIELD_TRANSLATIONS,
+    PACKAGE_REPLACE_FIELDS,
+    RESOURCE_REPLACE_FIELDS,
+    PackageTranslation,
+    ValueLabel,
+)
+
+EU = "http://publications.europa.eu/resource/authority"
+
+
+def _agent(index):
+    return {
+        "name": f"Agent {index}",
+        "type": f"http://purl.org/adms/publishertype/{('Company', 'Academia')[index % 2]}",
+        "publisher_type": "http://purl.org/adms/publishertype/Company",
+        "email": f"agent{index}@example.com",
+    }
+
+
+def _package(total_fields, resources):
+    package = {
+        "theme": [f"{EU}/data-theme/HEAL", f"{EU}/data-theme/TECH"],
+        "language": [f"{EU}/language/ENG", f"{EU}/language/NLD"],
+        "access_rights": f"{EU}/access-right/RESTRICTED",
+        "frequency": f"{EU}/frequency/ANNUAL",
+        "status": f"{EU}/dataset-status/COMPLETED",
+        "health_category": [f"http://example.com/health-category/{code}" for code in "ABCDE"],
+        "health_theme": [f"http://example.com/health-theme/{index}" for index in range(5)],
+        "legal_basis": ["https://w3id.org/dpv#A6-1-a", "https://w3id.org/dpv#A9-2-j"],
+        "personal_data": ["https://w3id.org/dpv/pd#Age", "https://w3id.org/dpv/pd#Gender"],
+        "purpose": ["https://w3id.org/dpv#AcademicResearch"],
+        "coding_system": ["http://www.wikidata.org/entity/P494"],
+        "code_values": [f"http://example.com/icd/C{index}" for index in range(10)],
+        "conforms_to": ["http://example.com/standard/fhir"],
+        "applicable_legislation": [f"{EU}/eli/reg/2025/327/oj"],
+        "dcat_type": f"{EU}/dataset-type/SYNTHETIC_DATA",
+        "publisher": [_agent(0)],
+        "creator": [_agent(1), _agent(2)],
+        "qualified_attribution": [
+            {"role": "http://example.com/role/curator", "agent": [_agent(3)]},
+        ],
+        "qualified_relation": [{"role": "http://example.com/role/related", "relation": "x"}],
+        "quality_annotation": [{"body": "http://example.com/quality/good", "target": "x"}],
+        "spatial_coverage": [{"uri": f"{EU}/country/NLD", "text": "Netherlands"}],
+        "provenance_activity": [
+            {
+                "type": "http://example.com/activity/collection",
+                "wasAssociatedWith": [
+                    {"type": "http://example.com/agent/org", "actedOnBehalfOf": [_agent(4)]}
+                ],
+            }
+        ],
+        "resources": [
+            {
+                "format": f"{EU}/file-type/CSV",
+                "mimetype": "https://www.iana.org/assignments/media-types/text/csv",
+                "license": f"{EU}/licence/CC_BY_4_0",
+                "access_rights": f"{EU}/access-right/RESTRICTED",
+                "language": [f"{EU}/language/ENG"],
+                "access_services": [
+                    {"theme": [f"{EU}/data-theme/HEAL"], "publisher": [_agent(5)]}
+                ],
+            }
+            for _ in range(resources)
+        ],
+    }
+    # The remaining HealthDCAT-AP properties are free text or identifiers
+    # that are not translated but still live on the package.
+    for index in range(total_fields - len(package)):
+        package[f"extra_property_{index}"] = f"Value {index}"
+    return package
+
+
+# The walks the plan and the staging replaced, kept here as the baseline.
+def _legacy_select(data_item, fields_list, target_list):
+    for key, value in data_item.items():
+        if key in fields_list:
+            target_list = _legacy_collect(key, value, target_list)
+    return target_list
+
+
+def _legacy_collect(field, value, target_list):
+    if value is None:
+        return target_list
+    nested_fields = NESTED_FIELD_TRANSLATIONS.get(field)
+    if isinstance(value, list):
+        for item in value:
+            if nested_fields and isinstance(item, dict):
+                for nested_field in nested_fields:
+                    if nested_field in item:
+                        target_list = _legacy_collect(nested_field, item[nested_field], target_list)
+            else:
+                target_list = translation_utils._append_atomic_value(item, target_list)
+        return target_list
+    if isinstance(value, dict):
+        if nested_fields:
+            for nested_field in nested_fields:
+                if nested_field in value:
+                    target_list = _legacy_collect(nested_field, value[nested_field], target_list)
+        return target_list
+    return translation_utils._append_atomic_value(value, target_list)
+
+
+def _legacy_atomic(value, translation_dict):
+    if isinstance(value, str):
+        return ValueLabel(name=value, display_name=translation_dict.get(value, value)).__dict__
+    return value
+
+
+def _legacy_atomic_or_collection(value, translation_dict):
+    if isinstance(value, list):
+        return [
+            _legacy_atomic(item, translation_dict)
+            if isinstance(item, (str, int, float))
+            else _legacy_atomic_or_collection(item, translation_dict)
+            for item in value
+        ]
+    if isinstance(value, dict):
+        if translation_utils._is_value_label_dict(value):
+            return value
+        return {
+            key: _legacy_atomic_or_collection(val, translation_dict)
+            for key, val in value.items()
+        }
+    return _legacy_atomic(value, translation_dict)
+
+
+def _legacy_nested(field, value, translation_dict):
+    nested_fields = NESTED_FIELD_TRANSLATIONS.get(field, set())
+    if isinstance(value, list):
+        return [
+            _legacy_nested(field, item, translation_dict)
+            if isinstance(item, (list, dict))
+            else _legacy_atomic(item, translation_dict)
+            for item in value
+        ]
+    if isinstance(value, dict):
+        if translation_utils._is_value_label_dict(value):
+            return value
+        translated = value.copy()
+        for nested_field in nested_fields:
+            if nested_field in translated:
+                if nested_field in NESTED_FIELD_TRANSLATIONS:
+                    translated[nested_field] = _legacy_nested(
+                        nested_field, translated[nested_field], translation_dict
+                    )
+                else:
+                    translated[nested_field] = _legacy_atomic_or_collection(
+                        translated[nested_field], translation_dict
+                    )
+        return translated
+    return _legacy_atomic(value, translation_dict)
+
+
+def _legacy_translate_fields(data, fields_list, translation_dict):
+    for field in fields_list:
+        value = data.get(field)
+        if value is None:
+            data[field] = None
+        elif field in NESTED_FIELD_TRANSLATIONS:
+            data[field] = _legacy_nested(field, value, translation_dict)
+        elif isinstance(value, list):
+            data[field] = [
+                ValueLabel(name=x, display_name=translation_dict.get(x, x)).__dict__ for x in value
+            ]
+        else:
+            data[field] = ValueLabel(name=value, display_name=translation_dict.get(value, value)).__dict__
+    return data
+
+
+def legacy_walk(package, translation_dict):
+    translation_utils._apply_translated_properties(package, "en")
+    translation_utils._merge_tags_translated_into_tags(package)
+    translation_utils._normalize_tags_field(package)
+    values = _legacy_select(package, PACKAGE_REPLACE_FIELDS, [])
+    for resource in package["resources"]:
+        values = _legacy_select(resource, RESOURCE_REPLACE_FIELDS, values)
+        for access_service in resource["access_services"]:
+            values = _legacy_select(access_service, ACCESS_SERVICES_REPLACE_FIELDS, values)
+    _legacy_translate_fields(package, PACKAGE_REPLACE_FIELDS, translation_dict)
+    for resource in package["resources"]:
+        _legacy_translate_fields(resource, RESOURCE_REPLACE_FIELDS, translation_dict)
+        resource["access_services"] = [
+            _legacy_translate_fields(service, ACCESS_SERVICES_REPLACE_FIELDS, translation_dict)
+            for service in resource["access_services"]
+        ]
+    return set(values), package
+
+
+def staged_walk(package, translation_dict, in_place=False):
+    staged = PackageTranslation("en", in_place=in_place)
+    staged.stage(package)
+    values = staged.values
+    staged.patch(translation_dict)
+    return set(values), package
+
+
+def in_place_walk(package, translation_dict):
+    return staged_walk(package, translation_dict, in_place=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--fields", type=int, default=200)
+    parser.add_argument("--resources", type=int, default=5)
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    package = _package(args.fields, args.resources)
+    values, _ = legacy_walk(copy.deepcopy(package), {})
+    translation_dict = {value: f"{value} (nl)" for value in values if isinstance(value, str)}
+
+    legacy = legacy_walk(copy.deepcopy(package), translation_dict)
+    staged = staged_walk(copy.deepcopy(package), translation_dict)
+    in_place = in_place_walk(copy.deepcopy(package), translation_dict)
+    assert legacy == staged == in_place, "staging must collect and translate exactly like the walks"
+
+    print(f"{len(package)} package fields, {args.resources} resources, {len(values)} terms")
+    print(f"{'walk':<10}{'per package':>14}")
+    for name, walk in (("generic", legacy_walk), ("staged", staged_walk), ("in place", in_place_walk)):
+        timings = []
+        for _ in range(args.repeat):
+            copies = [copy.deepcopy(package) for _ in range(args.number)]
+            timings.append(
+                timeit.timeit(lambda: walk(copies.pop(), translation_dict), number=args.number)
+            )
+        print(f"{name:<10}{min(timings) / args.number * 1e6:>12.1f}us")
+
+
+if __name__ == "__main__":
+    main()
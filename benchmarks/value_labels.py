@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Memory allocated while writing the translated labels of a search page
+(``rows=100`` HealthDCAT-AP packages with five resources each): a
+``ValueLabel(...).__dict__`` per value, against one directly built label dict
+per distinct term.
+
+Packages are staged before tracing starts, so the figures cover only the
+labels. ``retained`` is what the page holds once the labels are written,
+``peak`` the most traced memory at any point while writing them.
+
+Run from the repository root::
+
+    python benchmarks/value_labels.py
+"""
+
+import argparse
+import copy
+import gc
+import timeit
+import tracemalloc
+
+from translation_plan import _package
+
+from ckanext.gdi_userportal.logic.action.translation_utils import (
+    PackageTranslation,
+    ValueLabel,
+)
+
+
+def dataclass_patch(staged, translation_dict):
+    # PackageTranslation.patch as it was, kept here as the baseline.
+    for slots in staged._slots.values():
+        for container, slot, name in slots:
+            container[slot] = ValueLabel(
+                name=name, display_name=translation_dict.get(name, name)
+            ).__dict__
+    staged._slots.clear()
+
+
+def shared_patch(staged, translation_dict):
+    staged.patch(translation_dict)
+
+
+def _stage(corpus):
+    staged = PackageTranslation("en")
+    packages = copy.deepcopy(corpus)
+    for index, package in enumerate(packages):
+        staged.stage(package, key=index)
+    return staged, packages
+
+
+def measure(patch, corpus, translation_dict):
+    staged, packages = _stage(corpus)
+    labels = sum(len(slots) for slots in staged._slots.values())
+    gc.collect()
+    tracemalloc.start()
+    patch(staged, translation_dict)
+    snapshot = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    statistics = snapshot.statistics("filename")
+    blocks = sum(stat.count for stat in statistics)
+    size = sum(stat.size for stat in statistics)
+    del packages
+    return labels, blocks, size, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--fields", type=int, default=200)
+    parser.add_argument("--resources", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    corpus = [_package(args.fields, args.resources) for _ in range(args.rows)]
+    staged, _ = _stage(corpus)
+    translation_dict = {value: f"{value} (nl)" for value in staged.values}
+
+    dataclass_pages = _stage(corpus)
+    shared_pages = _stage(corpus)
+    dataclass_patch(dataclass_pages[0], translation_dict)
+    shared_patch(shared_pages[0], translation_dict)
+    assert dataclass_pages[1] == shared_pages[1], "both must write the same labels"
+
+    print(f"{args.rows} packages, {args.resources} resources each")
+    print(f"{'labels':<12}{'count':>8}{'blocks':>10}{'retained':>12}{'peak':>12}{'per page':>12}")
+    for name, patch in (("dataclass", dataclass_patch), ("shared", shared_patch)):
+        labels, blocks, size, peak = measure(patch, corpus, translation_dict)
+        timings = []
+        for _ in range(args.repeat):
+            staged, _ = _stage(corpus)
+            timings.append(timeit.timeit(lambda: patch(staged, translation_dict), number=1))
+        print(
+            f"{name:<12}{labels:>8}{blocks:>10}{size / 1024:>10.0f}KiB"
+            f"{peak / 1024:>10.0f}KiB{min(timings) * 1e3:>10.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
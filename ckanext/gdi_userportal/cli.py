@@ -41,6 +41,9 @@ def migrate(target, force):
             for version in results["applied"]:
                 click.echo(f"  - {version}")
             click.echo(f"\nTotal translations added/updated: {results['total_translations']}")
+            click.echo(f"Translation generation: {results['generation']}")
+            _recompile_translations()
+            _reindex_stale_datasets()
         
         if results["skipped"]:
             click.echo(click.style(f"\n⊘ Skipped {len(results['skipped'])} already applied migration(s)", fg="yellow"))
@@ -73,6 +76,7 @@ def status(as_json):
         
         click.echo("\n=== Term Translation Migration Status ===\n")
         click.echo(f"Current version: {migration_status['current_version'] or 'None'}")
+        click.echo(f"Translation generation: {migration_status['translation_generation']}")
         click.echo(f"Total migrations: {migration_status['total_migrations']}")
         click.echo(f"Applied: {migration_status['applied_count']}")
         click.echo(f"Pending: {migration_status['pending_count']}")
@@ -116,6 +120,9 @@ def downgrade(version, yes):
         if results.get("success"):
             click.echo(click.style(f"\n✓ Migration {version} downgraded successfully", fg="green"))
             click.echo(f"Translations removed: {results['translations_removed']}")
+            click.echo(f"Translation generation: {results['generation']}")
+            _recompile_translations()
+            _reindex_stale_datasets()
         else:
             click.echo(click.style(f"\n✗ Downgrade failed: {results.get('error', 'Unknown error')}", fg="red"))
             
@@ -124,6 +131,87 @@ def downgrade(version, yes):
         raise click.Abort()
 
 
+def _recompile_translations():
+    """Refresh the compiled translation file when one is configured."""
+    from ckanext.gdi_userportal.logic.action.translation_compiled import (
+        get_compiled_translations_path,
+    )
+
+    path = get_compiled_translations_path()
+    if path:
+        _compile(path)
+
+
+def _compile(path):
+    from ckanext.gdi_userportal.logic.action.translation_compiled import compile_translations
+    from ckanext.gdi_userportal.logic.action.translation_utils import SUPPORTED_LANGUAGES
+
+    count = compile_translations(path, SUPPORTED_LANGUAGES)
+    click.echo(f"Compiled {count} term(s) to {path}")
+
+
+@translations.command("compile")
+@click.option("--output", "-o", default=None, help="Output file (defaults to the configured path)")
+def compile_command(output):
+    """Write term translations to a memory-mapped file for web workers.
+
+    Example: ckan gdi-userportal translations compile -o /srv/app/data/translations.bin
+    """
+    from ckanext.gdi_userportal.logic.action.translation_compiled import (
+        COMPILED_PATH_CONFIG,
+        get_compiled_translations_path,
+    )
+
+    path = output or get_compiled_translations_path()
+    if not path:
+        click.echo(click.style(f"✗ Pass --output or set {COMPILED_PATH_CONFIG}", fg="red"))
+        raise click.Abort()
+
+    try:
+        _compile(path)
+    except Exception as e:
+        click.echo(click.style(f"\n✗ Compilation failed: {e}", fg="red"))
+        raise click.Abort()
+
+
+def _reindex_stale_datasets():
+    """Refresh pre-translated search payloads when that mode is enabled."""
+    from ckanext.gdi_userportal.logic.action.pretranslated_index import (
+        is_pretranslated_index_enabled,
+    )
+
+    if is_pretranslated_index_enabled():
+        _reindex()
+
+
+def _reindex():
+    from ckanext.gdi_userportal.logic.action.pretranslated_index import (
+        reindex_stale_datasets,
+    )
+    from ckanext.gdi_userportal.logic.action.translation_cache import reset_translation_cache
+    from ckanext.gdi_userportal.migrations import get_translation_generation
+
+    # Payloads are stamped with the generation this process sees; drop any
+    # generation polled before the migration.
+    reset_translation_cache()
+    count = reindex_stale_datasets(get_translation_generation())
+    click.echo(f"Reindexed {count} dataset(s) with stale pre-translated payloads")
+
+
+@translations.command("reindex")
+def reindex_command():
+    """Reindex datasets whose pre-translated search payload is out of date.
+
+    Only datasets indexed before the current translation generation are
+    reindexed, instead of the whole catalogue.
+    """
+    try:
+        _reindex()
+    except Exception as e:
+        click.echo(click.style(f"\n✗ Reindex failed: {e}", fg="red"))
+        raise click.Abort()
+
+
 @translations.command("create")
 @click.argument("description")
 def create(description):
@@ -7,34 +7,40 @@
 
 # -*- coding: utf-8 -*-
 
+import hashlib
 import json
 
+from ckan import model
 from ckan.plugins import toolkit
+from ckanext.gdi_userportal.logic.action.search_cache import cache_search_results
+from ckanext.gdi_userportal.logic.action.search_pipeline import run_search_pipeline
+from ckanext.gdi_userportal.logic.action.translation_cache import (
+    get_current_translation_generation,
+)
 from ckanext.gdi_userportal.logic.action.translation_utils import (
+    PackageTranslation,
     collect_values_to_translate,
+    get_language_chain,
     get_request_language,
     get_preferred_language,
     get_translations,
     replace_package,
-    replace_search_facets,
+    translates_in_place,
 )
 
+MAX_TERM_TRANSLATIONS = 1000
+MAX_PACKAGES_SHOW_MANY = 100
+
 
 @toolkit.side_effect_free
+@cache_search_results
 def enhanced_package_search(context, data_dict) -> dict:
-    result = toolkit.get_action("package_search")(context, data_dict)
-    values_to_translate = collect_values_to_translate(result)
-    lang = get_request_language()
-    translations = get_translations(values_to_translate, lang=lang)
-    result["results"] = [
-        replace_package(package, translations, lang=lang)
-        for package in result["results"]
-    ]
-    if "search_facets" in result.keys():
-        result["search_facets"] = replace_search_facets(
-            result["search_facets"], translations, lang=lang
-        )
-    return result
+    """
+    package_search with translated vocabulary values. An optional ``fl``
+    list of package fields limits what is translated and returned, and
+    ``include_resources=false`` leaves resources out of the results.
+    """
+    return run_search_pipeline(context, data_dict).result
 
 
 @toolkit.side_effect_free
@@ -43,7 +49,146 @@ def enhanced_package_show(context, data_dict) -> dict:
     values_to_translate = collect_values_to_translate(result)
     lang = get_request_language()
     translations = get_translations(values_to_translate, lang=lang)
-    return replace_package(result, translations, lang=lang)
+    return replace_package(
+        result, translations, lang=lang, in_place=translates_in_place(context)
+    )
+
+
+@toolkit.side_effect_free
+def enhanced_package_show_many(context, data_dict=None) -> list:
+    """
+    Translated package dicts for many datasets, resolved with one translation
+    lookup.
+
+    :param ids: dataset ids or names, as a list, a JSON list or a
+        comma-separated string
+    :returns: the translated packages in request order; ids that do not
+        exist or that the caller may not see are left out
+    """
+    data_dict = data_dict or {}
+    package_ids = _parse_requested_ids(data_dict.get("ids"))
+
+    packages = []
+    for package_id in package_ids:
+        try:
+            packages.append(
+                toolkit.get_action("package_show")(
+                    toolkit.fresh_context(context), {"id": package_id}
+                )
+            )
+        except (toolkit.ObjectNotFound, toolkit.NotAuthorized):
+            continue
+
+    lang = get_request_language()
+    staged = PackageTranslation(lang, in_place=translates_in_place(context))
+    for package in packages:
+        staged.stage(package)
+    staged.patch(get_translations(staged.values, lang=lang))
+    return packages
+
+
+def _parse_requested_ids(ids: object) -> list[str]:
+    if isinstance(ids, str):
+        try:
+            ids = json.loads(ids)
+        except ValueError:
+            ids = ids.split(",")
+
+    if not isinstance(ids, (list, tuple)):
+        raise toolkit.ValidationError({"ids": ["Must be a list of dataset ids"]})
+
+    parsed_ids = list(
+        dict.fromkeys(
+            package_id.strip()
+            for package_id in ids
+            if isinstance(package_id, str) and package_id.strip()
+        )
+    )
+    if not parsed_ids:
+        raise toolkit.ValidationError({"ids": ["Missing value"]})
+    if len(parsed_ids) > MAX_PACKAGES_SHOW_MANY:
+        raise toolkit.ValidationError(
+            {"ids": [f"At most {MAX_PACKAGES_SHOW_MANY} datasets can be shown at once"]}
+        )
+    return parsed_ids
+
+
+def package_show_etag(data_dict: dict) -> str:
+    """
+    ETag for ``enhanced_package_show``, computed without building the package
+    dict: it changes with the dataset's ``metadata_modified``, the requested
+    language and the translation generation. Raises like package_show when
+    the dataset does not exist or the caller may not see it.
+    """
+    package_id = data_dict.get("id") or data_dict.get("name_or_id")
+    package = model.Package.get(package_id) if package_id else None
+    if package is None:
+        raise toolkit.ObjectNotFound()
+
+    toolkit.check_access("package_show", _request_context(), {"id": package.id})
+
+    modified = package.metadata_modified
+    validator = [
+        package.id,
+        modified.isoformat() if modified else None,
+        get_language_chain(get_request_language()),
+        get_current_translation_generation(),
+        sorted((key, str(value)) for key, value in data_dict.items()),
+    ]
+    return hashlib.sha256(json.dumps(validator).encode("utf-8")).hexdigest()
+
+
+def _request_context() -> dict:
+    user = toolkit.current_user
+    return {"user": getattr(user, "name", None) or "", "auth_user_obj": user}
+
+
+@toolkit.side_effect_free
+def gdi_term_translations_show(context, data_dict=None) -> dict:
+    """
+    Translate many vocabulary terms in one call.
+
+    :param terms: the terms to translate, as a list, a JSON list or a
+        comma-separated string
+    :param lang: optional language, defaults to the request Accept-Language
+    :returns: the resolved language, the translation generation and a
+        ``term -> translation`` mapping for the terms that have a translation
+    """
+    data_dict = data_dict or {}
+    terms = _parse_requested_terms(data_dict.get("terms"))
+    lang_chain = _requested_language_chain(data_dict)
+
+    return {
+        "lang": lang_chain[0],
+        "generation": get_current_translation_generation(),
+        "translations": get_translations(sorted(terms), lang=",".join(lang_chain)),
+    }
+
+
+def term_translations_etag(data_dict: dict) -> str:
+    """ETag for ``gdi_term_translations_show``; changes with the translation generation."""
+    terms = _parse_requested_terms(data_dict.get("terms"))
+    validator = [
+        get_current_translation_generation(),
+        _requested_language_chain(data_dict),
+        sorted(terms),
+    ]
+    return hashlib.sha256(json.dumps(validator).encode("utf-8")).hexdigest()
+
+
+def _parse_requested_terms(terms: object) -> set[str]:
+    parsed_terms = _parse_requested_keys(terms)
+    if not parsed_terms:
+        raise toolkit.ValidationError({"terms": ["Missing value"]})
+    if len(parsed_terms) > MAX_TERM_TRANSLATIONS:
+        raise toolkit.ValidationError(
+            {"terms": [f"At most {MAX_TERM_TRANSLATIONS} terms can be translated at once"]}
+        )
+    return parsed_terms
+
+
+def _requested_language_chain(data_dict: dict) -> tuple[str, ...]:
+    return get_language_chain(data_dict.get("lang") or get_request_language())
 
 
 @toolkit.side_effect_free
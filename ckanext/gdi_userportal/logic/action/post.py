@@ -5,12 +5,10 @@
 
 import logging
 from ckan.plugins import toolkit
-from ckanext.gdi_userportal.logic.action.translation_utils import (
-    collect_values_to_translate,
-    get_request_language,
-    get_translations,
-    replace_package,
-    replace_search_facets,
+from ckanext.gdi_userportal.logic.action.search_cache import cache_search_results
+from ckanext.gdi_userportal.logic.action.search_pipeline import run_search_pipeline
+from ckanext.gdi_userportal.logic.action.translation_cache import (
+    invalidate_translation_caches,
 )
 from typing import Dict
 
@@ -18,32 +16,32 @@ log = logging.getLogger(__name__)
 
 
 @toolkit.side_effect_free
+@cache_search_results
 def enhanced_package_search(context, data_dict=None) -> Dict:
     data_dict = data_dict or toolkit.request.json
     if not data_dict:
         raise toolkit.ValidationError("data_dict and request body cannot be both empty")
 
     try:
-        result = toolkit.get_action("package_search")(context, data_dict)
-        values_to_translate = collect_values_to_translate(result)
-        lang = get_request_language()
-        translations = get_translations(values_to_translate, lang=lang)
-
-        result["results"] = [
-            replace_package(package, translations, lang=lang)
-            for package in result["results"]
-        ]
-
-        if "search_facets" in result:
-            result["search_facets"] = replace_search_facets(
-                result["search_facets"], translations, lang=lang
-            )
-
-        return result
+        return run_search_pipeline(context, data_dict).result
     except Exception as e:
         _handle_exception(e, "Error in enhanced_package_search")
 
 
+@toolkit.chained_action
+def term_translation_update(original_action, context, data_dict):
+    result = original_action(context, data_dict)
+    invalidate_translation_caches()
+    return result
+
+
+@toolkit.chained_action
+def term_translation_update_many(original_action, context, data_dict):
+    result = original_action(context, data_dict)
+    invalidate_translation_caches()
+    return result
+
+
 def _handle_exception(e: Exception, message: str):
     log.error(f"{message}: %s", str(e))
     if isinstance(e, toolkit.ObjectNotFound):
@@ -0,0 +1,166 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Pre-translated dataset payloads stored in the Solr index.
+
+With the mode enabled, ``before_dataset_index`` translates each dataset for
+every supported language and stores the results, stamped with the current
+translation generation, in the stored-only ``gdi_translated_data_dict``
+field::
+
+    ckanext.gdi_userportal.pretranslated_index.enabled = true
+
+``enhanced_package_search`` requests that field and returns the payload for
+the request's language chain as it is, so those results are neither
+collected nor translated again. Payloads from an older generation, or for a
+language chain that was not pre-translated, are ignored and the dataset is
+translated at query time as before. ``ckan gdi-userportal translations
+reindex`` reindexes just the datasets with a stale payload; ``translations
+migrate`` and ``downgrade`` run it when the mode is enabled.
+"""
+
+import copy
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ckan import model
+from ckan.common import config
+from ckan.lib import search
+from ckan.plugins import toolkit
+
+from ckanext.gdi_userportal.logic.action.translation_cache import (
+    get_current_translation_generation,
+)
+from ckanext.gdi_userportal.logic.action.translation_utils import (
+    SUPPORTED_LANGUAGES,
+    collect_values_to_translate,
+    get_language_chain,
+    get_translations,
+    replace_package,
+)
+
+log = logging.getLogger(__name__)
+
+PRETRANSLATED_INDEX_ENABLED_CONFIG = "ckanext.gdi_userportal.pretranslated_index.enabled"
+
+PRETRANSLATED_PAYLOAD_FIELD = "gdi_translated_data_dict"
+PRETRANSLATED_GENERATION_FIELD = "gdi_translation_generation"
+PRETRANSLATED_SEARCH_FIELDS = ["id", "validated_data_dict", PRETRANSLATED_PAYLOAD_FIELD]
+
+STALE_SEARCH_PAGE_SIZE = 1000
+
+
+def is_pretranslated_index_enabled() -> bool:
+    return toolkit.asbool(config.get(PRETRANSLATED_INDEX_ENABLED_CONFIG, False))
+
+
+def _chain_key(lang_chain: Tuple[str, ...]) -> str:
+    return ",".join(lang_chain)
+
+
+def build_pretranslated_payload(package: Dict[str, Any], generation: int) -> Dict[str, Any]:
+    """The translated package for each supported language, keyed by language chain."""
+    values_to_translate = collect_values_to_translate(package)
+    packages = {}
+    for lang in sorted(SUPPORTED_LANGUAGES):
+        translations = get_translations(values_to_translate, lang=lang)
+        packages[_chain_key(get_language_chain(lang))] = replace_package(
+            copy.deepcopy(package), translations, lang=lang, in_place=True
+        )
+    return {"generation": generation, "packages": packages}
+
+
+def add_pretranslated_payload(pkg_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the pre-translated payload fields to a dataset about to be indexed."""
+    if not is_pretranslated_index_enabled() or not pkg_dict.get("validated_data_dict"):
+        return pkg_dict
+
+    try:
+        generation = get_current_translation_generation()
+        payload = build_pretranslated_payload(
+            json.loads(pkg_dict["validated_data_dict"]), generation
+        )
+    except Exception:
+        log.exception("Failed to pre-translate dataset %s for Solr indexing", pkg_dict.get("id"))
+        return pkg_dict
+
+    pkg_dict[PRETRANSLATED_PAYLOAD_FIELD] = json.dumps(payload)
+    pkg_dict[PRETRANSLATED_GENERATION_FIELD] = generation
+    return pkg_dict
+
+
+def _pretranslated_package(
+    raw_payload: Any, chain_key: str, generation: int
+) -> Optional[Dict[str, Any]]:
+    if not isinstance(raw_payload, str):
+        return None
+    try:
+        payload = json.loads(raw_payload)
+    except ValueError:
+        return None
+    if payload.get("generation") != generation:
+        return None
+    return payload.get("packages", {}).get(chain_key)
+
+
+def load_search_rows(
+    rows: Iterable[Dict[str, Any]], lang: Optional[str]
+) -> Tuple[List[Dict[str, Any]], List[bool]]:
+    """
+    Package dicts for search results fetched with ``PRETRANSLATED_SEARCH_FIELDS``,
+    and whether each one is already translated.
+    """
+    chain_key = _chain_key(get_language_chain(lang))
+    generation = get_current_translation_generation()
+
+    packages = []
+    pretranslated = []
+    for row in rows:
+        package = _pretranslated_package(
+            row.get(PRETRANSLATED_PAYLOAD_FIELD), chain_key, generation
+        )
+        if package is not None:
+            packages.append(package)
+            pretranslated.append(True)
+        elif row.get("validated_data_dict"):
+            packages.append(json.loads(row["validated_data_dict"]))
+            pretranslated.append(False)
+        else:
+            log.error("No package_dict is coming from solr for package id %s", row.get("id"))
+    return packages, pretranslated
+
+
+def find_stale_dataset_ids(generation: int) -> List[str]:
+    """Ids of indexed datasets without a payload for ``generation``."""
+    query = search.query_for(model.Package)
+    ids: List[str] = []
+    start = 0
+    while True:
+        query.run(
+            {
+                "q": "*:*",
+                "fq": f"-{PRETRANSLATED_GENERATION_FIELD}:{generation}",
+                "fl": "id",
+                "sort": "id asc",
+                "rows": STALE_SEARCH_PAGE_SIZE,
+                "start": start,
+            },
+            permission_labels=None,
+        )
+        ids.extend(query.results)
+        start += STALE_SEARCH_PAGE_SIZE
+        if start >= query.count:
+            return ids
+
+
+def reindex_stale_datasets(generation: Optional[int] = None) -> int:
+    """Reindex the datasets whose payload is older than ``generation``."""
+    if generation is None:
+        generation = get_current_translation_generation()
+    package_ids = find_stale_dataset_ids(generation)
+    if package_ids:
+        search.rebuild(package_ids=package_ids, force=True, quiet=True)
+    return len(package_ids)
@@ -0,0 +1,154 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Process-local result cache for ``enhanced_package_search``.
+
+Identical searches (the landing page, common filter combinations) are answered
+from memory without querying Solr or translating the results again. Entries
+are keyed by the canonicalized search parameters, the resolved language
+chain, the caller's permission labels and the translation generation, and are
+bounded by size and TTL. Enable it with::
+
+    ckanext.gdi_userportal.search_cache.enabled = true
+
+The cache is cleared when a dataset is created, updated or deleted in this
+worker; other workers rely on the (short) TTL.
+"""
+
+import copy
+from functools import wraps
+import hashlib
+import json
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from ckan import authz, model
+from ckan.common import config
+from ckan.lib.plugins import get_permission_labels
+from ckan.plugins import toolkit
+
+from ckanext.gdi_userportal.logic.action.translation_cache import (
+    TTLCache,
+    get_current_translation_generation,
+    intern_term,
+)
+from ckanext.gdi_userportal.logic.action.translation_utils import (
+    get_language_chain,
+    get_request_language,
+)
+
+log = logging.getLogger(__name__)
+
+SEARCH_CACHE_ENABLED_CONFIG = "ckanext.gdi_userportal.search_cache.enabled"
+SEARCH_CACHE_MAX_SIZE_CONFIG = "ckanext.gdi_userportal.search_cache.max_size"
+SEARCH_CACHE_TTL_CONFIG = "ckanext.gdi_userportal.search_cache.ttl"
+
+DEFAULT_SEARCH_CACHE_MAX_SIZE = 1000
+DEFAULT_SEARCH_CACHE_TTL = 60
+
+_search_cache: Optional[TTLCache] = None
+_search_cache_lock = threading.Lock()
+
+
+def is_search_cache_enabled() -> bool:
+    return toolkit.asbool(config.get(SEARCH_CACHE_ENABLED_CONFIG, False))
+
+
+def get_search_cache() -> TTLCache:
+    global _search_cache
+
+    if _search_cache is None:
+        with _search_cache_lock:
+            if _search_cache is None:
+                _search_cache = TTLCache(
+                    max_size=toolkit.asint(
+                        config.get(SEARCH_CACHE_MAX_SIZE_CONFIG, DEFAULT_SEARCH_CACHE_MAX_SIZE)
+                    ),
+                    ttl=toolkit.asint(
+                        config.get(SEARCH_CACHE_TTL_CONFIG, DEFAULT_SEARCH_CACHE_TTL)
+                    ),
+                )
+    return _search_cache
+
+
+def clear_search_cache() -> None:
+    if _search_cache is not None:
+        _search_cache.clear()
+
+
+def _canonicalize(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {str(key): _canonicalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonicalize(item) for item in value]
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+
+def _permission_labels(context: Dict[str, Any]) -> Optional[list]:
+    """The labels package_search filters on, or None when it does not filter."""
+    user = context.get("user")
+    if context.get("ignore_auth") or (user and authz.is_sysadmin(user)):
+        return None
+
+    user_obj = context.get("auth_user_obj")
+    if user_obj is None and user:
+        user_obj = model.User.get(user)
+    return sorted(get_permission_labels().get_user_dataset_labels(user_obj))
+
+
+def search_cache_key(context: Dict[str, Any], data_dict: Dict[str, Any], lang: Optional[str]) -> str:
+    key = [
+        _canonicalize(data_dict),
+        get_language_chain(lang),
+        _permission_labels(context),
+        get_current_translation_generation(),
+    ]
+    return hashlib.sha256(
+        json.dumps(key, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def _intern_value_labels(value: Any) -> None:
+    """Intern the vocabulary terms of the ValueLabel dicts in a cached result."""
+    if isinstance(value, list):
+        for item in value:
+            _intern_value_labels(item)
+    elif isinstance(value, dict):
+        if "name" in value and "display_name" in value:
+            value["name"] = intern_term(value["name"])
+        for item in value.values():
+            if isinstance(item, (dict, list)):
+                _intern_value_labels(item)
+
+
+def cache_search_results(action: Callable) -> Callable:
+    """Serve an enhanced search action from the search cache when enabled."""
+
+    @wraps(action)
+    def wrapper(context, data_dict=None):
+        if not data_dict or not is_search_cache_enabled():
+            return action(context, data_dict)
+
+        try:
+            key = search_cache_key(context, data_dict, get_request_language())
+        except Exception:
+            log.warning("Could not compute the search cache key", exc_info=True)
+            return action(context, data_dict)
+
+        cache = get_search_cache()
+        cached = cache.get_many([key]).get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        result = action(context, data_dict)
+        stored = copy.deepcopy(result)
+        _intern_value_labels(stored)
+        cache.set_many({key: stored})
+        return result
+
+    return wrapper
@@ -0,0 +1,200 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Staged pipeline behind ``enhanced_package_search``.
+
+A search runs as a sequence of named stages over one :class:`SearchState`:
+``prepare``, ``search``, ``project``, ``collect``, ``lookup``, ``replace``
+and ``facets``. The duration of every stage is recorded in the
+``gdi_userportal.enhanced_search.stage.duration`` histogram (attribute
+``stage``) and as an attribute of the ``enhanced_package_search`` span, so a
+slow search can be attributed to Solr or to translation.
+
+A stage ends the pipeline early by setting ``state.done``; the remaining
+stages are skipped and ``state.result`` is returned as it is.
+"""
+
+from dataclasses import dataclass, field
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ckan.plugins import toolkit
+from opentelemetry import metrics, trace
+
+from ckanext.gdi_userportal.logic.action.pretranslated_index import (
+    PRETRANSLATED_SEARCH_FIELDS,
+    is_pretranslated_index_enabled,
+    load_search_rows,
+)
+from ckanext.gdi_userportal.logic.action.search_prefetch import (
+    TranslationPrefetch,
+    resolve_translation_prefetch,
+    start_translation_prefetch,
+)
+from ckanext.gdi_userportal.logic.action.translation_utils import (
+    PackageTranslation,
+    collect_facet_values_to_translate,
+    get_request_language,
+    get_translations,
+    parse_field_list,
+    parse_include_resources,
+    project_package,
+    replace_search_facets,
+    translates_in_place,
+)
+
+STAGE_DURATION_METRIC = "gdi_userportal.enhanced_search.stage.duration"
+SPAN_ATTRIBUTE_PREFIX = "gdi_userportal.search"
+
+tracer = trace.get_tracer(__name__)
+stage_duration = metrics.get_meter(__name__).create_histogram(
+    STAGE_DURATION_METRIC,
+    unit="ms",
+    description="Duration of the enhanced_package_search stages",
+)
+
+
+@dataclass
+class SearchState:
+    context: Dict[str, Any]
+    data_dict: Dict[str, Any]
+    lang: Optional[str] = None
+    fields: Optional[List[str]] = None
+    include_resources: bool = True
+    prefetch: Optional[TranslationPrefetch] = None
+    use_pretranslated: bool = False
+    result: Dict[str, Any] = field(default_factory=dict)
+    # Per result: whether it came pre-translated from the search index.
+    pretranslated: List[bool] = field(default_factory=list)
+    staged: Optional[PackageTranslation] = None
+    values_to_translate: List[Any] = field(default_factory=list)
+    translations: Dict[str, str] = field(default_factory=dict)
+    done: bool = False
+
+    def needs_translation(self, index: int) -> bool:
+        return not (index < len(self.pretranslated) and self.pretranslated[index])
+
+
+Stage = Tuple[str, Callable[[SearchState], None]]
+
+
+def _prepare(state: SearchState) -> None:
+    state.fields = parse_field_list(state.data_dict.pop("fl", None))
+    state.include_resources = parse_include_resources(state.data_dict)
+    state.lang = get_request_language()
+    state.use_pretranslated = is_pretranslated_index_enabled() and not toolkit.asbool(
+        state.data_dict.get("use_default_schema", False)
+    )
+    state.prefetch = start_translation_prefetch(state.data_dict, state.lang)
+
+
+def _search(state: SearchState) -> None:
+    if not state.use_pretranslated:
+        state.result = toolkit.get_action("package_search")(state.context, state.data_dict)
+        return
+
+    state.result = toolkit.get_action("package_search")(
+        state.context, dict(state.data_dict, fl=PRETRANSLATED_SEARCH_FIELDS)
+    )
+    state.result["results"], state.pretranslated = load_search_rows(
+        state.result["results"], state.lang
+    )
+
+
+def _project(state: SearchState) -> None:
+    packages = state.result["results"]
+    if state.fields:
+        packages = [project_package(package, state.fields) for package in packages]
+    if not state.include_resources:
+        for package in packages:
+            package.pop("resources", None)
+    state.result["results"] = packages
+
+
+def _collect(state: SearchState) -> None:
+    # Staging records where each translated value goes, so the replace stage
+    # only writes labels instead of walking the packages a second time.
+    state.staged = PackageTranslation(
+        state.lang,
+        fields=state.fields,
+        include_resources=state.include_resources,
+        in_place=translates_in_place(state.context),
+    )
+    for index, package in enumerate(state.result["results"]):
+        if state.needs_translation(index):
+            state.staged.stage(package, key=index)
+    state.values_to_translate = list(
+        dict.fromkeys(
+            state.staged.values
+            + collect_facet_values_to_translate(state.result.get("search_facets"))
+        )
+    )
+
+
+def _lookup(state: SearchState) -> None:
+    prefetched, values_to_translate = resolve_translation_prefetch(
+        state.prefetch, state.values_to_translate
+    )
+    state.translations = get_translations(values_to_translate, lang=state.lang)
+    state.translations.update(prefetched)
+
+
+def _replace(state: SearchState) -> None:
+    state.staged.patch(state.translations)
+
+
+def _facets(state: SearchState) -> None:
+    if "search_facets" in state.result:
+        state.result["search_facets"] = replace_search_facets(
+            state.result["search_facets"], state.translations, lang=state.lang
+        )
+
+
+# Up to a resolved translation dict; callers that translate packages
+# themselves (the streaming endpoint) stop here.
+TRANSLATION_STAGES: Tuple[Stage, ...] = (
+    ("prepare", _prepare),
+    ("search", _search),
+    ("project", _project),
+    ("collect", _collect),
+    ("lookup", _lookup),
+)
+
+SEARCH_STAGES: Tuple[Stage, ...] = TRANSLATION_STAGES + (
+    ("replace", _replace),
+    ("facets", _facets),
+)
+
+
+def run_search_pipeline(
+    context: Dict[str, Any],
+    data_dict: Dict[str, Any],
+    stages: Sequence[Stage] = SEARCH_STAGES,
+) -> SearchState:
+    """Run the search stages in order and return the final state."""
+    state = SearchState(context=context, data_dict=data_dict)
+    with tracer.start_as_current_span("enhanced_package_search") as span:
+        for name, stage in stages:
+            started = time.perf_counter()
+            try:
+                stage(state)
+            finally:
+                duration = (time.perf_counter() - started) * 1000
+                stage_duration.record(duration, {"stage": name})
+                span.set_attribute(f"{SPAN_ATTRIBUTE_PREFIX}.{name}.duration_ms", duration)
+            if state.done:
+                span.set_attribute(f"{SPAN_ATTRIBUTE_PREFIX}.short_circuit", name)
+                break
+
+        span.set_attribute(
+            f"{SPAN_ATTRIBUTE_PREFIX}.results", len(state.result.get("results") or [])
+        )
+        span.set_attribute(
+            f"{SPAN_ATTRIBUTE_PREFIX}.translated_terms", len(state.translations)
+        )
+        span.set_attribute(
+            f"{SPAN_ATTRIBUTE_PREFIX}.pretranslated_results", sum(state.pretranslated)
+        )
+    return state
@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Translation prefetch for ``enhanced_package_search``.
+
+The facet fields and the ``fq`` filter values of a search are known before
+``package_search`` returns, and their translations are requested again once
+the results are in. With the prefetch enabled those translations are looked
+up on a small thread pool while Solr runs, so the translation lookup of a
+search overlaps with the query instead of following it::
+
+    ckanext.gdi_userportal.search_prefetch.enabled = true
+
+The worker threads run in a copy of the request context and release their
+database session when the lookup is done.
+"""
+
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+import json
+import logging
+import re
+import threading
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from ckan import model
+from ckan.common import config
+from ckan.plugins import toolkit
+
+from ckanext.gdi_userportal.logic.action.translation_utils import get_translations
+
+log = logging.getLogger(__name__)
+
+SEARCH_PREFETCH_ENABLED_CONFIG = "ckanext.gdi_userportal.search_prefetch.enabled"
+SEARCH_PREFETCH_MAX_WORKERS_CONFIG = "ckanext.gdi_userportal.search_prefetch.max_workers"
+SEARCH_PREFETCH_TIMEOUT_CONFIG = "ckanext.gdi_userportal.search_prefetch.timeout"
+
+DEFAULT_SEARCH_PREFETCH_MAX_WORKERS = 4
+DEFAULT_SEARCH_PREFETCH_TIMEOUT = 5
+
+# Quoted values in filter queries, e.g. theme:"http://example.com/theme/HEAL".
+_QUOTED_FILTER_VALUE = re.compile(r'"((?:[^"\\]|\\.)+)"')
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+class TranslationPrefetch(NamedTuple):
+    terms: FrozenSet[str]
+    future: Future
+
+
+def is_search_prefetch_enabled() -> bool:
+    return toolkit.asbool(config.get(SEARCH_PREFETCH_ENABLED_CONFIG, False))
+
+
+def get_prefetch_executor() -> ThreadPoolExecutor:
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=toolkit.asint(
+                        config.get(
+                            SEARCH_PREFETCH_MAX_WORKERS_CONFIG,
+                            DEFAULT_SEARCH_PREFETCH_MAX_WORKERS,
+                        )
+                    ),
+                    thread_name_prefix="gdi-translation-prefetch",
+                )
+    return _executor
+
+
+def shutdown_prefetch_executor() -> None:
+    global _executor
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+
+
+def _as_list(value: Any) -> List[Any]:
+    if isinstance(value, str):
+        try:
+            parsed = json.loads(value)
+        except ValueError:
+            return [value]
+        return parsed if isinstance(parsed, list) else [value]
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return []
+
+
+def collect_prefetch_terms(data_dict: Dict[str, Any]) -> List[str]:
+    """Terms of a search that can be translated before it returns."""
+    terms = [field for field in _as_list(data_dict.get("facet.field")) if isinstance(field, str)]
+    for filter_query in (data_dict.get("fq"), *_as_list(data_dict.get("fq_list"))):
+        if isinstance(filter_query, str):
+            terms.extend(
+                value.replace('\\"', '"') for value in _QUOTED_FILTER_VALUE.findall(filter_query)
+            )
+    return list(dict.fromkeys(term.strip() for term in terms if term.strip()))
+
+
+def _lookup_in_worker(terms: List[str], lang: Optional[str]) -> Dict[str, str]:
+    try:
+        return get_translations(terms, lang=lang)
+    finally:
+        # The scoped session is per thread; do not keep a connection per worker.
+        model.Session.remove()
+
+
+def start_translation_prefetch(
+    data_dict: Dict[str, Any], lang: Optional[str]
+) -> Optional[TranslationPrefetch]:
+    """Start looking up the known terms of a search, when the prefetch is enabled."""
+    if not is_search_prefetch_enabled():
+        return None
+
+    terms = collect_prefetch_terms(data_dict)
+    if not terms:
+        return None
+
+    context = contextvars.copy_context()
+    future = get_prefetch_executor().submit(context.run, _lookup_in_worker, terms, lang)
+    return TranslationPrefetch(frozenset(terms), future)
+
+
+def resolve_translation_prefetch(
+    prefetch: Optional[TranslationPrefetch], values_to_translate: List[Any]
+) -> Tuple[Dict[str, str], List[Any]]:
+    """
+    Wait for a prefetch and split the values of a search into the translations
+    it already found and the values that still have to be looked up.
+    """
+    if prefetch is None:
+        return {}, values_to_translate
+
+    try:
+        prefetched = prefetch.future.result(
+            timeout=toolkit.asint(
+                config.get(SEARCH_PREFETCH_TIMEOUT_CONFIG, DEFAULT_SEARCH_PREFETCH_TIMEOUT)
+            )
+        )
+    except Exception:
+        log.warning("Translation prefetch failed, looking up all terms", exc_info=True)
+        return {}, values_to_translate
+
+    remaining = [
+        value
+        for value in values_to_translate
+        if not (isinstance(value, str) and value in prefetch.terms)
+    ]
+    return prefetched, remaining
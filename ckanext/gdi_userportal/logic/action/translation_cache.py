@@ -0,0 +1,665 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Caches for term translation lookups.
+
+Three strategies are available, all disabled by default:
+
+- ``TranslationCache`` caches translations per ``(term, lang_code)`` in a
+  bounded LRU mapping whose entries expire after a configurable TTL::
+
+    ckanext.gdi_userportal.translation_cache.enabled = true
+
+- ``TranslationSnapshot`` holds the complete ``term_translation`` table for
+  the supported languages in an immutable mapping, loaded once per worker and
+  answering every lookup from memory::
+
+    ckanext.gdi_userportal.translation_snapshot.enabled = true
+
+- ``RedisTranslationCache`` shares translations between all workers through
+  CKAN's Redis, stored as one hash per language so a single pipelined
+  ``HMGET`` resolves a whole page of terms::
+
+    ckanext.gdi_userportal.translation_cache.redis.enabled = true
+
+The process-local cache and the Redis cache can be stacked; the snapshot
+replaces both. All of them are dropped as soon as the translation generation reported by the
+migration runner changes, so running workers pick up
+``ckan gdi-userportal translations migrate`` without waiting for a TTL.
+"""
+
+from collections import OrderedDict
+from collections.abc import Mapping as MappingABC
+import logging
+import sys
+import threading
+import time
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from ckan.common import config
+from ckan.lib.redis import connect_to_redis
+from ckan.plugins import toolkit
+
+log = logging.getLogger(__name__)
+
+CACHE_ENABLED_CONFIG = "ckanext.gdi_userportal.translation_cache.enabled"
+CACHE_MAX_SIZE_CONFIG = "ckanext.gdi_userportal.translation_cache.max_size"
+CACHE_TTL_CONFIG = "ckanext.gdi_userportal.translation_cache.ttl"
+GENERATION_POLL_INTERVAL_CONFIG = (
+    "ckanext.gdi_userportal.translation_cache.generation_poll_interval"
+)
+SNAPSHOT_ENABLED_CONFIG = "ckanext.gdi_userportal.translation_snapshot.enabled"
+SNAPSHOT_COMPACT_KEYS_CONFIG = "ckanext.gdi_userportal.translation_snapshot.compact_keys"
+REDIS_ENABLED_CONFIG = "ckanext.gdi_userportal.translation_cache.redis.enabled"
+REDIS_TTL_CONFIG = "ckanext.gdi_userportal.translation_cache.redis.ttl"
+UNTRANSLATED_MAX_SIZE_CONFIG = (
+    "ckanext.gdi_userportal.translation_cache.untranslated_max_size"
+)
+UNTRANSLATED_TTL_CONFIG = "ckanext.gdi_userportal.translation_cache.untranslated_ttl"
+
+DEFAULT_CACHE_MAX_SIZE = 20000
+DEFAULT_CACHE_TTL = 3600
+DEFAULT_GENERATION_POLL_INTERVAL = 30
+DEFAULT_REDIS_TTL = 86400
+DEFAULT_UNTRANSLATED_MAX_SIZE = 50000
+DEFAULT_UNTRANSLATED_TTL = 600
+REDIS_KEY_PREFIX = "ckanext-gdi_userportal:term_translation"
+
+TranslationKey = Tuple[str, str]
+TranslationFetcher = Callable[[List[str], Tuple[str, ...]], Dict[TranslationKey, str]]
+
+
+def intern_term(value: Any) -> Any:
+    """
+    Intern a vocabulary string so every long-lived structure holding it shares
+    one object. The same authority URIs come back from every database row and
+    search result; non-string values are returned unchanged.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_translations(
+    translations: Dict[TranslationKey, str]
+) -> Dict[TranslationKey, str]:
+    return {
+        (intern_term(term), intern_term(lang_code)): translation
+        for (term, lang_code), translation in translations.items()
+    }
+
+
+class TTLCache:
+    """Thread-safe LRU mapping whose entries expire after ``ttl`` seconds."""
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max(int(max_size), 0)
+        self.ttl = float(ttl)
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """Return the non-expired entries for ``keys``; misses are left out."""
+        now = self._clock()
+        hits = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                expires_at, value = entry
+                if expires_at <= now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                hits[key] = value
+        return hits
+
+    def set_many(self, items: Dict[Hashable, Any]) -> None:
+        if not self.max_size or not items:
+            return
+
+        expires_at = self._clock() + self.ttl
+        with self._lock:
+            for key, value in items.items():
+                self._entries[key] = (expires_at, value)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class GenerationWatcher:
+    """
+    Polls a generation loader at most every ``poll_interval`` seconds and
+    reports whether the value changed since the previous poll.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Any],
+        poll_interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._loader = loader
+        self.poll_interval = float(poll_interval)
+        self._clock = clock
+        self._generation: Any = None
+        self._next_poll = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> Any:
+        return self._generation
+
+    def poll(self) -> bool:
+        now = self._clock()
+        with self._lock:
+            if now < self._next_poll:
+                return False
+            self._next_poll = now + self.poll_interval
+
+        try:
+            generation = self._loader()
+        except Exception:
+            log.exception("Failed to load the term translation generation")
+            return False
+
+        with self._lock:
+            changed = generation != self._generation
+            self._generation = generation
+        return changed
+
+
+class TranslationCache:
+    """
+    Caches ``(term, lang_code) -> translation`` pairs in front of a fetcher.
+
+    Pairs the fetcher did not return are remembered in the optional
+    ``untranslated`` cache, so free-form values without any translation row
+    stop being sent to the database on every request.
+    """
+
+    def __init__(
+        self,
+        entries: TTLCache,
+        watcher: Optional[GenerationWatcher] = None,
+        untranslated: Optional[TTLCache] = None,
+    ):
+        self.entries = entries
+        self.watcher = watcher
+        self.untranslated = untranslated
+
+    def lookup(
+        self,
+        terms: List[str],
+        lang_codes: Tuple[str, ...],
+        fetch: TranslationFetcher,
+    ) -> Dict[TranslationKey, str]:
+        if self.watcher is not None and self.watcher.poll():
+            self.clear()
+
+        keys = [(term, lang_code) for term in terms for lang_code in lang_codes]
+        found = self.entries.get_many(keys)
+
+        unresolved = [key for key in keys if key not in found]
+        if self.untranslated is not None and unresolved:
+            known_untranslated = self.untranslated.get_many(unresolved)
+            unresolved = [key for key in unresolved if key not in known_untranslated]
+
+        missing_terms = list(dict.fromkeys(term for term, _ in unresolved))
+        if missing_terms:
+            fetched = _intern_translations(fetch(missing_terms, lang_codes))
+            self.entries.set_many(fetched)
+            if self.untranslated is not None:
+                self.untranslated.set_many(
+                    {
+                        (intern_term(term), lang_code): True
+                        for term, lang_code in unresolved
+                        if (term, lang_code) not in fetched
+                    }
+                )
+            found.update(fetched)
+
+        return found
+
+    def clear(self) -> None:
+        self.entries.clear()
+        if self.untranslated is not None:
+            self.untranslated.clear()
+
+
+class RedisTranslationCache:
+    """
+    Shares ``(term, lang_code) -> translation`` pairs between workers.
+
+    Translations live in one Redis hash per language and generation, e.g.
+    ``ckanext-gdi_userportal:term_translation:<generation>:nl``. Terms known
+    to have no translation are kept in a sibling ``...:nl:untranslated`` hash
+    with its own, usually shorter, TTL. A new generation therefore starts with
+    empty hashes while the old ones expire. Redis errors are logged and the
+    lookup falls back to the fetcher.
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[], Any],
+        ttl: int,
+        watcher: Optional[GenerationWatcher] = None,
+        untranslated_ttl: int = 0,
+    ):
+        self._client_factory = client_factory
+        self.ttl = int(ttl)
+        self.watcher = watcher
+        self.untranslated_ttl = int(untranslated_ttl)
+
+    def _key(self, lang_code: str) -> str:
+        generation = self.watcher.generation if self.watcher is not None else None
+        return f"{REDIS_KEY_PREFIX}:{generation or 0}:{lang_code}"
+
+    def _untranslated_key(self, lang_code: str) -> str:
+        return f"{self._key(lang_code)}:untranslated"
+
+    def lookup(
+        self,
+        terms: List[str],
+        lang_codes: Tuple[str, ...],
+        fetch: TranslationFetcher,
+    ) -> Dict[TranslationKey, str]:
+        if not terms:
+            return {}
+        if self.watcher is not None:
+            self.watcher.poll()
+
+        lang_codes = tuple(dict.fromkeys(lang_codes))
+        try:
+            client = self._client_factory()
+            pipeline = client.pipeline(transaction=False)
+            for lang_code in lang_codes:
+                pipeline.hmget(self._key(lang_code), terms)
+            if self.untranslated_ttl:
+                for lang_code in lang_codes:
+                    pipeline.hmget(self._untranslated_key(lang_code), terms)
+            replies = pipeline.execute()
+        except Exception:
+            log.warning("Redis term translation lookup failed", exc_info=True)
+            return fetch(terms, lang_codes)
+
+        values_per_lang = replies[: len(lang_codes)]
+        untranslated_per_lang = replies[len(lang_codes):] or [
+            [None] * len(terms) for _ in lang_codes
+        ]
+
+        found = {}
+        unresolved = []
+        for lang_code, values, untranslated in zip(
+            lang_codes, values_per_lang, untranslated_per_lang
+        ):
+            for term, value, is_untranslated in zip(terms, values, untranslated):
+                if value is not None:
+                    found[(term, lang_code)] = _decode(value)
+                elif is_untranslated is None:
+                    unresolved.append((term, lang_code))
+
+        missing_terms = list(dict.fromkeys(term for term, _ in unresolved))
+        if missing_terms:
+            fetched = fetch(missing_terms, lang_codes)
+            found.update(fetched)
+            self._store(fetched, [key for key in unresolved if key not in fetched])
+
+        return found
+
+    def _store(
+        self,
+        translations: Dict[TranslationKey, str],
+        untranslated: List[TranslationKey],
+    ) -> None:
+        by_key: Dict[Tuple[str, int], Dict[str, str]] = {}
+        for (term, lang_code), translation in translations.items():
+            by_key.setdefault((self._key(lang_code), self.ttl), {})[term] = translation
+        if self.untranslated_ttl:
+            for term, lang_code in untranslated:
+                key = (self._untranslated_key(lang_code), self.untranslated_ttl)
+                by_key.setdefault(key, {})[term] = "1"
+        if not by_key:
+            return
+
+        try:
+            pipeline = self._client_factory().pipeline(transaction=False)
+            for (key, ttl), mapping in by_key.items():
+                pipeline.hset(key, mapping=mapping)
+                pipeline.expire(key, ttl)
+            pipeline.execute()
+        except Exception:
+            log.warning("Failed to store term translations in Redis", exc_info=True)
+
+
+def _decode(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+_MISSING = object()
+
+
+class PrefixKeyStore(MappingABC):
+    """
+    Read-only ``str`` keyed mapping storing each key as a shared prefix plus a
+    suffix.
+
+    Keys are split after their last ``/``, so the thousands of authority URIs
+    under ``http://publications.europa.eu/resource/authority/language/`` or
+    ``https://www.iana.org/assignments/media-types/application/`` keep a single
+    copy of their prefix and only their short suffix per entry. A lookup is one
+    ``rfind`` and two dict lookups.
+    """
+
+    __slots__ = ("_buckets", "_len")
+
+    def __init__(self, items: Any = ()):
+        if isinstance(items, MappingABC):
+            items = items.items()
+
+        buckets: Dict[str, Dict[str, Any]] = {}
+        for key, value in items:
+            split = key.rfind("/") + 1
+            buckets.setdefault(intern_term(key[:split]), {})[key[split:]] = value
+        self._buckets = buckets
+        self._len = sum(len(bucket) for bucket in buckets.values())
+
+    def __getitem__(self, key: str) -> Any:
+        if type(key) is str:
+            split = key.rfind("/") + 1
+            bucket = self._buckets.get(key[:split])
+            if bucket is not None and key[split:] in bucket:
+                return bucket[key[split:]]
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if type(key) is not str:
+            return default
+        split = key.rfind("/") + 1
+        bucket = self._buckets.get(key[:split])
+        if bucket is None:
+            return default
+        return bucket.get(key[split:], default)
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __iter__(self):
+        for prefix, bucket in self._buckets.items():
+            for suffix in bucket:
+                yield prefix + suffix
+
+    def __len__(self) -> int:
+        return self._len
+
+    def items(self):
+        return (
+            (prefix + suffix, value)
+            for prefix, bucket in self._buckets.items()
+            for suffix, value in bucket.items()
+        )
+
+
+def _frozen_mapping(items: Any) -> Mapping[str, Any]:
+    return MappingProxyType(dict(items))
+
+
+class TranslationSnapshot:
+    """
+    Immutable ``term -> {lang_code: translation}`` copy of term_translation.
+
+    With ``compact_keys`` the term keys are held in a ``PrefixKeyStore``,
+    trading some lookup speed for memory.
+    """
+
+    def __init__(
+        self, table: Mapping[str, Mapping[str, str]], compact_keys: bool = False
+    ):
+        self._mapping = PrefixKeyStore if compact_keys else _frozen_mapping
+        self._table = self._mapping(
+            (term, MappingProxyType(dict(by_lang))) for term, by_lang in table.items()
+        )
+        self._resolved: Dict[Tuple[str, ...], Mapping[str, str]] = {}
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[Dict[str, Any]], compact_keys: bool = False
+    ) -> "TranslationSnapshot":
+        table: Dict[str, Dict[str, str]] = {}
+        for row in rows:
+            term = row.get("term")
+            lang_code = row.get("lang_code")
+            translation = row.get("term_translation")
+            if not all(isinstance(value, str) for value in (term, lang_code, translation)):
+                continue
+            table.setdefault(term, {})[intern_term(lang_code)] = translation
+        return cls(table, compact_keys=compact_keys)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def lookup(
+        self, terms: Iterable[str], lang_codes: Tuple[str, ...]
+    ) -> Dict[TranslationKey, str]:
+        found = {}
+        for term in terms:
+            by_lang = self._table.get(term)
+            if not by_lang:
+                continue
+            for lang_code in lang_codes:
+                translation = by_lang.get(lang_code)
+                if translation is not None:
+                    found[(term, lang_code)] = translation
+        return found
+
+    def translations_for(self, term: str) -> List[str]:
+        return list(self._table.get(term, {}).values())
+
+    def resolved(self, lang_chain: Tuple[str, ...]) -> Mapping[str, str]:
+        """
+        Return ``term -> translation`` for a language fallback chain, taking
+        for each term the first language in the chain that has a translation.
+        Built once per distinct chain.
+        """
+        resolved = self._resolved.get(lang_chain)
+        if resolved is None:
+            merged = {}
+            for term, by_lang in self._table.items():
+                for lang_code in lang_chain:
+                    translation = by_lang.get(lang_code)
+                    if translation is not None:
+                        merged[term] = translation
+                        break
+            resolved = self._resolved.setdefault(lang_chain, self._mapping(merged))
+        return resolved
+
+
+class SnapshotHolder:
+    """Loads a ``TranslationSnapshot`` lazily and reloads it on generation changes."""
+
+    def __init__(
+        self,
+        loader: Callable[[], TranslationSnapshot],
+        watcher: Optional[GenerationWatcher] = None,
+    ):
+        self._loader = loader
+        self.watcher = watcher
+        self._snapshot: Optional[TranslationSnapshot] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> TranslationSnapshot:
+        changed = self.watcher is not None and self.watcher.poll()
+        if self._snapshot is None or changed:
+            with self._lock:
+                if self._snapshot is None or changed:
+                    self._snapshot = self._loader()
+                    log.info(
+                        "Loaded term translation snapshot with %d terms",
+                        len(self._snapshot),
+                    )
+        return self._snapshot
+
+
+_translation_cache: Optional[TranslationCache] = None
+_redis_translation_cache: Optional[RedisTranslationCache] = None
+_translation_snapshot: Optional[SnapshotHolder] = None
+_generation_watcher: Optional[GenerationWatcher] = None
+_translation_cache_lock = threading.Lock()
+
+
+def is_translation_cache_enabled() -> bool:
+    return toolkit.asbool(config.get(CACHE_ENABLED_CONFIG, False))
+
+
+def is_translation_snapshot_enabled() -> bool:
+    return toolkit.asbool(config.get(SNAPSHOT_ENABLED_CONFIG, False))
+
+
+def is_redis_translation_cache_enabled() -> bool:
+    return toolkit.asbool(config.get(REDIS_ENABLED_CONFIG, False))
+
+
+def _load_translation_generation() -> Any:
+    from ckanext.gdi_userportal.migrations import get_translation_generation
+
+    return get_translation_generation()
+
+
+def _build_generation_watcher() -> GenerationWatcher:
+    return GenerationWatcher(
+        _load_translation_generation,
+        poll_interval=toolkit.asint(
+            config.get(GENERATION_POLL_INTERVAL_CONFIG, DEFAULT_GENERATION_POLL_INTERVAL)
+        ),
+    )
+
+
+def _build_translation_cache() -> TranslationCache:
+    entries = TTLCache(
+        max_size=toolkit.asint(config.get(CACHE_MAX_SIZE_CONFIG, DEFAULT_CACHE_MAX_SIZE)),
+        ttl=toolkit.asint(config.get(CACHE_TTL_CONFIG, DEFAULT_CACHE_TTL)),
+    )
+    untranslated = TTLCache(
+        max_size=toolkit.asint(
+            config.get(UNTRANSLATED_MAX_SIZE_CONFIG, DEFAULT_UNTRANSLATED_MAX_SIZE)
+        ),
+        ttl=_untranslated_ttl(),
+    )
+    return TranslationCache(entries, _build_generation_watcher(), untranslated)
+
+
+def _untranslated_ttl() -> int:
+    return toolkit.asint(config.get(UNTRANSLATED_TTL_CONFIG, DEFAULT_UNTRANSLATED_TTL))
+
+
+def _load_translation_snapshot(lang_codes: Tuple[str, ...]) -> TranslationSnapshot:
+    # An empty term list makes term_translation_show return every row for
+    # the requested languages.
+    rows = toolkit.get_action("term_translation_show")(
+        {}, {"terms": [], "lang_codes": lang_codes}
+    )
+    return TranslationSnapshot.from_rows(
+        rows,
+        compact_keys=toolkit.asbool(config.get(SNAPSHOT_COMPACT_KEYS_CONFIG, False)),
+    )
+
+
+def get_translation_cache() -> TranslationCache:
+    global _translation_cache
+
+    if _translation_cache is None:
+        with _translation_cache_lock:
+            if _translation_cache is None:
+                _translation_cache = _build_translation_cache()
+    return _translation_cache
+
+
+def get_redis_translation_cache() -> RedisTranslationCache:
+    global _redis_translation_cache
+
+    if _redis_translation_cache is None:
+        with _translation_cache_lock:
+            if _redis_translation_cache is None:
+                _redis_translation_cache = RedisTranslationCache(
+                    connect_to_redis,
+                    ttl=toolkit.asint(config.get(REDIS_TTL_CONFIG, DEFAULT_REDIS_TTL)),
+                    watcher=_build_generation_watcher(),
+                    untranslated_ttl=_untranslated_ttl(),
+                )
+    return _redis_translation_cache
+
+
+def get_translation_snapshot(lang_codes: Iterable[str]) -> TranslationSnapshot:
+    global _translation_snapshot
+
+    if _translation_snapshot is None:
+        lang_codes = tuple(sorted(lang_codes))
+        with _translation_cache_lock:
+            if _translation_snapshot is None:
+                _translation_snapshot = SnapshotHolder(
+                    lambda: _load_translation_snapshot(lang_codes),
+                    _build_generation_watcher(),
+                )
+    return _translation_snapshot.get()
+
+
+def get_current_translation_generation() -> Any:
+    """Return the translation generation, polled at most once per interval."""
+    global _generation_watcher
+
+    if _generation_watcher is None:
+        with _translation_cache_lock:
+            if _generation_watcher is None:
+                _generation_watcher = _build_generation_watcher()
+    _generation_watcher.poll()
+    return _generation_watcher.generation
+
+
+def reset_translation_cache() -> None:
+    """Drop the process-local caches; they are rebuilt from config on next use."""
+    global _translation_cache, _redis_translation_cache, _translation_snapshot
+    global _generation_watcher
+
+    with _translation_cache_lock:
+        _translation_cache = None
+        _redis_translation_cache = None
+        _translation_snapshot = None
+        _generation_watcher = None
+
+
+def invalidate_translation_caches() -> int:
+    """
+    Bump the translation generation after term_translation changed and drop
+    this worker's caches. Other workers notice the new generation on their
+    next poll.
+    """
+    from ckanext.gdi_userportal.migrations import bump_translation_generation
+
+    generation = bump_translation_generation()
+    reset_translation_cache()
+    return generation
@@ -0,0 +1,312 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compiled, memory-mapped term translation dictionary.
+
+``ckan gdi-userportal translations compile`` writes the ``term_translation``
+rows for the supported languages to a compact file sorted by term. Web
+workers memory-map that file, so all of them share one page-cached copy and
+answer lookups with a binary search instead of a database query. Enable it
+with::
+
+    ckanext.gdi_userportal.translation_compiled.path = /srv/app/data/translations.bin
+
+File layout (all integers little-endian)::
+
+    header   magic (8 bytes), generation (u64), language count (u32),
+             term count (u32)
+    langs    per language: length (u8) + ASCII language code
+    offsets  term count + 1 record offsets (u32), relative to the records
+    records  per term, sorted by UTF-8 bytes: term, then one translation per
+             language in header order, each terminated by a NUL byte; an empty
+             translation means there is none for that language
+"""
+
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ckan.common import config
+from ckan.plugins import toolkit
+
+from ckanext.gdi_userportal.logic.action.translation_cache import (
+    DEFAULT_GENERATION_POLL_INTERVAL,
+    GENERATION_POLL_INTERVAL_CONFIG,
+    TranslationKey,
+    get_current_translation_generation,
+)
+
+log = logging.getLogger(__name__)
+
+COMPILED_PATH_CONFIG = "ckanext.gdi_userportal.translation_compiled.path"
+
+MAGIC = b"GDITRN01"
+HEADER = struct.Struct("<8sQII")
+OFFSET = struct.Struct("<I")
+SEPARATOR = b"\x00"
+
+
+def write_compiled_translations(
+    path: str,
+    rows: Iterable[Dict[str, Any]],
+    lang_codes: Iterable[str],
+    generation: int = 0,
+) -> int:
+    """
+    Write ``term_translation`` rows to ``path`` atomically.
+
+    Returns:
+        Number of terms written
+    """
+    lang_codes = tuple(sorted(lang_codes))
+    table: Dict[bytes, Dict[str, bytes]] = {}
+    for row in rows:
+        term = row.get("term")
+        lang_code = row.get("lang_code")
+        translation = row.get("term_translation")
+        if lang_code not in lang_codes:
+            continue
+        if not isinstance(term, str) or not isinstance(translation, str):
+            continue
+        if not term or not translation or "\x00" in term or "\x00" in translation:
+            continue
+        table.setdefault(term.encode("utf-8"), {})[lang_code] = translation.encode("utf-8")
+
+    records = []
+    offsets = [0]
+    for term in sorted(table):
+        by_lang = table[term]
+        record = SEPARATOR.join(
+            [term] + [by_lang.get(lang_code, b"") for lang_code in lang_codes]
+        ) + SEPARATOR
+        records.append(record)
+        offsets.append(offsets[-1] + len(record))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".translations-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(HEADER.pack(MAGIC, int(generation), len(lang_codes), len(records)))
+            for lang_code in lang_codes:
+                encoded = lang_code.encode("ascii")
+                f.write(struct.pack("<B", len(encoded)) + encoded)
+            f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+            f.writelines(records)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    return len(records)
+
+
+class CompiledTranslations:
+    """Read-only view on a compiled translation file."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.generation, lang_count, self._count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a compiled translation file")
+
+        position = HEADER.size
+        lang_codes = []
+        for _ in range(lang_count):
+            length = self._mmap[position]
+            lang_codes.append(self._mmap[position + 1:position + 1 + length].decode("ascii"))
+            position += 1 + length
+        self.lang_codes: Tuple[str, ...] = tuple(lang_codes)
+
+        self._offsets_start = position
+        self._records_start = position + OFFSET.size * (self._count + 1)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def _record_bounds(self, index: int) -> Tuple[int, int]:
+        start, end = struct.unpack_from(
+            "<2I", self._mmap, self._offsets_start + OFFSET.size * index
+        )
+        return self._records_start + start, self._records_start + end
+
+    def _find(self, term: bytes) -> Optional[Tuple[int, int]]:
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            start, end = self._record_bounds(middle)
+            term_end = self._mmap.find(SEPARATOR, start, end)
+            candidate = self._mmap[start:term_end]
+            if candidate < term:
+                low = middle + 1
+            elif candidate > term:
+                high = middle
+            else:
+                return term_end + 1, end
+        return None
+
+    def get(self, term: str) -> Dict[str, str]:
+        """Return ``lang_code -> translation`` for ``term``."""
+        bounds = self._find(term.encode("utf-8"))
+        if bounds is None:
+            return {}
+
+        start, end = bounds
+        translations = self._mmap[start:end - 1].split(SEPARATOR)
+        return {
+            lang_code: translation.decode("utf-8")
+            for lang_code, translation in zip(self.lang_codes, translations)
+            if translation
+        }
+
+    def lookup(
+        self, terms: Iterable[Any], lang_codes: Tuple[str, ...]
+    ) -> Dict[TranslationKey, str]:
+        found = {}
+        for term in dict.fromkeys(terms):
+            if not isinstance(term, str) or not term:
+                continue
+            by_lang = self.get(term)
+            for lang_code in lang_codes:
+                translation = by_lang.get(lang_code)
+                if translation is not None:
+                    found[(term, lang_code)] = translation
+        return found
+
+
+class CompiledTranslationsHolder:
+    """
+    Keeps a compiled translation file open and reopens it when it is replaced
+    on disk. The file is ignored while it is older than the current
+    translation generation.
+    """
+
+    def __init__(self, path: str, check_interval: float):
+        self.path = path
+        self.check_interval = float(check_interval)
+        self._compiled: Optional[CompiledTranslations] = None
+        self._stat: Optional[Tuple[int, int, int]] = None
+        self._next_check = 0.0
+        self._warned_generation: Any = None
+        self._lock = threading.Lock()
+
+    def _reopen_if_changed(self) -> None:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            if self._compiled is not None:
+                log.warning("Compiled translation file %s disappeared", self.path)
+            self._compiled, self._stat = None, None
+            return
+
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if signature == self._stat:
+            return
+
+        try:
+            compiled = CompiledTranslations(self.path)
+        except (OSError, ValueError, struct.error):
+            log.exception("Could not open compiled translation file %s", self.path)
+            compiled = None
+        self._compiled, self._stat = compiled, signature
+        if compiled is not None:
+            log.info(
+                "Loaded compiled translations %s (%d terms, generation %s)",
+                self.path,
+                len(compiled),
+                compiled.generation,
+            )
+
+    def get(self) -> Optional[CompiledTranslations]:
+        now = time.monotonic()
+        if now >= self._next_check:
+            with self._lock:
+                if now >= self._next_check:
+                    self._reopen_if_changed()
+                    self._next_check = now + self.check_interval
+
+        compiled = self._compiled
+        if compiled is None:
+            return None
+
+        generation = get_current_translation_generation()
+        if generation is not None and compiled.generation < generation:
+            if self._warned_generation != generation:
+                self._warned_generation = generation
+                log.warning(
+                    "Compiled translations %s are at generation %s but the database "
+                    "is at %s; run 'ckan gdi-userportal translations compile'",
+                    self.path,
+                    compiled.generation,
+                    generation,
+                )
+            return None
+        return compiled
+
+
+_compiled_holder: Optional[CompiledTranslationsHolder] = None
+_compiled_holder_lock = threading.Lock()
+
+
+def get_compiled_translations_path() -> Optional[str]:
+    return config.get(COMPILED_PATH_CONFIG) or None
+
+
+def get_compiled_translations() -> Optional[CompiledTranslations]:
+    """Return the configured compiled translations, or None when unavailable."""
+    global _compiled_holder
+
+    path = get_compiled_translations_path()
+    if not path:
+        return None
+
+    if _compiled_holder is None or _compiled_holder.path != path:
+        with _compiled_holder_lock:
+            if _compiled_holder is None or _compiled_holder.path != path:
+                _compiled_holder = CompiledTranslationsHolder(
+                    path,
+                    check_interval=toolkit.asint(
+                        config.get(
+                            GENERATION_POLL_INTERVAL_CONFIG,
+                            DEFAULT_GENERATION_POLL_INTERVAL,
+                        )
+                    ),
+                )
+    return _compiled_holder.get()
+
+
+def reset_compiled_translations() -> None:
+    """Drop the open compiled file; it is reopened on the next lookup."""
+    global _compiled_holder
+
+    with _compiled_holder_lock:
+        _compiled_holder = None
+
+
+def compile_translations(path: str, lang_codes: Iterable[str]) -> int:
+    """Write the term_translation table for ``lang_codes`` to ``path``."""
+    from ckanext.gdi_userportal.migrations import get_translation_generation
+
+    lang_codes = tuple(sorted(lang_codes))
+    generation = get_translation_generation()
+    # An empty term list makes term_translation_show return every row for
+    # the requested languages.
+    rows: List[Dict[str, Any]] = toolkit.get_action("term_translation_show")(
+        {}, {"terms": [], "lang_codes": lang_codes}
+    )
+    return write_compiled_translations(path, rows, lang_codes, generation)
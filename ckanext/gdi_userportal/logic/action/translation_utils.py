@@ -4,14 +4,28 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 import logging
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 from ckan.common import config
 
 # -*- coding: utf-8 -*-
 from ckan.plugins import toolkit
+from ckanext.scheming.helpers import scheming_dataset_schemas
+import yaml
+
+from ckanext.gdi_userportal.logic.action.translation_cache import (
+    get_redis_translation_cache,
+    get_translation_cache,
+    get_translation_snapshot,
+    is_redis_translation_cache_enabled,
+    is_translation_cache_enabled,
+    is_translation_snapshot_enabled,
+)
+from ckanext.gdi_userportal.logic.action.translation_compiled import get_compiled_translations
 
 PACKAGE_REPLACE_FIELDS = [
     "access_rights",
@@ -80,6 +94,9 @@ NESTED_FIELD_TRANSLATIONS = {
 }
 
 TRANSLATED_SUFFIX = "_translated"
+# Context flag for callers that own the package dicts they translate.
+IN_PLACE_CONTEXT_KEY = "translate_in_place"
+BUNDLED_SCHEMAS_DIR = Path(__file__).resolve().parents[2] / "scheming" / "schemas"
 LANGUAGE_VALUE_FIELDS = {
     "population_coverage",
     "publisher_note",
@@ -102,37 +119,144 @@ log = logging.getLogger(__name__)
 
 @dataclass
 class ValueLabel:
+    """
+    Shape of a translated value. Translation builds the equivalent dict
+    directly, see :func:`_value_label`.
+    """
+
     name: str
     display_name: str
     count: int = None
 
 
+def _value_label(name: Any, display_name: Any) -> Dict[str, Any]:
+    # A dict literal instead of ``ValueLabel(...).__dict__`` saves the
+    # throwaway instance per value.
+    return {"name": name, "display_name": display_name, "count": None}
+
+
+@dataclass(frozen=True)
+class FieldPlan:
+    """A field to translate and, for nested fields, the sub-fields to follow."""
+
+    name: str
+    nested: Optional[Tuple["FieldPlan", ...]] = None
+
+
+@dataclass(frozen=True)
+class TranslationPlan:
+    package: Tuple[FieldPlan, ...]
+    resource: Tuple[FieldPlan, ...]
+    access_service: Tuple[FieldPlan, ...]
+
+
+def _compile_field_plan(field: str, nested_fields: Dict[str, Any]) -> FieldPlan:
+    if field not in nested_fields:
+        return FieldPlan(field)
+    return FieldPlan(
+        field,
+        tuple(
+            _compile_field_plan(nested_field, nested_fields)
+            for nested_field in sorted(nested_fields[field])
+        ),
+    )
+
+
+def compile_translation_plan(
+    package_fields: List[str] = PACKAGE_REPLACE_FIELDS,
+    resource_fields: List[str] = RESOURCE_REPLACE_FIELDS,
+    access_service_fields: List[str] = ACCESS_SERVICES_REPLACE_FIELDS,
+    nested_fields: Dict[str, Any] = NESTED_FIELD_TRANSLATIONS,
+) -> TranslationPlan:
+    """
+    Resolves the replace-field lists and the nested-field map into explicit
+    field trees, so collection and replacement follow the plan instead of
+    looking fields up in ``NESTED_FIELD_TRANSLATIONS`` at every level.
+    """
+    return TranslationPlan(
+        package=tuple(_compile_field_plan(field, nested_fields) for field in package_fields),
+        resource=tuple(_compile_field_plan(field, nested_fields) for field in resource_fields),
+        access_service=tuple(
+            _compile_field_plan(field, nested_fields) for field in access_service_fields
+        ),
+    )
+
+
+TRANSLATION_PLAN = compile_translation_plan()
+
+
 def get_translations(values_to_translate: List, lang: Optional[str] = DEFAULT_FALLBACK_LANG) -> Dict[str, str]:
     """Calls term_translation_show action with a list of values to translate"""
-    pref_language = get_preferred_language(lang)
+    if not any(isinstance(value, str) and value for value in values_to_translate):
+        # term_translation_show returns the whole table for an empty term list.
+        return {}
+
+    lang_chain = get_language_chain(lang)
+
+    compiled = get_compiled_translations()
+    if compiled is not None:
+        return _resolve_translations(compiled.lookup(values_to_translate, lang_chain), lang_chain)
+
+    if is_translation_snapshot_enabled():
+        resolved = get_translation_snapshot(SUPPORTED_LANGUAGES).resolved(lang_chain)
+        return {
+            value: resolved[value]
+            for value in values_to_translate
+            if isinstance(value, str) and value in resolved
+        }
+
+    translation_table = _lookup_term_translations(values_to_translate, lang_chain)
+    return _resolve_translations(translation_table, lang_chain)
+
 
+def _resolve_translations(
+    translation_table: Dict[Tuple[str, str], str], lang_chain: Tuple[str, ...]
+) -> Dict[str, str]:
+    """Pick, per term, the translation of the earliest language in the chain."""
+    rank = {lang_code: position for position, lang_code in enumerate(lang_chain)}
+    best: Dict[str, Tuple[int, str]] = {}
+    for (term, lang_code), term_translation in translation_table.items():
+        position = rank.get(lang_code)
+        if position is None:
+            continue
+        current = best.get(term)
+        if current is None or position < current[0]:
+            best[term] = (position, term_translation)
+    return {term: term_translation for term, (_, term_translation) in best.items()}
+
+
+def _lookup_term_translations(values: List, lang_codes: Tuple[str, ...]) -> Dict[Tuple[str, str], str]:
+    redis_enabled = is_redis_translation_cache_enabled()
+    local_enabled = is_translation_cache_enabled()
+    if not redis_enabled and not local_enabled:
+        return _fetch_term_translations(values, lang_codes)
+
+    # Cache layers are consulted from the closest to the furthest away:
+    # process-local cache, then Redis, then the database.
+    fetch = _fetch_term_translations
+    if redis_enabled:
+        fetch = partial(get_redis_translation_cache().lookup, fetch=fetch)
+    if local_enabled:
+        fetch = partial(get_translation_cache().lookup, fetch=fetch)
+
+    terms = list(dict.fromkeys(value for value in values if isinstance(value, str) and value))
+    return fetch(terms, lang_codes)
+
+
+def _fetch_term_translations(terms: List, lang_codes: Tuple[str, ...]) -> Dict[Tuple[str, str], str]:
     translation_table = toolkit.get_action("term_translation_show")(
         {},
         {
-            "terms": values_to_translate,
-            "lang_codes": (pref_language, DEFAULT_FALLBACK_LANG),
+            "terms": terms,
+            "lang_codes": lang_codes,
         },
     )
 
-    # First fill the dictionary with the fallback language
-    translations = {
-        transl_item["term"]: transl_item["term_translation"]
+    return {
+        (transl_item["term"], transl_item["lang_code"]): transl_item["term_translation"]
         for transl_item in translation_table
-        if (transl_item["lang_code"] == DEFAULT_FALLBACK_LANG)
     }
 
-    # Override with preferred language
-    for transl_item in translation_table:
-        if transl_item["lang_code"] == pref_language:
-            translations[transl_item["term"]] = transl_item["term_translation"]
-
-    return translations
-
 
 def get_request_language() -> Optional[str]:
     try:
@@ -160,11 +284,27 @@ def _deduplicate_non_empty_strings(values: List[Any]) -> List[str]:
 
 
 def get_all_translations(values_to_translate: List[Any]) -> Dict[str, List[str]]:
-    """Return all known translations for each term, grouped by term."""
+    """
+    Return all known translations for each term, grouped by term.
+
+    With the translation snapshot enabled only the supported languages are
+    considered.
+    """
     terms = _deduplicate_non_empty_strings(values_to_translate)
     if not terms:
         return {}
 
+    if is_translation_snapshot_enabled():
+        snapshot = get_translation_snapshot(SUPPORTED_LANGUAGES)
+        all_translations = {}
+        for term in terms:
+            translated_values = _deduplicate_non_empty_strings(
+                snapshot.translations_for(term)
+            )
+            if translated_values:
+                all_translations[term] = translated_values
+        return all_translations
+
     translation_table = toolkit.get_action("term_translation_show")(
         {},
         {"terms": terms},
@@ -201,22 +341,57 @@ def _normalize_language(lang_value: Any) -> str:
     return primary.lower()
 
 
-def get_preferred_language(lang: Optional[str]) -> str:
+@lru_cache(maxsize=512)
+def _parse_accept_language(header: str) -> Tuple[str, ...]:
     """
-    Tries to get default language from environment variables/ckan config, defaults to English
+    Return the primary language subtags of an Accept-Language header, ordered
+    by descending q-value and then by position. Memoized per header value.
+    """
+    weighted = []
+    for position, part in enumerate(header.split(",")):
+        tag, _, params = part.partition(";")
+        language = _normalize_language(tag)
+        if not language or language == "*":
+            continue
+
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality <= 0:
+            continue
+        weighted.append((-quality, position, language))
+
+    return tuple(dict.fromkeys(language for _, _, language in sorted(weighted)))
+
+
+def get_language_chain(lang: Optional[str]) -> Tuple[str, ...]:
     """
-    language = _normalize_language(lang)
+    Returns the supported languages to try, most preferred first and always
+    ending with the default fallback language.
+    """
+    languages = _parse_accept_language(lang) if isinstance(lang, str) else ()
 
-    if not language:
+    if not languages:
         log.warning(
             "Could not determine preferred language from request headers, falling back to CKAN config"
         )
-        language = _normalize_language(config.get("ckan.locale_default"))
+        languages = (_normalize_language(config.get("ckan.locale_default")),)
 
-    if language not in SUPPORTED_LANGUAGES:
-        language = DEFAULT_FALLBACK_LANG
+    chain = [language for language in languages if language in SUPPORTED_LANGUAGES]
+    chain.append(DEFAULT_FALLBACK_LANG)
+    return tuple(dict.fromkeys(chain))
 
-    return language
+
+def get_preferred_language(lang: Optional[str]) -> str:
+    """
+    Tries to get default language from environment variables/ckan config, defaults to English
+    """
+    return get_language_chain(lang)[0]
 
 
 def _get_language(lang: str) -> str:
@@ -224,39 +399,29 @@ def _get_language(lang: str) -> str:
 
 
 def _select_and_append_values(
-    data_item: Dict, fields_list: List, target_list: List
+    data_item: Dict, field_plans: Tuple[FieldPlan, ...], target_list: List
 ) -> List:
-    for key, value in data_item.items():
-        if key in fields_list:
-            target_list = _collect_values_for_field(key, value, target_list)
+    for plan in field_plans:
+        if plan.name in data_item:
+            target_list = _collect_values_for_field(plan, data_item[plan.name], target_list)
     return target_list
 
 
-def _collect_values_for_field(field: str, value: Any, target_list: List) -> List:
+def _collect_values_for_field(plan: FieldPlan, value: Any, target_list: List) -> List:
     if value is None:
         return target_list
 
-    nested_fields = NESTED_FIELD_TRANSLATIONS.get(field)
-
     if isinstance(value, list):
         for item in value:
-            if nested_fields and isinstance(item, dict):
-                for nested_field in nested_fields:
-                    if nested_field in item:
-                        target_list = _collect_values_for_field(
-                            nested_field, item[nested_field], target_list
-                        )
+            if plan.nested and isinstance(item, dict):
+                target_list = _select_and_append_values(item, plan.nested, target_list)
             else:
                 target_list = _append_atomic_value(item, target_list)
         return target_list
 
     if isinstance(value, dict):
-        if nested_fields:
-            for nested_field in nested_fields:
-                if nested_field in value:
-                    target_list = _collect_values_for_field(
-                        nested_field, value[nested_field], target_list
-                    )
+        if plan.nested:
+            target_list = _select_and_append_values(value, plan.nested, target_list)
         return target_list
 
     return _append_atomic_value(value, target_list)
@@ -277,49 +442,280 @@ def _append_atomic_value(value: Any, target_list: List) -> List:
     return target_list
 
 
-def collect_values_to_translate(data: Any) -> List:
+def parse_field_list(fl: Any) -> Optional[List[str]]:
+    """
+    Parses an ``fl`` projection given as a list or as a comma or space
+    separated string. Returns None when all fields are requested.
+    """
+    if fl is None or fl == "":
+        return None
+    if isinstance(fl, str):
+        fl = fl.replace(",", " ").split()
+    if not isinstance(fl, (list, tuple)) or not all(isinstance(field, str) for field in fl):
+        raise toolkit.ValidationError({"fl": ["Must be a list of field names"]})
+    fields = [field.strip() for field in fl if field.strip()]
+    return list(dict.fromkeys(fields)) or None
+
+
+def parse_include_resources(data_dict: Dict) -> bool:
+    """Pops the ``include_resources`` search parameter, true by default."""
+    return toolkit.asbool(data_dict.pop("include_resources", True))
+
+
+def project_package(package: Dict, fields: List[str]) -> Dict:
+    """Keeps only ``fields`` of a package, plus their ``*_translated`` companions."""
+    projected = {}
+    for field in fields:
+        for key in (field, f"{field}{TRANSLATED_SUFFIX}"):
+            if key in package:
+                projected[key] = package[key]
+    return projected
+
+
+def _selected_fields(
+    field_plans: Tuple[FieldPlan, ...], fields: Optional[List[str]]
+) -> Tuple[FieldPlan, ...]:
+    if fields is None:
+        return field_plans
+    return tuple(plan for plan in field_plans if plan.name in fields)
+
+
+def _includes_resources(fields: Optional[List[str]], include_resources: bool = True) -> bool:
+    return include_resources and (fields is None or "resources" in fields)
+
+
+def collect_values_to_translate(
+    data: Any, fields: Optional[List[str]] = None, include_resources: bool = True
+) -> List:
     values_to_translate = []
     if not isinstance(data, List):
         data = [data]
+    package_fields = _selected_fields(TRANSLATION_PLAN.package, fields)
     for package in data:
         values_to_translate = _select_and_append_values(
-            package, PACKAGE_REPLACE_FIELDS, values_to_translate
+            package, package_fields, values_to_translate
         )
+        if not _includes_resources(fields, include_resources):
+            continue
         resources = package.get("resources", [])
         for resource in resources:
             values_to_translate = _select_and_append_values(
-                resource, RESOURCE_REPLACE_FIELDS, values_to_translate
+                resource, TRANSLATION_PLAN.resource, values_to_translate
             )
             access_services = resource.get("access_services", [])
             for access_service in access_services:
                 values_to_translate = _select_and_append_values(
-                    access_service, ACCESS_SERVICES_REPLACE_FIELDS, values_to_translate
+                    access_service, TRANSLATION_PLAN.access_service, values_to_translate
                 )
     return list(set(values_to_translate))
 
 
-def replace_package(data, translation_dict, lang: Optional[str] = None):
-    preferred_lang = get_preferred_language(lang)
+def collect_search_values_to_translate(
+    result: Dict, fields: Optional[List[str]] = None, include_resources: bool = True
+) -> List:
+    """
+    Values of a package_search result that need a translation: the package
+    fields plus every facet title and item name, so one lookup serves the
+    whole response.
+    """
+    values_to_translate = collect_values_to_translate(
+        result.get("results", []), fields=fields, include_resources=include_resources
+    )
+    values_to_translate.extend(collect_facet_values_to_translate(result.get("search_facets")))
+    return list(dict.fromkeys(values_to_translate))
+
+
+def collect_facet_values_to_translate(search_facets: Optional[Dict]) -> List:
+    """Every facet title and item name of a package_search result."""
+    values_to_translate = []
+    for facet in (search_facets or {}).values():
+        values_to_translate = _append_atomic_value(facet.get("title"), values_to_translate)
+        for item in facet.get("items", []):
+            values_to_translate = _append_atomic_value(item.get("name"), values_to_translate)
+    return values_to_translate
 
-    _apply_translated_properties(data, preferred_lang)
-    _merge_tags_translated_into_tags(data)
-    _normalize_tags_field(data)
 
-    data = _translate_fields(data, PACKAGE_REPLACE_FIELDS, translation_dict)
-    resources = data.get("resources", [])
+def translates_in_place(context: Optional[Dict[str, Any]]) -> bool:
+    return toolkit.asbool((context or {}).get(IN_PLACE_CONTEXT_KEY, False))
 
-    for resource in resources:
-        resource = _translate_fields(resource, RESOURCE_REPLACE_FIELDS, translation_dict)
-        access_services = resource.get("access_services", [])
-        resource["access_services"] = [
-            _translate_fields(access_service, ACCESS_SERVICES_REPLACE_FIELDS, translation_dict)
-            for access_service in access_services
-        ]
-    data["resources"] = resources
 
+def replace_package(
+    data,
+    translation_dict,
+    lang: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    include_resources: bool = True,
+    in_place: bool = False,
+):
+    """
+    Translates a package dict. With ``fields`` (see ``project_package``) only
+    those fields are translated and no missing field is added. Without
+    ``include_resources`` resources and their access services are left as
+    they are. See ``PackageTranslation`` for ``in_place``.
+    """
+    staged = PackageTranslation(
+        lang, fields=fields, include_resources=include_resources, in_place=in_place
+    )
+    staged.stage(data)
+    staged.patch(translation_dict)
     return data
 
 
+class PackageTranslation:
+    """
+    Translates packages in two phases with a single walk of each package.
+
+    ``stage`` prepares a package the way ``replace_package`` does and records
+    the slots (container and key) that will hold a ``ValueLabel``, together
+    with the terms to look up. Once the terms are translated, ``patch`` writes
+    the labels straight into those slots.
+
+    Every slot holding the same term gets the same label dict, so a page
+    allocates one label per distinct term. The labels are shared: copy one
+    before changing it.
+
+    Lists and nested dicts on the way to a label are copied, so objects the
+    package shares with its caller stay untouched. With ``in_place`` they are
+    written as they are, for callers that own the package and discard it
+    after the response.
+    """
+
+    def __init__(
+        self,
+        lang: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        include_resources: bool = True,
+        in_place: bool = False,
+    ):
+        self.preferred_lang = get_preferred_language(lang)
+        self.package_plan = _selected_fields(TRANSLATION_PLAN.package, fields)
+        self.include_resources = _includes_resources(fields, include_resources)
+        self.in_place = in_place
+        self._terms: Dict[str, None] = {}
+        self._slots: Dict[Any, List[Tuple[Any, Any, Any]]] = {}
+        self._current: List[Tuple[Any, Any, Any]] = []
+        self._labels: Dict[str, Dict[str, Any]] = {}
+        self._labels_source: Optional[Dict[str, str]] = None
+
+    @property
+    def values(self) -> List[str]:
+        """The distinct terms of all staged packages, in first-seen order."""
+        return list(self._terms)
+
+    def stage(self, data: Dict, key: Any = None) -> Dict:
+        """Prepare ``data`` for translation; ``key`` identifies it for ``patch``."""
+        self._current = self._slots.setdefault(len(self._slots) if key is None else key, [])
+
+        _apply_translated_properties(data, self.preferred_lang)
+        _merge_tags_translated_into_tags(data)
+        _normalize_tags_field(data)
+
+        self._stage_fields(data, self.package_plan)
+        if not self.include_resources:
+            return data
+
+        resources = data.get("resources", [])
+        for resource in resources:
+            self._stage_fields(resource, TRANSLATION_PLAN.resource)
+            access_services = resource.get("access_services", [])
+            for access_service in access_services:
+                self._stage_fields(access_service, TRANSLATION_PLAN.access_service)
+            if not self.in_place:
+                resource["access_services"] = list(access_services)
+        data["resources"] = resources
+        return data
+
+    def patch(self, translation_dict: Dict[str, str], key: Any = None) -> None:
+        """Write the labels of every staged package, or of the one staged as ``key``."""
+        if key is None:
+            slot_lists = list(self._slots.values())
+            self._slots.clear()
+        else:
+            slot_lists = [self._slots.pop(key, [])]
+
+        if translation_dict is not self._labels_source:
+            self._labels = {}
+            self._labels_source = translation_dict
+        labels = self._labels
+        for slots in slot_lists:
+            for container, slot, name in slots:
+                label = labels.get(name) if isinstance(name, str) else None
+                if label is None:
+                    label = _value_label(name, translation_dict.get(name, name))
+                    if isinstance(name, str):
+                        labels[name] = label
+                container[slot] = label
+
+    def _add(self, container: Any, slot: Any, name: Any) -> None:
+        self._current.append((container, slot, name))
+        if isinstance(name, str) and name:
+            self._terms[name] = None
+
+    def _writable(self, container: Any, slot: Any, copy: Callable[[Any], Any]) -> Any:
+        value = container[slot]
+        if not self.in_place:
+            value = container[slot] = copy(value)
+        return value
+
+    def _stage_fields(self, data: Dict, field_plans: Tuple[FieldPlan, ...]) -> None:
+        for plan in field_plans:
+            field = plan.name
+            value = data.get(field)
+            if value is None:
+                data[field] = None
+            elif plan.nested is not None:
+                self._stage_nested_field(plan, data, field)
+            elif isinstance(value, list):
+                labels = self._writable(data, field, list)
+                for index, item in enumerate(labels):
+                    self._add(labels, index, item)
+            else:
+                self._add(data, field, value)
+
+    def _stage_nested_field(self, plan: FieldPlan, container: Any, slot: Any) -> None:
+        value = container[slot]
+
+        if isinstance(value, list):
+            items = self._writable(container, slot, list)
+            for index, item in enumerate(items):
+                if isinstance(item, (list, dict)):
+                    self._stage_nested_field(plan, items, index)
+                elif isinstance(item, str):
+                    self._add(items, index, item)
+            return
+
+        if isinstance(value, dict):
+            if _is_value_label_dict(value):
+                return
+            translated = self._writable(container, slot, dict)
+            for nested_plan in plan.nested:
+                if nested_plan.name in translated:
+                    if nested_plan.nested is not None:
+                        self._stage_nested_field(nested_plan, translated, nested_plan.name)
+                    else:
+                        self._stage_atomic_or_collection(translated, nested_plan.name)
+            return
+
+        if isinstance(value, str):
+            self._add(container, slot, value)
+
+    def _stage_atomic_or_collection(self, container: Any, slot: Any) -> None:
+        value = container[slot]
+
+        if isinstance(value, list):
+            items = self._writable(container, slot, list)
+            for index in range(len(items)):
+                self._stage_atomic_or_collection(items, index)
+        elif isinstance(value, dict):
+            if _is_value_label_dict(value):
+                return
+            translated = self._writable(container, slot, dict)
+            for key in translated:
+                self._stage_atomic_or_collection(translated, key)
+        elif isinstance(value, str):
+            self._add(container, slot, value)
+
+
 def _merge_tags_translated_into_tags(data: Any) -> None:
     """
     Merges tags from tags_translated into the standard tags field.
@@ -392,87 +788,6 @@ def _normalize_tags_field(data: Any) -> None:
     data["tags"] = normalized_tags
 
 
-def _translate_fields(data, fields_list, translation_dict):
-    for field in fields_list:
-        value = data.get(field)
-        if value is None:
-            data[field] = None
-            continue
-
-        if field in NESTED_FIELD_TRANSLATIONS:
-            data[field] = _translate_nested_field(field, value, translation_dict)
-            continue
-
-        if isinstance(value, List):
-            data[field] = [
-                ValueLabel(name=x, display_name=translation_dict.get(x, x)).__dict__
-                for x in value
-            ]
-            continue
-
-        data[field] = ValueLabel(
-            name=value, display_name=translation_dict.get(value, value)
-        ).__dict__
-    return data
-
-
-def _translate_nested_field(field: str, value: Any, translation_dict: Dict[str, str]) -> Any:
-    nested_fields = NESTED_FIELD_TRANSLATIONS.get(field, set())
-
-    if isinstance(value, list):
-        return [
-            _translate_nested_field(field, item, translation_dict)
-            if isinstance(item, (list, dict))
-            else _translate_atomic_value(item, translation_dict)
-            for item in value
-        ]
-
-    if isinstance(value, dict):
-        if _is_value_label_dict(value):
-            return value
-        translated = value.copy()
-        for nested_field in nested_fields:
-            if nested_field in translated:
-                nested_value = translated[nested_field]
-                if nested_field in NESTED_FIELD_TRANSLATIONS:
-                    translated[nested_field] = _translate_nested_field(
-                        nested_field, nested_value, translation_dict
-                    )
-                else:
-                    translated[nested_field] = _translate_atomic_or_collection(
-                        nested_value, translation_dict
-                    )
-        return translated
-
-    return _translate_atomic_value(value, translation_dict)
-
-
-def _translate_atomic_or_collection(value: Any, translation_dict: Dict[str, str]) -> Any:
-    if isinstance(value, list):
-        return [
-            _translate_atomic_value(item, translation_dict)
-            if isinstance(item, (str, int, float))
-            else _translate_atomic_or_collection(item, translation_dict)
-            for item in value
-        ]
-    if isinstance(value, dict):
-        if _is_value_label_dict(value):
-            return value
-        return {
-            key: _translate_atomic_or_collection(val, translation_dict)
-            for key, val in value.items()
-        }
-    return _translate_atomic_value(value, translation_dict)
-
-
-def _translate_atomic_value(value: Any, translation_dict: Dict[str, str]) -> Any:
-    if isinstance(value, str):
-        return ValueLabel(
-            name=value, display_name=translation_dict.get(value, value)
-        ).__dict__
-    return value
-
-
 def _is_value_label_dict(value: Dict[str, Any]) -> bool:
     if not isinstance(value, dict):
         return False
@@ -488,45 +803,115 @@ def _change_facet(facet, translation_dict):
     return facet
 
 
-def replace_search_facets(data, translation_dict, lang):
-    preferred_lang = get_preferred_language(lang)
+def replace_search_facets(data, translation_dict, lang=None):
+    """
+    Translates facet titles and items from ``translation_dict``, which is
+    expected to hold the values from ``collect_search_values_to_translate``.
+    """
     new_facets = {}
     for key, facet in data.items():
         title = facet["title"]
-        new_facets[key] = {
-            "title": get_translations([title], lang=preferred_lang).get(title, title)
-        }
+        new_facets[key] = {"title": translation_dict.get(title, title)}
         new_facets[key]["items"] = [
             _change_facet(item, translation_dict) for item in facet["items"]
         ]
     return new_facets
 
 
-def _apply_translated_properties(data: Any, preferred_lang: str, fallback_lang: str = DEFAULT_FALLBACK_LANG):
-    if not isinstance(data, (dict, list)):
-        return data
+@dataclass(frozen=True)
+class TranslatedPropertyIndex:
+    """
+    Keys of one level of a dataset that carry language values (``*_translated``
+    fields and ``LANGUAGE_VALUE_FIELDS``), and the index of each subtree that
+    can contain more of them.
+    """
+
+    keys: FrozenSet[str] = frozenset()
+    children: Dict[str, "TranslatedPropertyIndex"] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.keys or self.children)
+
+    def merge(self, other: "TranslatedPropertyIndex") -> "TranslatedPropertyIndex":
+        children = dict(self.children)
+        for name, child in other.children.items():
+            children[name] = children[name].merge(child) if name in children else child
+        return TranslatedPropertyIndex(self.keys | other.keys, children)
+
+
+def _compile_translated_property_index(fields: Any) -> TranslatedPropertyIndex:
+    keys = set()
+    children = {}
+    for schema_field in fields or []:
+        name = schema_field.get("field_name") if isinstance(schema_field, dict) else None
+        if not isinstance(name, str):
+            continue
+        if name.endswith(TRANSLATED_SUFFIX) or name in LANGUAGE_VALUE_FIELDS:
+            keys.add(name)
+        child = _compile_translated_property_index(schema_field.get("repeating_subfields"))
+        if child:
+            children[name] = child
+    return TranslatedPropertyIndex(frozenset(keys), children)
+
+
+def _bundled_dataset_schemas() -> List[Dict[str, Any]]:
+    schemas = []
+    for path in sorted(BUNDLED_SCHEMAS_DIR.glob("*.yaml")):
+        with path.open(encoding="utf-8") as schema_file:
+            schemas.append(yaml.safe_load(schema_file))
+    return schemas
+
+
+@lru_cache(maxsize=1)
+def get_translated_property_index() -> TranslatedPropertyIndex:
+    """
+    Where language values can occur in a dataset, from the schemas bundled
+    with this extension and those loaded by ckanext-scheming.
+    """
+    schemas = _bundled_dataset_schemas()
+    schemas.extend((scheming_dataset_schemas() or {}).values())
+
+    index = TranslatedPropertyIndex()
+    for schema in schemas:
+        package = _compile_translated_property_index(schema.get("dataset_fields"))
+        resource = _compile_translated_property_index(schema.get("resource_fields"))
+        if resource:
+            package = package.merge(TranslatedPropertyIndex(children={"resources": resource}))
+        index = index.merge(package)
+    return index
+
+
+def _apply_translated_properties(
+    data: Any,
+    preferred_lang: str,
+    fallback_lang: str = DEFAULT_FALLBACK_LANG,
+    index: Optional[TranslatedPropertyIndex] = None,
+):
+    """
+    Replace the language values of ``data`` in place by the value for
+    ``preferred_lang``, visiting only the keys and subtrees in ``index``.
+    """
+    if index is None:
+        index = get_translated_property_index()
 
     if isinstance(data, list):
-        return [
-            _apply_translated_properties(item, preferred_lang, fallback_lang)
-            if isinstance(item, (dict, list))
-            else item
-            for item in data
-        ]
+        for item in data:
+            if isinstance(item, (dict, list)):
+                _apply_translated_properties(item, preferred_lang, fallback_lang, index)
+        return data
+    if not isinstance(data, dict):
+        return data
 
-    for key, value in list(data.items()):
-        if isinstance(value, dict):
-            _apply_translated_properties(value, preferred_lang, fallback_lang)
-        elif isinstance(value, list):
-            data[key] = [
-                _apply_translated_properties(item, preferred_lang, fallback_lang)
-                if isinstance(item, (dict, list))
-                else item
-                for item in value
-            ]
-
-    for key, value in list(data.items()):
-        if key.endswith(TRANSLATED_SUFFIX) and isinstance(value, dict):
+    for key, child in index.children.items():
+        value = data.get(key)
+        if isinstance(value, (dict, list)):
+            _apply_translated_properties(value, preferred_lang, fallback_lang, child)
+
+    for key in index.keys:
+        value = data.get(key)
+        if not isinstance(value, dict):
+            continue
+        if key.endswith(TRANSLATED_SUFFIX):
             base_key = key[:-len(TRANSLATED_SUFFIX)]
             existing_value = data.get(base_key)
             # Don't replace list fields (like tags) with translated strings
@@ -538,7 +923,7 @@ def _apply_translated_properties(data: Any, preferred_lang: str, fallback_lang:
             data[base_key] = _select_translated_value(
                 merged_values, preferred_lang, fallback_lang
             )
-        elif key in LANGUAGE_VALUE_FIELDS and isinstance(value, dict):
+        else:
             data[key] = _select_translated_value(value, preferred_lang, fallback_lang)
 
     return data
@@ -30,3 +30,8 @@ def gdi_filter_help_texts_show(context, data_dict=None):
 @toolkit.auth_allow_anonymous_access
 def gdi_dataset_help_texts_show(context, data_dict=None):
     return {"success": True}
+
+
+@toolkit.auth_allow_anonymous_access
+def gdi_term_translations_show(context, data_dict=None):
+    return {"success": True}
@@ -30,20 +30,28 @@ Usage:
     # Check status
     from ckanext.gdi_userportal.migrations import get_migration_status
     status = get_migration_status()
+
+    # Poll the translation generation (bumped whenever translations change)
+    from ckanext.gdi_userportal.migrations import get_translation_generation
+    generation = get_translation_generation()
 """
 
 from ckanext.gdi_userportal.migrations.runner import (
+    bump_translation_generation,
     run_migrations,
     downgrade_migration,
     get_current_version,
     get_migration_status,
     get_migration_by_version,
+    get_translation_generation,
 )
 
 __all__ = [
+    "bump_translation_generation",
     "run_migrations",
     "downgrade_migration",
     "get_current_version",
     "get_migration_status",
     "get_migration_by_version",
+    "get_translation_generation",
 ]
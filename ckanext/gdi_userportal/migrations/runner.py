@@ -24,6 +24,11 @@ log = logging.getLogger(__name__)
 # Table to track applied migrations
 MIGRATION_TABLE = "gdi_term_translation_migrations"
 
+# Single-row table holding a counter bumped on every term_translation change
+GENERATION_TABLE = "gdi_term_translation_generation"
+
+_generation_table_ready = False
+
 
 def _get_versions_path() -> str:
     """Get the path to the versions directory."""
@@ -197,6 +202,72 @@ def _mark_migration_removed(version: str):
         conn.execute(delete_sql, {"version": version})
 
 
+def _ensure_generation_table_exists():
+    """Create the translation generation table if it doesn't exist."""
+    global _generation_table_ready
+
+    if _generation_table_ready:
+        return
+
+    engine = model.meta.engine
+
+    create_table_sql = text(f"""
+        CREATE TABLE IF NOT EXISTS {GENERATION_TABLE} (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            generation BIGINT NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    with engine.begin() as conn:
+        conn.execute(create_table_sql)
+    _generation_table_ready = True
+
+
+def bump_translation_generation() -> int:
+    """
+    Increment the translation generation after term_translation changed.
+
+    Returns:
+        The new generation
+    """
+    _ensure_generation_table_exists()
+    engine = model.meta.engine
+
+    bump_sql = text(f"""
+        INSERT INTO {GENERATION_TABLE} (id, generation)
+        VALUES (1, 1)
+        ON CONFLICT (id) DO UPDATE SET
+            generation = {GENERATION_TABLE}.generation + 1,
+            updated_at = CURRENT_TIMESTAMP
+        RETURNING generation
+    """)
+
+    with engine.begin() as conn:
+        generation = conn.execute(bump_sql).scalar()
+
+    log.info(f"Term translation generation bumped to {generation}")
+    return generation
+
+
+def get_translation_generation() -> int:
+    """
+    Get the current translation generation.
+
+    The generation increases monotonically whenever migrations change the
+    term_translation table, which lets running web workers detect that their
+    cached translations are stale with a single primary key lookup.
+    """
+    _ensure_generation_table_exists()
+    engine = model.meta.engine
+
+    query = text(f"SELECT generation FROM {GENERATION_TABLE} WHERE id = 1")
+
+    with engine.begin() as conn:
+        generation = conn.execute(query).scalar()
+    return generation or 0
+
+
 def run_migrations(target_version: Optional[str] = None, force: bool = False) -> Dict:
     """
     Run all pending migrations up to the target version.
@@ -251,6 +322,9 @@ def run_migrations(target_version: Optional[str] = None, force: bool = False) ->
             log.error(f"Failed to apply migration {version}: {e}")
             results["errors"].append({"version": version, "error": str(e)})
     
+    if results["applied"]:
+        results["generation"] = bump_translation_generation()
+    
     return results
 
 
@@ -283,6 +357,7 @@ def downgrade_migration(version: str) -> Dict:
         _mark_migration_removed(version)
         
         results["translations_removed"] = count or 0
+        results["generation"] = bump_translation_generation()
         results["success"] = True
         
         log.info(f"Migration {version} downgraded successfully ({count} translations removed)")
@@ -315,6 +390,7 @@ def get_migration_status() -> Dict:
     
     status = {
         "current_version": get_current_version(),
+        "translation_generation": get_translation_generation(),
         "total_migrations": len(ordered_migrations),
         "applied_count": len(applied),
         "pending_count": len(ordered_migrations) - len(applied),
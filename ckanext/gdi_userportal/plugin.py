@@ -9,6 +9,11 @@ from urllib.parse import quote
 import ckan.plugins as plugins
 import ckan.plugins.toolkit as toolkit
 from ckanext.gdi_userportal.helpers import get_helpers as get_portal_helpers
+from ckanext.gdi_userportal.logic.action.pretranslated_index import (
+    add_pretranslated_payload,
+)
+from ckanext.gdi_userportal.logic.action.search_cache import clear_search_cache
+from ckanext.gdi_userportal.logic.action.translation_cache import intern_term
 from ckanext.gdi_userportal.logic.action.translation_utils import (
     SEARCH_INDEX_TRANSLATED_FIELDS,
     get_all_translations,
@@ -18,12 +23,19 @@ from ckanext.gdi_userportal.logic.action.get import (
     gdi_dataset_help_texts_show,
     enhanced_package_search,
     enhanced_package_show,
+    enhanced_package_show_many,
     gdi_filter_help_texts_show,
+    gdi_term_translations_show,
+)
+from ckanext.gdi_userportal.logic.action.post import (
+    term_translation_update,
+    term_translation_update_many,
 )
 from ckanext.gdi_userportal.logic.auth.get import (
     config_option_show,
     gdi_dataset_help_texts_show as gdi_dataset_help_texts_show_auth,
     gdi_filter_help_texts_show as gdi_filter_help_texts_show_auth,
+    gdi_term_translations_show as gdi_term_translations_show_auth,
 )
 from ckanext.gdi_userportal.validation import scheming_isodatetime_flex
 
@@ -166,14 +178,19 @@ class GdiUserPortalPlugin(plugins.SingletonPlugin):
             "config_option_show": config_option_show,
             "gdi_dataset_help_texts_show": gdi_dataset_help_texts_show_auth,
             "gdi_filter_help_texts_show": gdi_filter_help_texts_show_auth,
+            "gdi_term_translations_show": gdi_term_translations_show_auth,
         }
 
     def get_actions(self):
         return {
             "enhanced_package_search": enhanced_package_search,
             "enhanced_package_show": enhanced_package_show,
+            "enhanced_package_show_many": enhanced_package_show_many,
             "gdi_dataset_help_texts_show": gdi_dataset_help_texts_show,
             "gdi_filter_help_texts_show": gdi_filter_help_texts_show,
+            "gdi_term_translations_show": gdi_term_translations_show,
+            "term_translation_update": term_translation_update,
+            "term_translation_update_many": term_translation_update_many,
         }
 
     def get_helpers(self):
@@ -181,6 +198,11 @@ class GdiUserPortalPlugin(plugins.SingletonPlugin):
 
     # IBlueprint
     def get_blueprint(self):
+        from ckanext.gdi_userportal.views import get_blueprints
+
+        return get_blueprints() + self._dcat_export_alias_blueprints()
+
+    def _dcat_export_alias_blueprints(self):
         """
         Ensure DCAT exports work for both datasets and dataset series without relying on
         HTTP redirects. Some clients (e.g. REST clients with redirect-following disabled)
@@ -503,7 +525,7 @@ class GdiUserPortalPlugin(plugins.SingletonPlugin):
 
             search_terms = _deduplicate_non_empty_strings(search_terms)
             if search_terms:
-                data_dict[solr_field] = search_terms
+                data_dict[solr_field] = [intern_term(term) for term in search_terms]
 
         return data_dict
 
@@ -585,6 +607,7 @@ class GdiUserPortalPlugin(plugins.SingletonPlugin):
         # Merge tags from tags_translated into tags for Solr indexing
         data_dict = self._merge_tags_translated_for_indexing(data_dict)
         data_dict = self._add_translated_search_fields(data_dict)
+        data_dict = add_pretranslated_payload(data_dict)
 
         return data_dict
 
@@ -628,12 +651,15 @@ class GdiUserPortalPlugin(plugins.SingletonPlugin):
         return pkg_dict
 
     def after_dataset_create(self, context, data_dict):
+        clear_search_cache()
         return data_dict
 
     def after_dataset_update(self, context, data_dict):
+        clear_search_cache()
         return data_dict
 
     def after_dataset_delete(self, context, data_dict):
+        clear_search_cache()
         return data_dict
 
     def after_dataset_show(self, context, data_dict):
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from ckanext.gdi_userportal.logic.action import get as action_get
+from ckanext.gdi_userportal.logic.action import post as action_post
 from ckanext.gdi_userportal.logic.action.get import (
     gdi_dataset_help_texts_show,
     gdi_filter_help_texts_show,
@@ -577,49 +578,43 @@ def test_gdi_dataset_help_texts_show_rejects_invalid_keys_type():
 def test_enhanced_package_search_replaces_results_and_facets():
     response = {
         "results": [{"name": "dataset-1"}],
-        "search_facets": {"theme": {"title": "Theme"}},
+        "search_facets": {"theme": {"title": "Theme", "items": []}},
     }
 
     package_search = MagicMock(return_value=response)
+    staged = MagicMock(values=["alpha"])
 
     with patch(
         "ckanext.gdi_userportal.logic.action.get.toolkit.get_action",
         side_effect=lambda name: package_search if name == "package_search" else None,
     ), patch(
-        "ckanext.gdi_userportal.logic.action.get.collect_values_to_translate",
-        return_value=["alpha"],
-    ), patch(
-        "ckanext.gdi_userportal.logic.action.get.get_request_language",
+        "ckanext.gdi_userportal.logic.action.search_pipeline.PackageTranslation",
+        return_value=staged,
+    ) as package_translation, patch(
+        "ckanext.gdi_userportal.logic.action.search_pipeline.get_request_language",
         return_value="nl",
     ), patch(
-        "ckanext.gdi_userportal.logic.action.get.get_translations",
+        "ckanext.gdi_userportal.logic.action.search_pipeline.get_translations",
         return_value={"alpha": "beta"},
-    ), patch(
-        "ckanext.gdi_userportal.logic.action.get.replace_package",
-        side_effect=lambda package, translations, lang=None: {
-            **package,
-            "translated_lang": lang,
-            "translated_values": translations,
-        },
-    ), patch(
-        "ckanext.gdi_userportal.logic.action.get.replace_search_facets",
+    ) as get_translations, patch(
+        "ckanext.gdi_userportal.logic.action.search_pipeline.replace_search_facets",
         return_value={"theme": {"title": "Vertaling"}},
     ) as replace_search_facets:
         result = action_get.enhanced_package_search({}, {"rows": 0})
 
-    assert result["results"] == [
-        {
-            "name": "dataset-1",
-            "translated_lang": "nl",
-            "translated_values": {"alpha": "beta"},
-        }
-    ]
+    package_translation.assert_called_once_with(
+        "nl", fields=None, include_resources=True, in_place=False
+    )
+    staged.stage.assert_called_once_with({"name": "dataset-1"}, key=0)
+    get_translations.assert_called_once_with(["alpha", "Theme"], lang="nl")
+    staged.patch.assert_called_once_with({"alpha": "beta"})
+    assert result["results"] == [{"name": "dataset-1"}]
     assert result["search_facets"] == {"theme": {"title": "Vertaling"}}
     replace_search_facets.assert_called_once()
 
 
 def test_enhanced_package_search_leaves_results_without_search_facets():
-    response = {"results": [{"name": "dataset-1"}]}
+    response = {"results": [{"name": "dataset-1", "theme": "http://example.com/theme/HEAL"}]}
 
     package_search = MagicMock(return_value=response)
 
@@ -627,26 +622,22 @@ def test_enhanced_package_search_leaves_results_without_search_facets():
         "ckanext.gdi_userportal.logic.action.get.toolkit.get_action",
         side_effect=lambda name: package_search if name == "package_search" else None,
     ), patch(
-        "ckanext.gdi_userportal.logic.action.get.collect_values_to_translate",
-        return_value=["alpha"],
-    ), patch(
-        "ckanext.gdi_userportal.logic.action.get.get_request_language",
+        "ckanext.gdi_userportal.logic.action.search_pipeline.get_request_language",
         return_value="en",
     ), patch(
-        "ckanext.gdi_userportal.logic.action.get.get_translations",
-        return_value={"alpha": "beta"},
-    ), patch(
-        "ckanext.gdi_userportal.logic.action.get.replace_package",
-        side_effect=lambda package, translations, lang=None: {
-            **package,
-            "translated_lang": lang,
-        },
-    ), patch(
-        "ckanext.gdi_userportal.logic.action.get.replace_search_facets"
+        "ckanext.gdi_userportal.logic.action.search_pipeline.get_translations",
+        return_value={"http://example.com/theme/HEAL": "Health"},
+    ) as get_translations, patch(
+        "ckanext.gdi_userportal.logic.action.search_pipeline.replace_search_facets"
     ) as replace_search_facets:
         result = action_get.enhanced_package_search({}, {"rows": 0})
 
-    assert result["results"] == [{"name": "dataset-1", "translated_lang": "en"}]
+    get_translations.assert_called_once_with(["http://example.com/theme/HEAL"], lang="en")
+    assert result["results"][0]["theme"] == {
+        "name": "http://example.com/theme/HEAL",
+        "display_name": "Health",
+        "count": None,
+    }
     assert "search_facets" not in result
     replace_search_facets.assert_not_called()
 
@@ -676,3 +667,185 @@ def test_enhanced_package_show_replaces_package():
 
     assert result == {"name": "dataset-1", "translated": True}
     replace_package.assert_called_once()
+
+
+def test_enhanced_package_show_many_translates_all_packages_at_once():
+    packages = {
+        "dataset-1": {"name": "dataset-1", "theme": ["http://example.com/theme/HEAL"]},
+        "dataset-3": {"name": "dataset-3", "theme": ["http://example.com/theme/TECH"]},
+    }
+
+    def package_show(context, data_dict):
+        if data_dict["id"] == "private":
+            raise action_get.toolkit.NotAuthorized("no")
+        if data_dict["id"] not in packages:
+            raise action_get.toolkit.ObjectNotFound()
+        return packages[data_dict["id"]]
+
+    with patch(
+        "ckanext.gdi_userportal.logic.action.get.toolkit.get_action",
+        side_effect=lambda name: package_show if name == "package_show" else None,
+    ), patch(
+        "ckanext.gdi_userportal.logic.action.get.get_request_language",
+        return_value="nl",
+    ), patch(
+        "ckanext.gdi_userportal.logic.action.get.get_translations",
+        return_value={"http://example.com/theme/HEAL": "Gezondheid"},
+    ) as get_translations:
+        result = action_get.enhanced_package_show_many(
+            {}, {"ids": "dataset-3, private,missing,dataset-1,dataset-3"}
+        )
+
+    get_translations.assert_called_once()
+    requested_terms = get_translations.call_args[0][0]
+    assert "http://example.com/theme/HEAL" in requested_terms
+    assert "http://example.com/theme/TECH" in requested_terms
+    assert [package["name"] for package in result] == ["dataset-3", "dataset-1"]
+    assert result[1]["theme"][0]["display_name"] == "Gezondheid"
+
+
+@pytest.mark.parametrize(
+    "ids",
+    [None, [], "", 42, [f"dataset-{index}" for index in range(action_get.MAX_PACKAGES_SHOW_MANY + 1)]],
+)
+def test_enhanced_package_show_many_rejects_invalid_ids(ids):
+    with pytest.raises(action_get.toolkit.ValidationError):
+        action_get.enhanced_package_show_many({}, {"ids": ids})
+
+
+def _search_response_with_facets(facet_count):
+    return {
+        "count": 1,
+        "results": [
+            {
+                "name": "dataset-1",
+                "theme": ["http://example.com/theme/HEAL"],
+                "resources": [{"format": "http://example.com/format/CSV"}],
+            }
+        ],
+        "search_facets": {
+            f"facet_{index}": {
+                "title": f"facet_{index}",
+                "items": [{"name": f"http://example.com/facet/{index}", "count": 1}],
+            }
+            for index in range(facet_count)
+        },
+    }
+
+
+@pytest.mark.parametrize("action", [action_get.enhanced_package_search, action_post.enhanced_package_search])
+def test_enhanced_package_search_makes_one_translation_query(action):
+    package_search = MagicMock(return_value=_search_response_with_facets(18))
+    term_translation_show = MagicMock(
+        side_effect=lambda context, data_dict: [
+            {"term": term, "term_translation": f"{term} (nl)", "lang_code": "nl"}
+            for term in data_dict["terms"]
+        ]
+    )
+    actions = {
+        "package_search": package_search,
+        "term_translation_show": term_translation_show,
+    }
+
+    with patch(
+        "ckanext.gdi_userportal.logic.action.get.toolkit.get_action",
+        side_effect=actions.get,
+    ), patch(
+        "ckanext.gdi_userportal.logic.action.translation_utils.toolkit.get_action",
+        side_effect=actions.get,
+    ), patch(
+        "ckanext.gdi_userportal.logic.action.translation_utils.get_request_language",
+        return_value="nl",
+    ), patch(
+        "ckanext.gdi_userportal.logic.action.search_pipeline.get_request_language",
+        return_value="nl",
+    ):
+        result = action({}, {"q": "*:*"})
+
+    assert term_translation_show.call_count == 1
+    requested_terms = term_translation_show.call_args[0][1]["terms"]
+    assert "facet_17" in requested_terms
+    assert "http://example.com/facet/17" in requested_terms
+    assert result["search_facets"]["facet_17"]["title"] == "facet_17 (nl)"
+    assert result["results"][0]["theme"] == [
+        {
+            "name": "http://example.com/theme/HEAL",
+            "display_name": "http://example.com/theme/HEAL (nl)",
+            "count": None,
+        }
+    ]
+
+
+def test_enhanced_package_search_projects_requested_fields():
+    package_search = MagicMock(
+        return_value={
+            "count": 1,
+            "results": [
+                {
+                    "name": "dataset-1",
+                    "title": "Title",
+                    "theme": ["http://example.com/theme/HEAL"],
+                    "resources": [{"format": "http://example.com/format/CSV"}],
+                }
+            ],
+        }
+    )
+
+    with patch(
+        "ckanext.gdi_userportal.logic.action.get.toolkit.get_action",
+        side_effect=lambda name: package_search if name == "package_search" else None,
+    ), patch(
+        "ckanext.gdi_userportal.logic.action.search_pipeline.get_request_language",
+        return_value="en",
+    ), patch(
+        "ckanext.gdi_userportal.logic.action.search_pipeline.get_translations",
+        return_value={"http://example.com/theme/HEAL": "Health"},
+    ) as get_translations:
+        result = action_get.enhanced_package_search({}, {"q": "*:*", "fl": "name,theme"})
+
+    package_search.assert_called_once_with({}, {"q": "*:*"})
+    get_translations.assert_called_once_with(["http://example.com/theme/HEAL"], lang="en")
+    assert result["results"] == [
+        {
+            "name": "dataset-1",
+            "theme": [
+                {
+                    "name": "http://example.com/theme/HEAL",
+                    "display_name": "Health",
+                    "count": None,
+                }
+            ],
+        }
+    ]
+
+
+def test_enhanced_package_search_can_leave_out_resources():
+    package_search = MagicMock(
+        return_value={
+            "count": 1,
+            "results": [
+                {
+                    "name": "dataset-1",
+                    "resources": [{"format": "http://example.com/format/CSV"}],
+                }
+            ],
+        }
+    )
+
+    with patch(
+        "ckanext.gdi_userportal.logic.action.get.toolkit.get_action",
+        side_effect=lambda name: package_search if name == "package_search" else None,
+    ), patch(
+        "ckanext.gdi_userportal.logic.action.search_pipeline.get_request_language",
+        return_value="en",
+    ), patch(
+        "ckanext.gdi_userportal.logic.action.search_pipeline.get_translations",
+        return_value={},
+    ) as get_translations:
+        result = action_get.enhanced_package_search(
+            {}, {"q": "*:*", "include_resources": "false"}
+        )
+
+    package_search.assert_called_once_with({}, {"q": "*:*"})
+    get_translations.assert_called_once_with([], lang="en")
+    assert "resources" not in result["results"][0]
@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from ckanext.gdi_userportal.migrations import runner
+
+
+def _migration(revision, down_revision=None, count=1):
+    return SimpleNamespace(
+        revision=revision,
+        down_revision=down_revision,
+        description=f"Migration {revision}",
+        upgrade=MagicMock(return_value=count),
+        downgrade=MagicMock(return_value=count),
+    )
+
+
+def _patch_runner(versions, applied):
+    return [
+        patch.object(runner, "_ensure_migration_table_exists"),
+        patch.object(runner, "_ensure_unique_constraint_exists"),
+        patch.object(runner, "_discover_versions", return_value=versions),
+        patch.object(runner, "_get_applied_migrations", return_value=applied),
+        patch.object(runner, "_mark_migration_applied"),
+        patch.object(runner, "_mark_migration_removed"),
+    ]
+
+
+def _run_with_patches(patches, func, *args, **kwargs):
+    for patcher in patches:
+        patcher.start()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        for patcher in reversed(patches):
+            patcher.stop()
+
+
+def test_run_migrations_bumps_generation_when_migrations_are_applied():
+    versions = {"001": _migration("001"), "002": _migration("002", "001")}
+
+    with patch.object(runner, "bump_translation_generation", return_value=4) as bump:
+        results = _run_with_patches(
+            _patch_runner(versions, ["001"]), runner.run_migrations
+        )
+
+    assert results["applied"] == ["002"]
+    assert results["generation"] == 4
+    bump.assert_called_once_with()
+
+
+def test_run_migrations_keeps_generation_when_nothing_is_applied():
+    versions = {"001": _migration("001")}
+
+    with patch.object(runner, "bump_translation_generation") as bump:
+        results = _run_with_patches(
+            _patch_runner(versions, ["001"]), runner.run_migrations
+        )
+
+    assert results["applied"] == []
+    assert "generation" not in results
+    bump.assert_not_called()
+
+
+def test_downgrade_migration_bumps_generation():
+    versions = {"001": _migration("001")}
+
+    with patch.object(runner, "bump_translation_generation", return_value=5) as bump:
+        results = _run_with_patches(
+            _patch_runner(versions, ["001"]), runner.downgrade_migration, "001"
+        )
+
+    assert results["success"] is True
+    assert results["generation"] == 5
+    bump.assert_called_once_with()
@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ckanext.gdi_userportal.logic.action import pretranslated_index, search_pipeline
+from ckanext.gdi_userportal.logic.action.pretranslated_index import (
+    PRETRANSLATED_GENERATION_FIELD,
+    PRETRANSLATED_INDEX_ENABLED_CONFIG,
+    PRETRANSLATED_PAYLOAD_FIELD,
+    PRETRANSLATED_SEARCH_FIELDS,
+    add_pretranslated_payload,
+    find_stale_dataset_ids,
+)
+from ckanext.gdi_userportal.logic.action.search_pipeline import run_search_pipeline
+
+HEAL = "http://example.com/theme/HEAL"
+TRANSLATIONS = {"en": {HEAL: "Health"}, "nl": {HEAL: "Gezondheid"}}
+
+
+def _package(name="dataset-1"):
+    return {"id": name, "name": name, "theme": [HEAL]}
+
+
+@pytest.fixture
+def enabled_pretranslated_index():
+    with patch.dict(
+        pretranslated_index.config, {PRETRANSLATED_INDEX_ENABLED_CONFIG: "true"}
+    ), patch.object(pretranslated_index, "get_current_translation_generation", return_value=7):
+        yield
+
+
+def _get_translations(values, lang=None):
+    return {value: TRANSLATIONS[lang][value] for value in values if value in TRANSLATIONS[lang]}
+
+
+def test_payload_holds_each_language_chain(enabled_pretranslated_index):
+    pkg_dict = {"id": "dataset-1", "validated_data_dict": json.dumps(_package())}
+
+    with patch.object(pretranslated_index, "get_translations", side_effect=_get_translations):
+        add_pretranslated_payload(pkg_dict)
+
+    payload = json.loads(pkg_dict[PRETRANSLATED_PAYLOAD_FIELD])
+    assert pkg_dict[PRETRANSLATED_GENERATION_FIELD] == 7
+    assert payload["generation"] == 7
+    assert payload["packages"]["en"]["theme"][0]["display_name"] == "Health"
+    assert payload["packages"]["nl,en"]["theme"][0]["display_name"] == "Gezondheid"
+
+
+def test_payload_is_not_added_when_disabled():
+    pkg_dict = {"id": "dataset-1", "validated_data_dict": json.dumps(_package())}
+
+    assert PRETRANSLATED_PAYLOAD_FIELD not in add_pretranslated_payload(pkg_dict)
+
+
+def _search_row(name, generation):
+    package = _package(name)
+    translated = dict(
+        package, theme=[{"name": HEAL, "display_name": "Vooraf vertaald", "count": None}]
+    )
+    return {
+        "id": name,
+        "validated_data_dict": json.dumps(package),
+        PRETRANSLATED_PAYLOAD_FIELD: json.dumps(
+            {"generation": generation, "packages": {"nl,en": translated}}
+        ),
+    }
+
+
+def test_search_uses_current_payloads_and_translates_stale_ones(enabled_pretranslated_index):
+    package_search = MagicMock(
+        return_value={
+            "count": 2,
+            "results": [_search_row("dataset-1", 7), _search_row("dataset-2", 6)],
+            "search_facets": {},
+        }
+    )
+
+    with patch.object(
+        search_pipeline.toolkit, "get_action", return_value=package_search
+    ), patch.object(search_pipeline, "get_request_language", return_value="nl"), patch.object(
+        search_pipeline, "get_translations", side_effect=_get_translations
+    ) as get_translations:
+        state = run_search_pipeline({}, {"q": "*:*"})
+
+    package_search.assert_called_once_with({}, {"q": "*:*", "fl": PRETRANSLATED_SEARCH_FIELDS})
+    assert state.pretranslated == [True, False]
+    # Only the stale result is staged for translation.
+    get_translations.assert_called_once_with([HEAL], lang="nl")
+    assert [package["theme"][0]["display_name"] for package in state.result["results"]] == [
+        "Vooraf vertaald",
+        "Gezondheid",
+    ]
+
+
+def test_find_stale_dataset_ids_pages_through_results():
+    pages = iter([["a", "b"], ["c"]])
+    query = MagicMock(count=3)
+
+    def run(search_query, permission_labels=None):
+        assert search_query["fq"] == f"-{PRETRANSLATED_GENERATION_FIELD}:7"
+        assert permission_labels is None
+        query.results = next(pages)
+
+    query.run.side_effect = run
+    with patch.object(pretranslated_index, "STALE_SEARCH_PAGE_SIZE", 2), patch.object(
+        pretranslated_index.search, "query_for", return_value=query
+    ):
+        assert find_stale_dataset_ids(7) == ["a", "b", "c"]
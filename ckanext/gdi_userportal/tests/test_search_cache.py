@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ckanext.gdi_userportal.logic.action import search_cache
+from ckanext.gdi_userportal.logic.action.search_cache import (
+    SEARCH_CACHE_ENABLED_CONFIG,
+    cache_search_results,
+    search_cache_key,
+)
+from ckanext.gdi_userportal.plugin import GdiUserPortalPlugin
+
+
+@pytest.fixture
+def enabled_search_cache():
+    search_cache._search_cache = None
+    with patch.dict(search_cache.config, {SEARCH_CACHE_ENABLED_CONFIG: "true"}), patch.object(
+        search_cache, "_permission_labels", return_value=["public"]
+    ), patch.object(
+        search_cache, "get_current_translation_generation", return_value=1
+    ), patch.object(
+        search_cache, "get_request_language", return_value="nl"
+    ):
+        yield
+    search_cache._search_cache = None
+
+
+def _search_action():
+    action = MagicMock(
+        side_effect=lambda context, data_dict: {
+            "count": 1,
+            "results": [{"theme": [{"name": "http://example.com/HEAL", "display_name": "Gezondheid"}]}],
+        }
+    )
+    return action, cache_search_results(action)
+
+
+def test_search_cache_answers_repeated_searches(enabled_search_cache):
+    action, cached_action = _search_action()
+
+    first = cached_action({}, {"q": "cancer", "rows": 10})
+    first["results"].clear()
+    second = cached_action({}, {"rows": 10, "q": " cancer "})
+
+    assert action.call_count == 1
+    assert second["results"][0]["theme"][0]["display_name"] == "Gezondheid"
+
+
+def test_search_cache_separates_languages_labels_and_generations(enabled_search_cache):
+    action, cached_action = _search_action()
+
+    cached_action({}, {"q": "cancer"})
+    with patch.object(search_cache, "get_request_language", return_value="en"):
+        cached_action({}, {"q": "cancer"})
+    with patch.object(search_cache, "_permission_labels", return_value=["member-org"]):
+        cached_action({}, {"q": "cancer"})
+    with patch.object(search_cache, "get_current_translation_generation", return_value=2):
+        cached_action({}, {"q": "cancer"})
+    cached_action({}, {"q": "cancer"})
+
+    assert action.call_count == 4
+
+
+def test_search_cache_is_cleared_by_dataset_changes(enabled_search_cache):
+    action, cached_action = _search_action()
+    plugin = GdiUserPortalPlugin()
+
+    cached_action({}, {"q": "cancer"})
+    plugin.after_dataset_update({}, {"id": "dataset-1"})
+    cached_action({}, {"q": "cancer"})
+
+    assert action.call_count == 2
+
+
+def test_search_cache_is_bypassed_when_disabled():
+    action, cached_action = _search_action()
+
+    cached_action({}, {"q": "cancer"})
+    cached_action({}, {"q": "cancer"})
+
+    assert action.call_count == 2
+
+
+def test_search_cache_key_ignores_parameter_order():
+    with patch.object(search_cache, "_permission_labels", return_value=None), patch.object(
+        search_cache, "get_current_translation_generation", return_value=0
+    ):
+        assert search_cache_key({}, {"q": "a", "rows": 1}, "nl") == search_cache_key(
+            {}, {"rows": 1, "q": "a"}, "nl"
+        )
+        assert search_cache_key({}, {"q": "a"}, "nl") != search_cache_key(
+            {}, {"q": "a"}, "en"
+        )
@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ckanext.gdi_userportal.logic.action import search_pipeline
+from ckanext.gdi_userportal.logic.action.search_pipeline import (
+    SEARCH_STAGES,
+    run_search_pipeline,
+)
+
+
+@pytest.fixture
+def telemetry():
+    span = MagicMock()
+    tracer = MagicMock()
+    tracer.start_as_current_span.return_value.__enter__.return_value = span
+    with patch.object(search_pipeline, "tracer", tracer), patch.object(
+        search_pipeline, "stage_duration"
+    ) as stage_duration:
+        yield span, stage_duration
+
+
+@pytest.fixture
+def package_search():
+    action = MagicMock(
+        return_value={
+            "count": 1,
+            "results": [{"name": "dataset-1", "theme": ["http://example.com/theme/HEAL"]}],
+            "search_facets": {"theme": {"title": "theme", "items": []}},
+        }
+    )
+    with patch.object(search_pipeline.toolkit, "get_action", return_value=action), patch.object(
+        search_pipeline, "get_request_language", return_value="nl"
+    ), patch.object(
+        search_pipeline,
+        "get_translations",
+        return_value={"theme": "Thema", "http://example.com/theme/HEAL": "Gezondheid"},
+    ):
+        yield action
+
+
+def test_pipeline_records_every_stage(telemetry, package_search):
+    span, stage_duration = telemetry
+
+    state = run_search_pipeline({}, {"q": "*:*"})
+
+    assert state.result["search_facets"]["theme"]["title"] == "Thema"
+    assert state.result["results"][0]["theme"][0]["display_name"] == "Gezondheid"
+    assert [call.args[1] for call in stage_duration.record.call_args_list] == [
+        {"stage": name} for name, _ in SEARCH_STAGES
+    ]
+    attributes = {call.args[0]: call.args[1] for call in span.set_attribute.call_args_list}
+    assert "gdi_userportal.search.search.duration_ms" in attributes
+    assert "gdi_userportal.search.lookup.duration_ms" in attributes
+    assert attributes["gdi_userportal.search.results"] == 1
+    assert attributes["gdi_userportal.search.translated_terms"] == 2
+
+
+def test_pipeline_stage_can_short_circuit(telemetry, package_search):
+    span, stage_duration = telemetry
+
+    def answer_from_elsewhere(state):
+        state.result = {"count": 0, "results": []}
+        state.done = True
+
+    stages = (SEARCH_STAGES[0], ("cached", answer_from_elsewhere)) + SEARCH_STAGES[1:]
+    state = run_search_pipeline({}, {"q": "*:*"}, stages=stages)
+
+    assert state.result == {"count": 0, "results": []}
+    package_search.assert_not_called()
+    assert [call.args[1]["stage"] for call in stage_duration.record.call_args_list] == [
+        "prepare",
+        "cached",
+    ]
+    span.set_attribute.assert_any_call("gdi_userportal.search.short_circuit", "cached")
+
+
+def test_pipeline_records_failing_stage(telemetry, package_search):
+    _, stage_duration = telemetry
+    package_search.side_effect = RuntimeError("solr down")
+
+    with pytest.raises(RuntimeError):
+        run_search_pipeline({}, {"q": "*:*"})
+
+    assert stage_duration.record.call_args_list[-1].args[1] == {"stage": "search"}
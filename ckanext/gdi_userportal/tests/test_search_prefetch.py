@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import contextvars
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ckanext.gdi_userportal.logic.action import get as action_get
+from ckanext.gdi_userportal.logic.action import search_pipeline, search_prefetch
+from ckanext.gdi_userportal.logic.action.search_prefetch import (
+    SEARCH_PREFETCH_ENABLED_CONFIG,
+    collect_prefetch_terms,
+    resolve_translation_prefetch,
+    start_translation_prefetch,
+)
+
+request_marker = contextvars.ContextVar("request_marker", default=None)
+
+
+@pytest.fixture
+def enabled_prefetch():
+    with patch.dict(search_prefetch.config, {SEARCH_PREFETCH_ENABLED_CONFIG: "true"}), patch.object(
+        search_prefetch.model, "Session"
+    ) as session:
+        yield session
+    search_prefetch.shutdown_prefetch_executor()
+
+
+def test_collect_prefetch_terms_reads_facets_and_filter_values():
+    terms = collect_prefetch_terms(
+        {
+            "facet.field": '["theme", "access_rights"]',
+            "fq": 'theme:"http://example.com/theme/HEAL" AND tags:"cancer"',
+            "fq_list": ['access_rights:"http://example.com/access/PUBLIC"', "theme:*"],
+        }
+    )
+
+    assert terms == [
+        "theme",
+        "access_rights",
+        "http://example.com/theme/HEAL",
+        "cancer",
+        "http://example.com/access/PUBLIC",
+    ]
+
+
+def test_prefetch_is_disabled_by_default():
+    assert start_translation_prefetch({"facet.field": ["theme"]}, "nl") is None
+
+
+def test_prefetch_overlaps_with_search(enabled_prefetch):
+    lookup_started = threading.Event()
+    seen_markers = []
+
+    def get_translations(terms, lang=None):
+        seen_markers.append(request_marker.get())
+        lookup_started.set()
+        return {term: f"{term} (nl)" for term in terms}
+
+    def package_search(context, data_dict):
+        # Only returns once the translation lookup runs next to it.
+        assert lookup_started.wait(timeout=5)
+        return {
+            "count": 1,
+            "results": [{"name": "dataset-1", "theme": ["http://example.com/theme/HEAL"]}],
+            "search_facets": {"theme": {"title": "theme", "items": []}},
+        }
+
+    request_marker.set("request-1")
+    with patch.object(search_prefetch, "get_translations", side_effect=get_translations), patch.object(
+        search_pipeline, "get_translations", side_effect=get_translations
+    ) as remaining_lookup, patch(
+        "ckanext.gdi_userportal.logic.action.get.toolkit.get_action",
+        return_value=MagicMock(side_effect=package_search),
+    ), patch.object(search_pipeline, "get_request_language", return_value="nl"):
+        result = action_get.enhanced_package_search({}, {"facet.field": ["theme"]})
+
+    assert seen_markers[0] == "request-1"
+    assert "theme" not in remaining_lookup.call_args[0][0]
+    assert result["search_facets"]["theme"]["title"] == "theme (nl)"
+    assert result["results"][0]["theme"][0]["display_name"] == "http://example.com/theme/HEAL (nl)"
+    enabled_prefetch.remove.assert_called_once()
+
+
+def test_failed_prefetch_falls_back_to_all_values(enabled_prefetch):
+    with patch.object(search_prefetch, "get_translations", side_effect=RuntimeError("down")):
+        prefetch = start_translation_prefetch({"facet.field": ["theme"]}, "nl")
+        prefetched, remaining = resolve_translation_prefetch(prefetch, ["theme", "tags"])
+
+    assert prefetched == {}
+    assert remaining == ["theme", "tags"]
+    enabled_prefetch.remove.assert_called_once()
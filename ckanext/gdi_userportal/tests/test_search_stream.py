@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+
+from ckan.plugins import toolkit
+from ckanext.gdi_userportal import views
+from ckanext.gdi_userportal.logic.action.translation_utils import (
+    IN_PLACE_CONTEXT_KEY,
+    PackageTranslation,
+)
+
+STREAM_URL = "/api/gdi-userportal/enhanced_package_search/stream"
+STREAM_CONTEXT = {"user": "", IN_PLACE_CONTEXT_KEY: True}
+VIEWS_MODULE = "ckanext.gdi_userportal.views"
+PIPELINE_MODULE = "ckanext.gdi_userportal.logic.action.search_pipeline"
+
+
+@pytest.fixture
+def client():
+    flask_app = Flask(__name__)
+    for blueprint in views.get_blueprints():
+        flask_app.register_blueprint(blueprint)
+    with patch(f"{VIEWS_MODULE}._request_context", return_value={"user": ""}), patch(
+        f"{PIPELINE_MODULE}.get_request_language", return_value="nl"
+    ):
+        yield flask_app.test_client()
+
+
+def _search_result():
+    return {
+        "count": 2,
+        "sort": "score desc",
+        "results": [
+            {
+                "name": f"dataset-{index}",
+                "theme": ["http://example.com/theme/HEAL"],
+                "resources": [{"format": "http://example.com/format/CSV"}],
+            }
+            for index in range(2)
+        ],
+        "search_facets": {
+            "theme": {
+                "title": "theme",
+                "items": [{"name": "http://example.com/theme/HEAL", "count": 2}],
+            }
+        },
+    }
+
+
+def test_stream_matches_translated_search_result(client):
+    package_search = MagicMock(return_value=_search_result())
+    translations = {"http://example.com/theme/HEAL": "Gezondheid", "theme": "Thema"}
+
+    with patch(
+        f"{VIEWS_MODULE}.toolkit.get_action", return_value=package_search
+    ), patch(f"{PIPELINE_MODULE}.get_translations", return_value=translations) as get_translations:
+        response = client.get(f"{STREAM_URL}?q=cancer&rows=1000")
+        body = json.loads(response.get_data(as_text=True))
+
+    assert response.status_code == 200
+    package_search.assert_called_once_with(STREAM_CONTEXT, {"q": "cancer", "rows": "1000"})
+    get_translations.assert_called_once()
+    assert body["success"] is True
+    assert body["result"]["count"] == 2
+    assert body["result"]["search_facets"]["theme"]["title"] == "Thema"
+    assert [package["name"] for package in body["result"]["results"]] == [
+        "dataset-0",
+        "dataset-1",
+    ]
+    assert body["result"]["results"][0]["theme"] == [
+        {
+            "name": "http://example.com/theme/HEAL",
+            "display_name": "Gezondheid",
+            "count": None,
+        }
+    ]
+
+
+def test_stream_accepts_post_body_and_projection(client):
+    package_search = MagicMock(return_value=_search_result())
+
+    with patch(f"{VIEWS_MODULE}.toolkit.get_action", return_value=package_search), patch(
+        f"{PIPELINE_MODULE}.get_translations", return_value={}
+    ):
+        response = client.post(
+            STREAM_URL, json={"q": "cancer", "fl": ["name"], "include_resources": False}
+        )
+        body = json.loads(response.get_data(as_text=True))
+
+    package_search.assert_called_once_with(STREAM_CONTEXT, {"q": "cancer"})
+    assert body["result"]["results"] == [{"name": "dataset-0"}, {"name": "dataset-1"}]
+
+
+def test_stream_translates_packages_lazily(client):
+    package_search = MagicMock(return_value=_search_result())
+
+    with patch(f"{VIEWS_MODULE}.toolkit.get_action", return_value=package_search), patch(
+        f"{PIPELINE_MODULE}.get_translations", return_value={}
+    ), patch.object(
+        PackageTranslation, "patch", autospec=True, side_effect=PackageTranslation.patch
+    ) as patch_labels:
+        response = client.get(STREAM_URL)
+        chunks = response.response
+        assert patch_labels.call_count == 0
+        next(chunks)
+        assert patch_labels.call_count == 0
+        list(chunks)
+
+    assert [call.kwargs["key"] for call in patch_labels.call_args_list] == [0, 1]
+
+
+@pytest.mark.parametrize(
+    "error, status",
+    [
+        (toolkit.ValidationError({"rows": ["Must be a natural number"]}), 409),
+        (toolkit.NotAuthorized("no"), 403),
+    ],
+)
+def test_stream_reports_search_errors(client, error, status):
+    with patch(
+        f"{VIEWS_MODULE}.toolkit.get_action", return_value=MagicMock(side_effect=error)
+    ):
+        response = client.get(f"{STREAM_URL}?rows=-1")
+
+    assert response.status_code == status
+    assert response.get_json()["success"] is False
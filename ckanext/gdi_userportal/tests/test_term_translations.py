@@ -0,0 +1,207 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from datetime import datetime
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Blueprint, Flask
+
+from ckan.plugins import toolkit
+from ckanext.gdi_userportal import views
+from ckanext.gdi_userportal.logic.action.get import (
+    MAX_TERM_TRANSLATIONS,
+    gdi_term_translations_show,
+    package_show_etag,
+    term_translations_etag,
+)
+from ckanext.gdi_userportal.logic.auth.get import (
+    gdi_term_translations_show as gdi_term_translations_show_auth,
+)
+
+ACTION_MODULE = "ckanext.gdi_userportal.logic.action.get"
+
+
+@pytest.fixture
+def generation():
+    with patch(
+        f"{ACTION_MODULE}.get_current_translation_generation", return_value=3
+    ) as mocked:
+        yield mocked
+
+
+def test_gdi_term_translations_show_translates_terms_in_one_lookup(generation):
+    with patch(
+        f"{ACTION_MODULE}.get_translations", return_value={"http://example.com/a": "A-nl"}
+    ) as get_translations, patch(
+        f"{ACTION_MODULE}.get_request_language", return_value="nl;q=0.9, en;q=0.5"
+    ):
+        result = gdi_term_translations_show(
+            {}, {"terms": '["http://example.com/b", "http://example.com/a"]'}
+        )
+
+    assert result == {
+        "lang": "nl",
+        "generation": 3,
+        "translations": {"http://example.com/a": "A-nl"},
+    }
+    get_translations.assert_called_once_with(
+        ["http://example.com/a", "http://example.com/b"], lang="nl,en"
+    )
+
+
+def test_gdi_term_translations_show_prefers_explicit_language(generation):
+    with patch(f"{ACTION_MODULE}.get_translations", return_value={}), patch(
+        f"{ACTION_MODULE}.get_request_language", return_value="nl"
+    ):
+        result = gdi_term_translations_show({}, {"terms": ["a"], "lang": "en"})
+
+    assert result["lang"] == "en"
+
+
+@pytest.mark.parametrize(
+    "terms", [None, "", [], [f"term-{i}" for i in range(MAX_TERM_TRANSLATIONS + 1)]]
+)
+def test_gdi_term_translations_show_validates_terms(terms):
+    with pytest.raises(toolkit.ValidationError):
+        gdi_term_translations_show({}, {"terms": terms})
+
+
+def test_term_translations_etag_depends_on_generation_language_and_terms(generation):
+    with patch(f"{ACTION_MODULE}.get_request_language", return_value=None):
+        etag = term_translations_etag({"terms": ["a", "b"], "lang": "nl"})
+
+        assert etag == term_translations_etag({"terms": "b,a", "lang": "nl"})
+        assert etag != term_translations_etag({"terms": ["a", "b"], "lang": "en"})
+        assert etag != term_translations_etag({"terms": ["a"], "lang": "nl"})
+        generation.return_value = 4
+        assert etag != term_translations_etag({"terms": ["a", "b"], "lang": "nl"})
+
+
+def test_term_translations_auth_allows_access():
+    assert gdi_term_translations_show_auth({}, {}) == {"success": True}
+
+
+@pytest.fixture
+def app():
+    action = MagicMock(return_value=json.dumps({"success": True}))
+    api = Blueprint("api", __name__)
+    api.add_url_rule(
+        "/api/3/action/<logic_function>",
+        endpoint="action",
+        view_func=lambda logic_function: action(),
+    )
+
+    flask_app = Flask(__name__)
+    flask_app.register_blueprint(api)
+    for blueprint in views.get_blueprints():
+        flask_app.register_blueprint(blueprint)
+    flask_app.action = action
+    return flask_app
+
+
+def test_conditional_action_response_carries_etag(app):
+    with patch.dict(
+        views.CONDITIONAL_ACTIONS, {"gdi_term_translations_show": lambda data_dict: "abc"}
+    ):
+        response = app.test_client().get("/api/3/action/gdi_term_translations_show?terms=a")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == '"abc"'
+    assert response.headers["Cache-Control"] == views.CACHE_CONTROL
+    assert "Accept-Language" in response.headers["Vary"]
+
+
+def test_conditional_action_answers_not_modified_without_running_action(app):
+    etag_function = MagicMock(return_value="abc")
+
+    with patch.dict(views.CONDITIONAL_ACTIONS, {"gdi_term_translations_show": etag_function}):
+        response = app.test_client().get(
+            "/api/3/action/gdi_term_translations_show?terms=a&terms=b",
+            headers={"If-None-Match": '"abc"'},
+        )
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"abc"'
+    etag_function.assert_called_once_with({"terms": ["a", "b"]})
+    app.action.assert_not_called()
+
+
+def test_other_actions_are_not_conditional(app):
+    response = app.test_client().get("/api/3/action/package_show?id=a")
+
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+
+
+def test_conditional_action_ignores_etag_errors(app):
+    with patch.dict(
+        views.CONDITIONAL_ACTIONS,
+        {"gdi_term_translations_show": MagicMock(side_effect=toolkit.ValidationError({}))},
+    ):
+        response = app.test_client().get("/api/3/action/gdi_term_translations_show")
+
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+
+
+@pytest.fixture
+def package():
+    package = MagicMock(id="dataset-id", metadata_modified=datetime(2026, 1, 2, 3, 4, 5))
+    with patch(f"{ACTION_MODULE}.model.Package.get", return_value=package), patch(
+        f"{ACTION_MODULE}.toolkit.check_access"
+    ) as check_access, patch(
+        f"{ACTION_MODULE}._request_context", return_value={"user": "reader"}
+    ), patch(
+        f"{ACTION_MODULE}.get_request_language", return_value="nl"
+    ):
+        package.check_access = check_access
+        yield package
+
+
+def test_package_show_etag_depends_on_modification_language_and_generation(
+    package, generation
+):
+    etag = package_show_etag({"id": "dataset-name"})
+
+    assert etag == package_show_etag({"id": "dataset-name"})
+    package.check_access.assert_called_with(
+        "package_show", {"user": "reader"}, {"id": "dataset-id"}
+    )
+
+    with patch(f"{ACTION_MODULE}.get_request_language", return_value="en"):
+        assert etag != package_show_etag({"id": "dataset-name"})
+
+    generation.return_value = 4
+    assert etag != package_show_etag({"id": "dataset-name"})
+    generation.return_value = 3
+
+    package.metadata_modified = datetime(2026, 1, 3)
+    assert etag != package_show_etag({"id": "dataset-name"})
+
+
+def test_package_show_etag_checks_access(package, generation):
+    package.check_access.side_effect = toolkit.NotAuthorized()
+
+    with pytest.raises(toolkit.NotAuthorized):
+        package_show_etag({"id": "dataset-name"})
+
+
+def test_package_show_etag_requires_existing_package(generation):
+    with patch(f"{ACTION_MODULE}.model.Package.get", return_value=None):
+        with pytest.raises(toolkit.ObjectNotFound):
+            package_show_etag({"id": "missing"})
+
+
+def test_package_show_not_modified_response_is_private(app):
+    with patch.dict(views.CONDITIONAL_ACTIONS, {"enhanced_package_show": lambda data_dict: "abc"}):
+        response = app.test_client().get(
+            "/api/3/action/enhanced_package_show?id=dataset-name",
+            headers={"If-None-Match": '"abc"'},
+        )
+
+    assert response.status_code == 304
+    assert response.headers["Cache-Control"] == views.PRIVATE_CACHE_CONTROL
+    app.action.assert_not_called()
@@ -0,0 +1,459 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ckanext.gdi_userportal.logic.action import translation_cache
+from ckanext.gdi_userportal.logic.action.translation_cache import (
+    GenerationWatcher,
+    PrefixKeyStore,
+    RedisTranslationCache,
+    SnapshotHolder,
+    TTLCache,
+    TranslationCache,
+    TranslationSnapshot,
+)
+from ckanext.gdi_userportal.logic.action.translation_utils import (
+    get_all_translations,
+    get_translations,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _translation_rows(*rows):
+    return [
+        {"term": term, "term_translation": translation, "lang_code": lang_code}
+        for term, translation, lang_code in rows
+    ]
+
+
+def test_ttl_cache_expires_entries():
+    clock = FakeClock()
+    cache = TTLCache(max_size=10, ttl=5, clock=clock)
+    cache.set_many({"a": 1})
+
+    assert cache.get_many(["a"]) == {"a": 1}
+
+    clock.now = 5
+    assert cache.get_many(["a"]) == {}
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set_many({"a": 1, "b": 2})
+    cache.get_many(["a"])
+    cache.set_many({"c": 3})
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+
+
+def test_generation_watcher_polls_at_most_once_per_interval():
+    clock = FakeClock()
+    loader = MagicMock(side_effect=["1", "2"])
+    watcher = GenerationWatcher(loader, poll_interval=30, clock=clock)
+
+    assert watcher.poll() is True
+    clock.now = 10
+    assert watcher.poll() is False
+    clock.now = 30
+    assert watcher.poll() is True
+    assert loader.call_count == 2
+    assert watcher.generation == "2"
+
+
+def test_generation_watcher_ignores_loader_errors():
+    watcher = GenerationWatcher(MagicMock(side_effect=RuntimeError), poll_interval=0)
+
+    assert watcher.poll() is False
+
+
+def test_translation_cache_fetches_only_missing_terms():
+    cache = TranslationCache(TTLCache(max_size=100, ttl=60))
+    fetch = MagicMock(
+        side_effect=[
+            {("a", "nl"): "A-nl", ("a", "en"): "A-en", ("b", "en"): "B-en"},
+            {("c", "en"): "C-en"},
+        ]
+    )
+
+    first = cache.lookup(["a", "b"], ("nl", "en"), fetch)
+    second = cache.lookup(["a", "c"], ("nl", "en"), fetch)
+
+    assert first == {("a", "nl"): "A-nl", ("a", "en"): "A-en", ("b", "en"): "B-en"}
+    assert second == {("a", "nl"): "A-nl", ("a", "en"): "A-en", ("c", "en"): "C-en"}
+    fetch.assert_any_call(["a", "b"], ("nl", "en"))
+    fetch.assert_called_with(["c"], ("nl", "en"))
+
+
+def test_translation_cache_is_cleared_when_generation_changes():
+    clock = FakeClock()
+    generations = iter(["1", "2"])
+    watcher = GenerationWatcher(lambda: next(generations), poll_interval=30, clock=clock)
+    cache = TranslationCache(TTLCache(max_size=100, ttl=3600), watcher)
+    fetch = MagicMock(
+        side_effect=[
+            {("a", "en"): "old"},
+            {("a", "en"): "new"},
+        ]
+    )
+
+    assert cache.lookup(["a"], ("en",), fetch) == {("a", "en"): "old"}
+    assert cache.lookup(["a"], ("en",), fetch) == {("a", "en"): "old"}
+    clock.now = 30
+    assert cache.lookup(["a"], ("en",), fetch) == {("a", "en"): "new"}
+    assert fetch.call_count == 2
+
+
+def test_get_translations_only_refetches_uncached_terms():
+    cache = TranslationCache(TTLCache(max_size=100, ttl=60))
+    translation_show = MagicMock(
+        return_value=_translation_rows(
+            ("http://example.com/a", "A", "en"),
+            ("http://example.com/a", "A-nl", "nl"),
+            ("http://example.com/b", "B", "en"),
+        )
+    )
+
+    with patch(
+        "ckanext.gdi_userportal.logic.action.translation_utils.is_translation_cache_enabled",
+        return_value=True,
+    ), patch(
+        "ckanext.gdi_userportal.logic.action.translation_utils.get_translation_cache",
+        return_value=cache,
+    ), patch(
+        "ckanext.gdi_userportal.logic.action.translation_utils.toolkit.get_action",
+        return_value=translation_show,
+    ):
+        values = ["http://example.com/a", "http://example.com/b", ""]
+        first = get_translations(values, lang="nl")
+        second = get_translations(values, lang="nl")
+
+    expected = {"http://example.com/a": "A-nl", "http://example.com/b": "B"}
+    assert first == expected
+    assert second == expected
+    assert translation_show.call_count == 2
+    translation_show.assert_called_with(
+        {},
+        {"terms": ["http://example.com/b"], "lang_codes": ("nl", "en")},
+    )
+
+
+def test_translation_snapshot_is_immutable_and_answers_lookups():
+    snapshot = TranslationSnapshot.from_rows(
+        _translation_rows(
+            ("a", "A", "en"),
+            ("a", "A-nl", "nl"),
+            ("b", "B", "en"),
+        )
+        + [{"term": None, "term_translation": "ignored", "lang_code": "en"}]
+    )
+
+    assert len(snapshot) == 2
+    assert snapshot.lookup(["a", "b", "missing"], ("nl", "en")) == {
+        ("a", "nl"): "A-nl",
+        ("a", "en"): "A",
+        ("b", "en"): "B",
+    }
+    assert snapshot.translations_for("a") == ["A", "A-nl"]
+    with pytest.raises(TypeError):
+        snapshot._table["c"] = {}
+
+
+def test_translation_snapshot_resolves_language_chains_once():
+    snapshot = TranslationSnapshot(
+        {"a": {"en": "A", "nl": "A-nl"}, "b": {"en": "B"}, "c": {"nl": "C-nl"}}
+    )
+
+    resolved = snapshot.resolved(("nl", "en"))
+
+    assert dict(resolved) == {"a": "A-nl", "b": "B", "c": "C-nl"}
+    assert dict(snapshot.resolved(("en",))) == {"a": "A", "b": "B"}
+    assert snapshot.resolved(("nl", "en")) is resolved
+
+
+def test_snapshot_holder_reloads_when_generation_changes():
+    clock = FakeClock()
+    generations = iter(["1", "1", "2"])
+    watcher = GenerationWatcher(lambda: next(generations), poll_interval=30, clock=clock)
+    loader = MagicMock(
+        side_effect=[
+            TranslationSnapshot({"a": {"en": "old"}}),
+            TranslationSnapshot({"a": {"en": "new"}}),
+        ]
+    )
+    holder = SnapshotHolder(loader, watcher)
+
+    assert holder.get().lookup(["a"], ("en",)) == {("a", "en"): "old"}
+    clock.now = 30
+    assert holder.get().lookup(["a"], ("en",)) == {("a", "en"): "old"}
+    clock.now = 60
+    assert holder.get().lookup(["a"], ("en",)) == {("a", "en"): "new"}
+    assert loader.call_count == 2
+
+
+def test_get_translations_answers_from_snapshot_when_enabled():
+    translation_show = MagicMock(
+        return_value=_translation_rows(
+            ("http://example.com/a", "A", "en"),
+            ("http://example.com/a", "A-nl", "nl"),
+            ("http://example.com/b", "B", "en"),
+        )
+    )
+
+    translation_cache.reset_translation_cache()
+    try:
+        with patch(
+            "ckanext.gdi_userportal.logic.action.translation_utils.is_translation_snapshot_enabled",
+            return_value=True,
+        ), patch(
+            "ckanext.gdi_userportal.logic.action.translation_cache._load_translation_generation",
+            return_value="1",
+        ), patch(
+            "ckanext.gdi_userportal.logic.action.translation_cache.toolkit.get_action",
+            return_value=translation_show,
+        ):
+            first = get_translations(["http://example.com/a", "http://example.com/b"], lang="nl")
+            second = get_translations(["http://example.com/a"], lang="en")
+            all_translations = get_all_translations(["http://example.com/a", "unknown"])
+    finally:
+        translation_cache.reset_translation_cache()
+
+    assert first == {"http://example.com/a": "A-nl", "http://example.com/b": "B"}
+    assert second == {"http://example.com/a": "A"}
+    assert all_translations == {"http://example.com/a": ["A", "A-nl"]}
+    translation_show.assert_called_once_with(
+        {}, {"terms": [], "lang_codes": ("en", "nl")}
+    )
+
+
+@pytest.fixture
+def fake_redis():
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeRedis()
+
+
+def test_redis_translation_cache_stores_one_hash_per_language(fake_redis):
+    watcher = GenerationWatcher(lambda: "7", poll_interval=30)
+    cache = RedisTranslationCache(lambda: fake_redis, ttl=60, watcher=watcher)
+    fetch = MagicMock(return_value={("a", "nl"): "A-nl", ("a", "en"): "A", ("b", "en"): "B"})
+
+    first = cache.lookup(["a", "b"], ("nl", "en"), fetch)
+
+    assert first == {("a", "nl"): "A-nl", ("a", "en"): "A", ("b", "en"): "B"}
+    assert fake_redis.hgetall("ckanext-gdi_userportal:term_translation:7:nl") == {
+        b"a": b"A-nl"
+    }
+    assert fake_redis.hgetall("ckanext-gdi_userportal:term_translation:7:en") == {
+        b"a": b"A",
+        b"b": b"B",
+    }
+    assert 0 < fake_redis.ttl("ckanext-gdi_userportal:term_translation:7:en") <= 60
+
+
+def test_redis_translation_cache_is_shared_between_instances(fake_redis):
+    fetch = MagicMock(return_value={("a", "en"): "A"})
+    RedisTranslationCache(lambda: fake_redis, ttl=60).lookup(["a"], ("en",), fetch)
+
+    other_worker_fetch = MagicMock()
+    result = RedisTranslationCache(lambda: fake_redis, ttl=60).lookup(
+        ["a"], ("en",), other_worker_fetch
+    )
+
+    assert result == {("a", "en"): "A"}
+    other_worker_fetch.assert_not_called()
+
+
+def test_redis_translation_cache_uses_new_keys_per_generation(fake_redis):
+    generations = iter(["1", "2"])
+    watcher = GenerationWatcher(lambda: next(generations), poll_interval=0)
+    cache = RedisTranslationCache(lambda: fake_redis, ttl=60, watcher=watcher)
+    fetch = MagicMock(side_effect=[{("a", "en"): "old"}, {("a", "en"): "new"}])
+
+    assert cache.lookup(["a"], ("en",), fetch) == {("a", "en"): "old"}
+    assert cache.lookup(["a"], ("en",), fetch) == {("a", "en"): "new"}
+
+
+def test_redis_translation_cache_falls_back_to_fetch_on_errors():
+    def broken_client():
+        raise ConnectionError("redis down")
+
+    fetch = MagicMock(return_value={("a", "en"): "A"})
+    cache = RedisTranslationCache(broken_client, ttl=60)
+
+    assert cache.lookup(["a"], ("en",), fetch) == {("a", "en"): "A"}
+    fetch.assert_called_once_with(["a"], ("en",))
+
+
+def test_get_translations_stacks_local_and_redis_caches(fake_redis):
+    translation_show = MagicMock(
+        return_value=_translation_rows(("http://example.com/a", "A", "en"))
+    )
+    local_cache = TranslationCache(TTLCache(max_size=100, ttl=60))
+    redis_cache = RedisTranslationCache(lambda: fake_redis, ttl=60)
+
+    with patch(
+        "ckanext.gdi_userportal.logic.action.translation_utils.is_translation_cache_enabled",
+        return_value=True,
+    ), patch(
+        "ckanext.gdi_userportal.logic.action.translation_utils.is_redis_translation_cache_enabled",
+        return_value=True,
+    ), patch(
+        "ckanext.gdi_userportal.logic.action.translation_utils.get_translation_cache",
+        return_value=local_cache,
+    ), patch(
+        "ckanext.gdi_userportal.logic.action.translation_utils.get_redis_translation_cache",
+        return_value=redis_cache,
+    ), patch(
+        "ckanext.gdi_userportal.logic.action.translation_utils.toolkit.get_action",
+        return_value=translation_show,
+    ):
+        assert get_translations(["http://example.com/a"], lang="en") == {
+            "http://example.com/a": "A"
+        }
+        local_cache.clear()
+        assert get_translations(["http://example.com/a"], lang="en") == {
+            "http://example.com/a": "A"
+        }
+
+    translation_show.assert_called_once()
+
+
+def test_translation_cache_remembers_untranslated_terms():
+    clock = FakeClock()
+    cache = TranslationCache(
+        TTLCache(max_size=100, ttl=3600, clock=clock),
+        untranslated=TTLCache(max_size=100, ttl=60, clock=clock),
+    )
+    fetch = MagicMock(return_value={("a", "en"): "A"})
+
+    cache.lookup(["a", "free text"], ("nl", "en"), fetch)
+    result = cache.lookup(["a", "free text"], ("nl", "en"), fetch)
+
+    assert result == {("a", "en"): "A"}
+    fetch.assert_called_once_with(["a", "free text"], ("nl", "en"))
+
+    clock.now = 60
+    cache.lookup(["a", "free text"], ("nl", "en"), fetch)
+    fetch.assert_called_with(["a", "free text"], ("nl", "en"))
+    assert fetch.call_count == 2
+
+
+def test_translation_cache_only_fetches_unknown_terms_with_untranslated_cache():
+    cache = TranslationCache(
+        TTLCache(max_size=100, ttl=60),
+        untranslated=TTLCache(max_size=100, ttl=60),
+    )
+    fetch = MagicMock(side_effect=[{}, {("new", "en"): "New"}])
+
+    cache.lookup(["publisher name"], ("en",), fetch)
+    result = cache.lookup(["publisher name", "new"], ("en",), fetch)
+
+    assert result == {("new", "en"): "New"}
+    fetch.assert_called_with(["new"], ("en",))
+
+
+def test_redis_translation_cache_remembers_untranslated_terms(fake_redis):
+    cache = RedisTranslationCache(lambda: fake_redis, ttl=3600, untranslated_ttl=60)
+    fetch = MagicMock(return_value={("a", "en"): "A"})
+
+    cache.lookup(["a", "free text"], ("en",), fetch)
+    result = cache.lookup(["a", "free text"], ("en",), fetch)
+
+    assert result == {("a", "en"): "A"}
+    fetch.assert_called_once()
+    untranslated_key = "ckanext-gdi_userportal:term_translation:0:en:untranslated"
+    assert fake_redis.hgetall(untranslated_key) == {b"free text": b"1"}
+    assert 0 < fake_redis.ttl(untranslated_key) <= 60
+
+
+def test_term_translation_update_invalidates_translation_caches():
+    from ckanext.gdi_userportal.logic.action import post as action_post
+
+    original_action = MagicMock(return_value={"term": "a"})
+
+    with patch(
+        "ckanext.gdi_userportal.logic.action.translation_cache.reset_translation_cache"
+    ) as reset, patch(
+        "ckanext.gdi_userportal.migrations.bump_translation_generation",
+        return_value=3,
+    ) as bump:
+        result = action_post.term_translation_update(
+            original_action, {}, {"term": "a", "term_translation": "A", "lang_code": "en"}
+        )
+
+    assert result == {"term": "a"}
+    original_action.assert_called_once()
+    bump.assert_called_once_with()
+    reset.assert_called_once_with()
+
+
+def test_translation_cache_interns_cached_terms():
+    term = "http://publications.europa.eu/resource/authority/data-theme/HEAL"
+
+    def fetch(terms, lang_codes):
+        # Each row carries its own copy of the term, as database rows do.
+        return {("".join(list(term)), lang_code): "Health" for lang_code in lang_codes}
+
+    cache = TranslationCache(TTLCache(max_size=10, ttl=60))
+    cache.lookup([term], ("en", "nl"), fetch)
+
+    cached_terms = [key[0] for key in cache.entries._entries]
+    assert len(cached_terms) == 2
+    assert cached_terms[0] is cached_terms[1]
+    assert cached_terms[0] is translation_cache.intern_term("".join(list(term)))
+
+
+def test_prefix_key_store_behaves_like_a_read_only_mapping():
+    store = PrefixKeyStore(
+        {
+            "http://publications.europa.eu/resource/authority/language/NLD": "Dutch",
+            "http://publications.europa.eu/resource/authority/language/ENG": "English",
+            "https://www.iana.org/assignments/media-types/text/csv": "CSV",
+            "plain": "Plain",
+        }
+    )
+
+    assert len(store) == 4
+    assert store["http://publications.europa.eu/resource/authority/language/NLD"] == "Dutch"
+    assert store.get("https://www.iana.org/assignments/media-types/text/csv") == "CSV"
+    assert store["plain"] == "Plain"
+    assert "http://publications.europa.eu/resource/authority/language/" not in store
+    assert store.get("http://publications.europa.eu/resource/authority/language/FRA") is None
+    assert store.get(None, "default") == "default"
+    assert dict(store) == dict(store.items())
+    assert len(store._buckets) == 3
+    with pytest.raises(KeyError):
+        store["missing"]
+    with pytest.raises(TypeError):
+        store["plain"] = "changed"
+
+
+def test_translation_snapshot_with_compact_keys_shares_key_prefixes():
+    snapshot = TranslationSnapshot.from_rows(
+        _translation_rows(
+            ("http://publications.europa.eu/resource/authority/file-type/CSV", "CSV", "en"),
+            ("http://publications.europa.eu/resource/authority/file-type/PDF", "PDF", "en"),
+        ),
+        compact_keys=True,
+    )
+
+    resolved = snapshot.resolved(("en",))
+
+    assert list(resolved._buckets) == [
+        "http://publications.europa.eu/resource/authority/file-type/"
+    ]
+    assert resolved["http://publications.europa.eu/resource/authority/file-type/PDF"] == "PDF"
+    assert snapshot.translations_for(
+        "http://publications.europa.eu/resource/authority/file-type/CSV"
+    ) == ["CSV"]
@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ckanext.gdi_userportal.logic.action import translation_compiled
+from ckanext.gdi_userportal.logic.action.translation_compiled import (
+    COMPILED_PATH_CONFIG,
+    CompiledTranslations,
+    CompiledTranslationsHolder,
+    compile_translations,
+    write_compiled_translations,
+)
+from ckanext.gdi_userportal.logic.action.translation_utils import get_translations
+
+
+ROWS = [
+    {"term": "http://example.com/b", "term_translation": "B", "lang_code": "en"},
+    {"term": "http://example.com/a", "term_translation": "A", "lang_code": "en"},
+    {"term": "http://example.com/a", "term_translation": "A-nl", "lang_code": "nl"},
+    {"term": "Ökologie", "term_translation": "Ecology", "lang_code": "en"},
+    {"term": "http://example.com/c", "term_translation": "C-fr", "lang_code": "fr"},
+]
+
+
+@pytest.fixture
+def compiled_path(tmp_path):
+    path = str(tmp_path / "translations.bin")
+    write_compiled_translations(path, ROWS, ["nl", "en"], generation=3)
+    return path
+
+
+def test_write_compiled_translations_skips_unsupported_languages(tmp_path):
+    path = str(tmp_path / "translations.bin")
+
+    assert write_compiled_translations(path, ROWS, ["en", "nl"]) == 3
+    assert [name for name in os.listdir(tmp_path)] == ["translations.bin"]
+
+
+def test_compiled_translations_binary_search(compiled_path):
+    compiled = CompiledTranslations(compiled_path)
+
+    assert len(compiled) == 3
+    assert compiled.generation == 3
+    assert compiled.lang_codes == ("en", "nl")
+    assert compiled.get("http://example.com/a") == {"en": "A", "nl": "A-nl"}
+    assert compiled.get("http://example.com/b") == {"en": "B"}
+    assert compiled.get("Ökologie") == {"en": "Ecology"}
+    assert compiled.get("http://example.com/c") == {}
+    assert compiled.get("") == {}
+    compiled.close()
+
+
+def test_compiled_translations_lookup_matches_term_translation_keys(compiled_path):
+    compiled = CompiledTranslations(compiled_path)
+
+    assert compiled.lookup(
+        ["http://example.com/a", "http://example.com/b", None, "missing"], ("nl", "en")
+    ) == {
+        ("http://example.com/a", "nl"): "A-nl",
+        ("http://example.com/a", "en"): "A",
+        ("http://example.com/b", "en"): "B",
+    }
+    compiled.close()
+
+
+def test_compiled_translations_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"\x00" * 64)
+
+    with pytest.raises(ValueError):
+        CompiledTranslations(str(path))
+
+
+def test_compiled_translations_holder_reopens_replaced_file(compiled_path):
+    holder = CompiledTranslationsHolder(compiled_path, check_interval=0)
+
+    with patch.object(
+        translation_compiled, "get_current_translation_generation", return_value=3
+    ):
+        assert holder.get().get("http://example.com/b") == {"en": "B"}
+
+        write_compiled_translations(
+            compiled_path,
+            [{"term": "http://example.com/b", "term_translation": "B-nl", "lang_code": "nl"}],
+            ["en", "nl"],
+            generation=3,
+        )
+        assert holder.get().get("http://example.com/b") == {"nl": "B-nl"}
+
+
+def test_compiled_translations_holder_ignores_stale_generation(compiled_path):
+    holder = CompiledTranslationsHolder(compiled_path, check_interval=0)
+
+    with patch.object(
+        translation_compiled, "get_current_translation_generation", return_value=4
+    ):
+        assert holder.get() is None
+
+
+def test_compiled_translations_holder_handles_missing_file(tmp_path):
+    holder = CompiledTranslationsHolder(str(tmp_path / "missing.bin"), check_interval=0)
+
+    assert holder.get() is None
+
+
+def test_get_translations_reads_compiled_file(compiled_path):
+    translation_compiled.reset_compiled_translations()
+    try:
+        with patch.dict(
+            "ckanext.gdi_userportal.logic.action.translation_compiled.config",
+            {COMPILED_PATH_CONFIG: compiled_path},
+        ), patch.object(
+            translation_compiled, "get_current_translation_generation", return_value=3
+        ), patch(
+            "ckanext.gdi_userportal.logic.action.translation_utils.toolkit.get_action"
+        ) as get_action:
+            result = get_translations(
+                ["http://example.com/a", "http://example.com/b", "missing"], lang="nl"
+            )
+    finally:
+        translation_compiled.reset_compiled_translations()
+
+    assert result == {"http://example.com/a": "A-nl", "http://example.com/b": "B"}
+    get_action.assert_not_called()
+
+
+def test_compile_translations_dumps_term_translation_table(tmp_path):
+    path = str(tmp_path / "translations.bin")
+    translation_show = MagicMock(return_value=ROWS)
+
+    with patch(
+        "ckanext.gdi_userportal.logic.action.translation_compiled.toolkit.get_action",
+        return_value=translation_show,
+    ), patch(
+        "ckanext.gdi_userportal.migrations.get_translation_generation", return_value=7
+    ):
+        assert compile_translations(path, {"nl", "en"}) == 3
+
+    translation_show.assert_called_once_with(
+        {}, {"terms": [], "lang_codes": ("en", "nl")}
+    )
+    assert CompiledTranslations(path).generation == 7
@@ -16,9 +16,25 @@ for path in (ROOT_DIR, SRC_DIR):
 
 from unittest.mock import patch
 
+import pytest
+
+from ckan.plugins import toolkit
+
 from ckanext.gdi_userportal.logic.action.translation_utils import (
+    _apply_translated_properties,
     _merge_tags_translated_into_tags,
+    _parse_accept_language,
+    _resolve_translations,
+    collect_search_values_to_translate,
     collect_values_to_translate,
+    compile_translation_plan,
+    FieldPlan,
+    get_language_chain,
+    get_preferred_language,
+    get_translations,
+    PackageTranslation,
+    parse_field_list,
+    project_package,
     replace_package,
     replace_search_facets,
 )
@@ -239,21 +255,52 @@ def test_replace_search_facets_translates_titles():
         }
     }
 
-    translation_dict = {"science": "Wetenschap"}
+    translation_dict = {"Theme": "Thema", "science": "Wetenschap"}
 
     with patch(
-        "ckanext.gdi_userportal.logic.action.translation_utils.get_translations",
-        return_value={"Theme": "Thema"},
+        "ckanext.gdi_userportal.logic.action.translation_utils.get_translations"
     ) as mocked_get_translations:
         result = replace_search_facets(facets, translation_dict, lang="nl")
 
-    mocked_get_translations.assert_called_once_with(["Theme"], lang="nl")
+    mocked_get_translations.assert_not_called()
     theme_facet = result["theme"]
     assert theme_facet["title"] == "Thema"
     assert theme_facet["items"][0]["display_name"] == "health"
     assert theme_facet["items"][1]["display_name"] == "Wetenschap"
 
 
+def test_collect_search_values_to_translate_includes_facets():
+    result = {
+        "results": [{"theme": ["http://example.com/theme/HEAL"], "resources": []}],
+        "search_facets": {
+            "theme": {
+                "title": "theme",
+                "items": [
+                    {"name": "http://example.com/theme/HEAL"},
+                    {"name": "http://example.com/theme/ECON"},
+                ],
+            },
+            "tags": {"title": "tags", "items": []},
+        },
+    }
+
+    assert collect_search_values_to_translate(result) == [
+        "http://example.com/theme/HEAL",
+        "theme",
+        "http://example.com/theme/ECON",
+        "tags",
+    ]
+
+
+def test_get_translations_skips_lookup_without_terms():
+    with patch(
+        "ckanext.gdi_userportal.logic.action.translation_utils.toolkit.get_action"
+    ) as get_action:
+        assert get_translations([None, ""], lang="nl") == {}
+
+    get_action.assert_not_called()
+
+
 def test_replace_search_facets_falls_back_to_term_name():
     facets = {
         "format": {
@@ -368,6 +415,61 @@ def test_collect_values_to_translate_includes_nested_fields():
     assert "http://example.com/org-type" in values
 
 
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("nl", ("nl",)),
+        ("nl-BE,nl;q=0.9,en;q=0.8", ("nl", "en")),
+        ("en;q=0.5, nl;q=0.9", ("nl", "en")),
+        ("fr-FR, de;q=0.7, nl;q=0.3", ("fr", "de", "nl")),
+        ("nl;q=0, en", ("en",)),
+        ("*;q=0.1, nl_NL", ("nl",)),
+        ("nl;q=abc, en", ("en",)),
+        ("", ()),
+    ],
+)
+def test_parse_accept_language_orders_by_quality(header, expected):
+    assert _parse_accept_language(header) == expected
+
+
+def test_parse_accept_language_is_memoized_per_header():
+    _parse_accept_language.cache_clear()
+
+    _parse_accept_language("nl;q=0.8, en")
+    _parse_accept_language("nl;q=0.8, en")
+
+    assert _parse_accept_language.cache_info().hits == 1
+
+
+@pytest.mark.parametrize(
+    "header, expected_chain",
+    [
+        ("nl", ("nl", "en")),
+        ("en", ("en",)),
+        ("fr, nl;q=0.8", ("nl", "en")),
+        ("fr", ("en",)),
+    ],
+)
+def test_get_language_chain_keeps_supported_languages_and_fallback(header, expected_chain):
+    assert get_language_chain(header) == expected_chain
+    assert get_preferred_language(header) == expected_chain[0]
+
+
+def test_resolve_translations_prefers_earliest_language_in_chain():
+    translation_table = {
+        ("a", "en"): "A",
+        ("a", "nl"): "A-nl",
+        ("b", "en"): "B",
+        ("c", "de"): "C-de",
+    }
+
+    assert _resolve_translations(translation_table, ("nl", "en")) == {
+        "a": "A-nl",
+        "b": "B",
+    }
+    assert _resolve_translations(translation_table, ("en",)) == {"a": "A", "b": "B"}
+
+
 class TestMergeTagsTranslatedIntoTags:
     """Tests for _merge_tags_translated_into_tags function."""
 
@@ -539,3 +641,236 @@ class TestMergeTagsTranslatedIntoTags:
 
         assert "existing" in data["tags"]
         assert "valid-tag" in data["tags"]
+
+
+@pytest.mark.parametrize(
+    "fl, expected",
+    [
+        (None, None),
+        ("", None),
+        ("name,title theme", ["name", "title", "theme"]),
+        (["name", " title ", "name"], ["name", "title"]),
+    ],
+)
+def test_parse_field_list(fl, expected):
+    assert parse_field_list(fl) == expected
+
+
+def test_parse_field_list_rejects_invalid_values():
+    with pytest.raises(toolkit.ValidationError):
+        parse_field_list({"name": True})
+
+
+def test_project_package_keeps_translated_companions():
+    package = _base_package()
+    package["theme"] = ["http://example.com/theme/HEAL"]
+
+    assert project_package(package, ["title", "theme", "missing"]) == {
+        "title": "Original title",
+        "title_translated": {"en": "English Title", "nl": "Nederlandse titel"},
+        "theme": ["http://example.com/theme/HEAL"],
+    }
+
+
+def test_projected_package_only_translates_requested_fields():
+    package = _base_package()
+    package["theme"] = ["http://example.com/theme/HEAL"]
+    package["resources"][0]["format"] = "http://example.com/format/CSV"
+    fields = ["title", "theme"]
+    projected = project_package(package, fields)
+
+    assert collect_values_to_translate(projected, fields=fields) == [
+        "http://example.com/theme/HEAL"
+    ]
+    assert collect_values_to_translate(package, fields=fields) == [
+        "http://example.com/theme/HEAL"
+    ]
+
+    result = replace_package(
+        projected,
+        {"http://example.com/theme/HEAL": "Gezondheid"},
+        lang="nl",
+        fields=fields,
+    )
+
+    assert set(result) == {"title", "title_translated", "theme"}
+    assert result["title"] == "Nederlandse titel"
+    assert result["theme"] == [
+        {
+            "name": "http://example.com/theme/HEAL",
+            "display_name": "Gezondheid",
+            "count": None,
+        }
+    ]
+
+
+def test_resources_are_neither_collected_nor_translated_when_excluded():
+    package = _base_package()
+    package["theme"] = ["http://example.com/theme/HEAL"]
+    package["resources"][0]["format"] = "http://example.com/format/CSV"
+    package["resources"][0]["access_services"] = [{"format": "http://example.com/format/API"}]
+
+    values = collect_values_to_translate(package, include_resources=False)
+    assert "http://example.com/theme/HEAL" in values
+    assert "http://example.com/format/CSV" not in values
+    assert "http://example.com/format/API" not in values
+
+    result = replace_package(
+        package,
+        {"http://example.com/format/CSV": "CSV"},
+        lang="en",
+        include_resources=False,
+    )
+
+    assert result["resources"][0]["format"] == "http://example.com/format/CSV"
+    assert result["resources"][0]["access_services"] == [
+        {"format": "http://example.com/format/API"}
+    ]
+
+
+def test_compile_translation_plan_resolves_nested_fields():
+    plan = compile_translation_plan(
+        package_fields=["theme", "provenance_activity"],
+        resource_fields=["format"],
+        access_service_fields=[],
+    )
+
+    assert plan.package == (
+        FieldPlan("theme"),
+        FieldPlan(
+            "provenance_activity",
+            (
+                FieldPlan("type"),
+                FieldPlan(
+                    "wasAssociatedWith",
+                    (FieldPlan("actedOnBehalfOf", (FieldPlan("type"),)), FieldPlan("type")),
+                ),
+            ),
+        ),
+    )
+    assert plan.resource == (FieldPlan("format"),)
+    assert plan.access_service == ()
+
+
+def test_plan_collects_and_translates_deeply_nested_values():
+    package = {
+        "provenance_activity": [
+            {
+                "type": "http://example.com/activity",
+                "wasAssociatedWith": [
+                    {
+                        "type": "http://example.com/org",
+                        "actedOnBehalfOf": [{"type": "http://example.com/agency"}],
+                        "name": "Not translated",
+                    }
+                ],
+            }
+        ]
+    }
+
+    assert sorted(collect_values_to_translate(package)) == [
+        "http://example.com/activity",
+        "http://example.com/agency",
+        "http://example.com/org",
+    ]
+
+    result = replace_package(
+        deepcopy(package), {"http://example.com/agency": "Agentschap"}, lang="nl"
+    )
+    associated = result["provenance_activity"][0]["wasAssociatedWith"][0]
+    assert associated["name"] == "Not translated"
+    assert associated["actedOnBehalfOf"][0]["type"] == {
+        "name": "http://example.com/agency",
+        "display_name": "Agentschap",
+        "count": None,
+    }
+
+
+def test_package_translation_patches_staged_packages_by_key():
+    packages = [
+        {"theme": ["http://example.com/theme/HEAL"], "resources": []},
+        {"theme": ["http://example.com/theme/TECH", "http://example.com/theme/HEAL"]},
+    ]
+    translations = {
+        "http://example.com/theme/HEAL": "Gezondheid",
+        "http://example.com/theme/TECH": "Technologie",
+    }
+    expected = [replace_package(deepcopy(package), translations, lang="nl") for package in packages]
+
+    staged = PackageTranslation("nl")
+    for index, package in enumerate(packages):
+        staged.stage(package, key=index)
+
+    assert staged.values == ["http://example.com/theme/HEAL", "http://example.com/theme/TECH"]
+
+    staged.patch(translations, key=1)
+    assert packages[0]["theme"] == ["http://example.com/theme/HEAL"]
+    assert packages[1] == expected[1]
+
+    staged.patch(translations)
+    assert packages == expected
+
+
+def test_package_translation_shares_one_label_per_term():
+    packages = [
+        {"theme": ["http://example.com/theme/HEAL"], "language": ["http://example.com/lang/NL"]},
+        {"theme": ["http://example.com/theme/HEAL", 3]},
+    ]
+
+    staged = PackageTranslation("nl")
+    for index, package in enumerate(packages):
+        staged.stage(package, key=index)
+    translations = {"http://example.com/theme/HEAL": "Gezondheid"}
+    staged.patch(translations, key=0)
+    staged.patch(translations, key=1)
+
+    assert packages[0]["theme"][0] is packages[1]["theme"][0]
+    assert packages[0]["theme"][0] == {
+        "name": "http://example.com/theme/HEAL",
+        "display_name": "Gezondheid",
+        "count": None,
+    }
+    assert packages[1]["theme"][1] == {"name": 3, "display_name": 3, "count": None}
+
+
+def test_translated_properties_follow_the_schema_in_place():
+    package = _base_package()
+    package["extra_notes"] = {"en": "Not a language value", "nl": "Geen taalwaarde"}
+    resources = package["resources"]
+    agents = package["qualified_attribution"][0]["agent"]
+
+    result = _apply_translated_properties(package, "nl")
+
+    assert result is package
+    assert package["title"] == "Nederlandse titel"
+    assert package["provenance"] == "Nederlandse herkomst"
+    assert package["resources"] is resources
+    assert resources[0]["name"] == "Nederlandse resource"
+    assert resources[0]["rights"] == "Nederlandse rechten"
+    assert package["qualified_attribution"][0]["agent"] is agents
+    assert agents[0]["name"] == "Nederlandse agent"
+    assert package["extra_notes"] == {"en": "Not a language value", "nl": "Geen taalwaarde"}
+
+
+@pytest.mark.parametrize("in_place", [False, True])
+def test_replace_package_copies_nested_values_unless_in_place(in_place):
+    package = _base_package()
+    provenance_activity = package["provenance_activity"]
+    activity = provenance_activity[0]
+    associated = activity["wasAssociatedWith"]
+    translations = {"http://example.com/agent-type": "Agenttype"}
+
+    result = replace_package(package, translations, lang="nl", in_place=in_place)
+
+    assert result["provenance_activity"][0]["wasAssociatedWith"][0]["type"] == {
+        "name": "http://example.com/agent-type",
+        "display_name": "Agenttype",
+        "count": None,
+    }
+    assert (result["provenance_activity"] is provenance_activity) is in_place
+    assert (result["provenance_activity"][0] is activity) is in_place
+    if in_place:
+        assert associated[0]["type"]["display_name"] == "Agenttype"
+    else:
+        assert activity["type"] == "http://example.com/activity-type"
+        assert associated[0]["type"] == "http://example.com/agent-type"
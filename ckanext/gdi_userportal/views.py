@@ -0,0 +1,163 @@
+# SPDX-FileCopyrightText: 2026 Stichting Health-RI
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+HTTP-level additions to the CKAN action API.
+
+Actions listed in ``CONDITIONAL_ACTIONS`` get an ``ETag`` on successful GET
+responses. When the client sends a matching ``If-None-Match`` header the
+request is answered with ``304 Not Modified`` before the action runs.
+Responses of ``PRIVATE_ACTIONS`` depend on the caller and are marked private
+so shared caches do not store them.
+
+``/api/gdi-userportal/enhanced_package_search/stream`` answers like
+``enhanced_package_search`` but translates and writes the packages one at a
+time, so large pages (exports, sitemaps) are never held translated in memory
+as a whole.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from flask import Blueprint, Response, g, request, stream_with_context
+
+from ckan.plugins import toolkit
+
+from ckanext.gdi_userportal.logic.action.get import (
+    _request_context,
+    package_show_etag,
+    term_translations_etag,
+)
+from ckanext.gdi_userportal.logic.action.search_pipeline import (
+    TRANSLATION_STAGES,
+    SearchState,
+    run_search_pipeline,
+)
+from ckanext.gdi_userportal.logic.action.translation_utils import (
+    IN_PLACE_CONTEXT_KEY,
+    replace_search_facets,
+)
+
+log = logging.getLogger(__name__)
+
+CONDITIONAL_ACTIONS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "gdi_term_translations_show": term_translations_etag,
+    "enhanced_package_show": package_show_etag,
+}
+PRIVATE_ACTIONS = {"enhanced_package_show"}
+CACHE_CONTROL = "public, max-age=0, must-revalidate"
+PRIVATE_CACHE_CONTROL = "private, max-age=0, must-revalidate"
+
+api = Blueprint("gdi_userportal_api", __name__)
+
+
+def _requested_action() -> Optional[str]:
+    if request.endpoint != "api.action" or request.method != "GET":
+        return None
+    return (request.view_args or {}).get("logic_function")
+
+
+def _request_data_dict() -> Dict[str, Any]:
+    return {
+        key: values if len(values) > 1 else values[0]
+        for key, values in request.args.lists()
+    }
+
+
+def _set_validators(response: Response, etag: str, action: str) -> Response:
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = (
+        PRIVATE_CACHE_CONTROL if action in PRIVATE_ACTIONS else CACHE_CONTROL
+    )
+    response.vary.add("Accept-Language")
+    return response
+
+
+@api.before_app_request
+def _answer_not_modified() -> Optional[Response]:
+    action = _requested_action()
+    etag_function = CONDITIONAL_ACTIONS.get(action)
+    if etag_function is None:
+        return None
+
+    try:
+        etag = etag_function(_request_data_dict())
+    except Exception:
+        # Leave error reporting to the action itself.
+        log.debug("Could not compute ETag for %s", request.path, exc_info=True)
+        return None
+
+    g.gdi_userportal_etag = (etag, action)
+    if etag in request.if_none_match:
+        return _set_validators(Response(status=304), etag, action)
+    return None
+
+
+@api.after_app_request
+def _add_etag(response: Response) -> Response:
+    validator = g.pop("gdi_userportal_etag", None)
+    if validator is not None and response.status_code == 200:
+        _set_validators(response, *validator)
+    return response
+
+
+def _json_error(status: int, error_type: str, error: Dict[str, Any]) -> Response:
+    body = {"success": False, "error": {"__type": error_type, **error}}
+    return Response(json.dumps(body), status=status, mimetype="application/json")
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=str)
+
+
+def _stream_search_result(state: SearchState) -> Iterator[str]:
+    result = state.result
+    packages = result.pop("results")
+    search_facets = result.pop("search_facets", None)
+
+    yield '{"success": true, "result": {'
+    for key, value in result.items():
+        yield f"{_dumps(key)}: {_dumps(value)}, "
+    if search_facets is not None:
+        facets = replace_search_facets(search_facets, state.translations, lang=state.lang)
+        yield f'"search_facets": {_dumps(facets)}, '
+
+    yield '"results": ['
+    for index in range(len(packages)):
+        package, packages[index] = packages[index], None
+        if state.needs_translation(index):
+            # One resolved translation dict serves the whole page.
+            state.staged.patch(state.translations, key=index)
+        yield ("" if index == 0 else ", ") + _dumps(package)
+    yield "]}}"
+
+
+@api.route("/api/gdi-userportal/enhanced_package_search/stream", methods=["GET", "POST"])
+def enhanced_package_search_stream() -> Response:
+    if request.method == "POST":
+        data_dict = request.get_json(silent=True) or {}
+    else:
+        data_dict = _request_data_dict()
+
+    # The packages are serialised and dropped as they are streamed, so they
+    # can be translated without copying.
+    context = dict(_request_context(), **{IN_PLACE_CONTEXT_KEY: True})
+    try:
+        state = run_search_pipeline(context, data_dict, stages=TRANSLATION_STAGES)
+    except toolkit.ValidationError as e:
+        return _json_error(409, "Validation Error", e.error_dict)
+    except toolkit.NotAuthorized as e:
+        return _json_error(403, "Authorization Error", {"message": str(e)})
+    except toolkit.ObjectNotFound as e:
+        return _json_error(404, "Not Found Error", {"message": str(e)})
+
+    return Response(
+        stream_with_context(_stream_search_result(state)),
+        mimetype="application/json",
+    )
+
+
+def get_blueprints():
+    return [api]